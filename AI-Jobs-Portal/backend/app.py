@@ -1,9 +1,13 @@
+import click
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 from pymongo import MongoClient
 import os
+import time
 from config import Config
+from utils.startup import check_nltk_data, import_report, preload
+from utils.uploads import UploadRequest
 
 # Import routes
 from routes.auth import auth_bp
@@ -12,9 +16,34 @@ from routes.resume import resume_bp
 from routes.chatbot import chatbot_bp
 from routes.admin import admin_bp
 
+# Import CLI commands
+from commands.tfidf import rebuild_tfidf_command
+from commands.features import backfill_job_features_command, rebuild_skill_demand_command
+from commands.scoring import score_applications_command
+from commands.ann import ann_recall_command
+from commands.all_pairs import score_all_pairs_command
+from commands.rescoring import rescore_applications_command
+from commands.ingest import ingest_resumes_command
+from commands.workers import run_workers_command
+
+def start_background_workers(app):
+    """Start the scoring, recommendation and resume parsing threads"""
+    app.application_scorer.start()
+    app.recommendation_materializer.start()
+    app.resume_parse_queue.start()
+
 def create_app():
+    started = time.perf_counter()
     app = Flask(__name__)
     app.config.from_object(Config)
+    # Uploads are hashed as they arrive and parsed from memory
+    app.request_class = UploadRequest
+    
+    # NLTK data is never downloaded at runtime, so stop now if it is missing
+    # instead of failing on the first request
+    check_nltk_data()
+    if app.config['STARTUP_MODE'] == 'eager':
+        preload()
     
     # Initialize extensions
     CORS(app)
@@ -25,6 +54,46 @@ def create_app():
     db = client[app.config['DATABASE_NAME']]
     app.db = db
     
+    # Ensure matching indexes exist
+    from models.job import JobModel
+    from models.application import ApplicationModel
+    from models.recommendation import RecommendationModel
+    from models.user import UserModel
+    from models.skill_demand import SkillDemandModel
+    from models.parse_job import ParseJobModel
+    from models.ingest_job import IngestJobModel
+    JobModel(db).ensure_indexes()
+    ApplicationModel(db).ensure_indexes()
+    RecommendationModel(db).ensure_indexes()
+    UserModel(db).ensure_indexes()
+    SkillDemandModel(db).ensure_indexes()
+    ParseJobModel(db).ensure_indexes()
+    IngestJobModel(db).ensure_indexes()
+    
+    # Recommendation results cached per job seeker
+    from services.recommendation_cache import RecommendationCache
+    app.recommendation_cache = RecommendationCache(db)
+    app.recommendation_cache.ensure_indexes()
+    
+    # Background scoring of new applications
+    from services.scoring import ApplicationScorer
+    app.application_scorer = ApplicationScorer(db)
+    
+    # Background merging of posted jobs into recommendation lists
+    from services.recommendations import RecommendationMaterializer
+    app.recommendation_materializer = RecommendationMaterializer(db)
+    
+    # Background parsing of uploaded resumes
+    from services.resume_cache import ParsedResumeCache
+    from services.resume_jobs import ResumeParseQueue
+    app.resume_cache = ParsedResumeCache(db)
+    app.resume_cache.ensure_indexes()
+    app.resume_parse_queue = ResumeParseQueue(db, resume_cache=app.resume_cache)
+    
+    # Only the process that owns the workers starts them; flask CLI commands never do
+    if app.config['BACKGROUND_WORKERS_ENABLED'] and click.get_current_context(silent=True) is None:
+        start_background_workers(app)
+    
     # Create upload directory
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     
@@ -35,6 +104,17 @@ def create_app():
     app.register_blueprint(chatbot_bp, url_prefix='/api/chatbot')
     app.register_blueprint(admin_bp, url_prefix='/api/admin')
     
+    # Register CLI commands
+    app.cli.add_command(rebuild_tfidf_command)
+    app.cli.add_command(backfill_job_features_command)
+    app.cli.add_command(rebuild_skill_demand_command)
+    app.cli.add_command(score_applications_command)
+    app.cli.add_command(ann_recall_command)
+    app.cli.add_command(score_all_pairs_command)
+    app.cli.add_command(rescore_applications_command)
+    app.cli.add_command(ingest_resumes_command)
+    app.cli.add_command(run_workers_command)
+    
     @app.route('/api/health')
     def health_check():
         return jsonify({'status': 'healthy', 'message': 'AI Jobs Portal API is running'})
@@ -47,8 +127,16 @@ def create_app():
     def internal_error(error):
         return jsonify({'error': 'Internal server error'}), 500
     
+    if app.config['STARTUP_IMPORT_REPORT']:
+        import_report()
+        print(f"App created in {time.perf_counter() - started:.2f}s")
+    
     return app
 
 if __name__ == '__main__':
     app = create_app()
+    # The development server is a single process, so it owns the workers;
+    # under the reloader only the child process serves requests
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_workers(app)
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
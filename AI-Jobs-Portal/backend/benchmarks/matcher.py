@@ -0,0 +1,187 @@
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+from itertools import islice
+import click
+import numpy as np
+from benchmarks.synthetic import generate_job_seekers, generate_jobs
+from services.matcher import JobMatcher
+from services.tfidf_model import TfidfModel
+
+STAGES = ['preprocess_text', 'extract_skills_from_text', 'calculate_text_similarity',
+          'calculate_overall_match', 'rank_top_k']
+
+def _percentile_ms(latencies, q):
+    """Latency percentile in milliseconds"""
+    return round(float(np.percentile(latencies, q)) * 1000, 4)
+
+def _git_commit():
+    """Commit the benchmark ran against, if this is a git checkout"""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+def _profile_text(job_seeker):
+    """Free text describing a job seeker: skills and past positions"""
+    positions = ' '.join(exp['position'] for exp in job_seeker['experience'])
+    return f"{', '.join(job_seeker['skills'])} {positions}"
+
+def _timed_pass(operation, inputs, before_each=None):
+    """Latency of each operation over inputs, calling before_each untimed ahead of every call"""
+    latencies = []
+    for item in inputs:
+        if before_each:
+            before_each()
+        op_started = time.perf_counter()
+        operation(item)
+        latencies.append(time.perf_counter() - op_started)
+    return latencies
+
+def _summarize(latencies):
+    """Throughput and latency percentiles of one timed pass"""
+    elapsed = sum(latencies)
+    return {
+        'seconds': round(elapsed, 4),
+        'ops_per_sec': round(len(latencies) / elapsed, 2) if elapsed else None,
+        'p50_ms': _percentile_ms(latencies, 50),
+        'p99_ms': _percentile_ms(latencies, 99)
+    }
+
+def run_stage(operation, inputs, clear_cache, memory_ops=50):
+    """Time operation cold and warm over every input, then trace peak memory over the first few
+    
+    The cold pass empties the preprocess cache before every call, so it
+    measures the work itself; the warm pass runs after one untimed pass
+    has filled it. Tracing slows Python allocations down, so peak memory
+    comes from a separate traced pass, starting from an empty cache.
+    """
+    cold = _summarize(_timed_pass(operation, inputs, clear_cache))
+    
+    clear_cache()
+    for item in inputs:
+        operation(item)
+    warm = _summarize(_timed_pass(operation, inputs))
+    
+    clear_cache()
+    tracemalloc.start()
+    try:
+        for item in inputs[:memory_ops]:
+            operation(item)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    return dict(cold, ops=len(inputs), warm=warm, peak_memory_bytes=peak)
+
+def compare(results, baseline):
+    """Print each stage's cold and warm throughput and latency against a previous run"""
+    click.echo(f"\n{'stage':<34}{'ops/s':>12}{'baseline':>12}{'change':>9}{'p99 ms':>10}{'baseline':>10}")
+    for stage, result in results['stages'].items():
+        before = baseline.get('stages', {}).get(stage)
+        if not before:
+            continue
+        # Runs from before the cold/warm split only have the top-level numbers
+        for label, current, previous in ((stage, result, before),
+                                         (f'{stage} (warm)', result['warm'], before.get('warm'))):
+            if not previous or not previous.get('ops_per_sec') or not current['ops_per_sec']:
+                continue
+            change = current['ops_per_sec'] / previous['ops_per_sec'] - 1
+            click.echo(f"{label:<34}{current['ops_per_sec']:>12.1f}{previous['ops_per_sec']:>12.1f}{change:>+9.1%}"
+                       f"{current['p99_ms']:>10.3f}{previous['p99_ms']:>10.3f}")
+
+@click.command()
+@click.option('--size', default=1000, type=click.IntRange(min=1), help='Jobs and job seekers generated (10^2 to 10^6)')
+@click.option('--ops', default=2000, type=int, help='Calls timed per single-item stage')
+@click.option('--queries', default=50, type=int, help='Job seekers ranked against the whole corpus')
+@click.option('--k', default=20, type=int, help='Recommendations kept per ranking query')
+@click.option('--seed', default=0, type=int, help='Seed for the synthetic corpus')
+@click.option('--stages', default=','.join(STAGES), help='Comma separated stages to run')
+@click.option('--no-text-model', is_flag=True, help='Score text without a corpus TF-IDF model (per-pair fit)')
+@click.option('--output', default=None, help='JSON results path (default benchmarks/results/...)')
+@click.option('--baseline', default=None, type=click.Path(exists=True), help='Previous results JSON to compare with')
+def main(size, ops, queries, k, seed, stages, no_text_model, output, baseline):
+    """Benchmark each stage of the job matcher on a synthetic corpus"""
+    stages = [stage.strip() for stage in stages.split(',') if stage.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise click.BadParameter(f"unknown stages {', '.join(sorted(unknown))}", param_hint='--stages')
+    
+    started = time.perf_counter()
+    jobs = list(generate_jobs(size, seed))
+    job_seekers = list(generate_job_seekers(size, seed))
+    click.echo(f'Generated {size} jobs and {size} job seekers in {time.perf_counter() - started:.1f}s')
+    
+    matcher = JobMatcher()
+    if not no_text_model:
+        # Same model `flask rebuild-tfidf` fits, capped so setup stays bounded at 10^6
+        started = time.perf_counter()
+        documents = [matcher.preprocess_text(job['description']) for job in islice(jobs, 20000)]
+        matcher = JobMatcher(text_model=TfidfModel.fit(documents))
+        click.echo(f'Fitted TF-IDF model on {len(documents)} jobs in {time.perf_counter() - started:.1f}s')
+    
+    # Inputs cycle through the corpus so small sizes still get enough calls
+    sample_jobs = [jobs[i % size] for i in range(ops)]
+    sample_seekers = [job_seekers[(i * 7919) % size] for i in range(ops)]
+    candidates = [matcher.build_candidate_data(job_seeker) for job_seeker in sample_seekers]
+    pairs = list(zip(sample_jobs, candidates))
+    
+    results = {
+        'benchmark': 'matcher',
+        'created_at': datetime.utcnow().isoformat() + 'Z',
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'size': size, 'ops': ops, 'queries': queries, 'k': k, 'seed': seed,
+                   'text_model': not no_text_model},
+        'stages': {}
+    }
+    
+    def record(stage, operation, inputs):
+        click.echo(f'{stage} ...', nl=False)
+        result = results['stages'][stage] = run_stage(operation, inputs, matcher.preprocess_cache_clear)
+        for label, timing in (('cold', result), ('warm', result['warm'])):
+            click.echo(f" {label} {timing['ops_per_sec']} ops/s  p50 {timing['p50_ms']:.3f}ms  "
+                       f"p99 {timing['p99_ms']:.3f}ms ", nl=False)
+        click.echo(f" peak {result['peak_memory_bytes'] / 1024:.0f} KiB")
+    
+    if 'preprocess_text' in stages:
+        record('preprocess_text', matcher.preprocess_text, [job['description'] for job in sample_jobs])
+    if 'extract_skills_from_text' in stages:
+        record('extract_skills_from_text', matcher.extract_skills_from_text, [job['description'] for job in sample_jobs])
+    if 'calculate_text_similarity' in stages:
+        record('calculate_text_similarity', lambda pair: matcher.calculate_text_similarity(*pair),
+               [(job['description'], _profile_text(seeker)) for job, seeker in zip(sample_jobs, sample_seekers)])
+    if 'calculate_overall_match' in stages:
+        record('calculate_overall_match', lambda pair: matcher.calculate_overall_match(*pair), pairs)
+    
+    if 'rank_top_k' in stages:
+        # Ranking reads stored features, as it does after backfill-job-features
+        started = time.perf_counter()
+        ranked_jobs = [
+            {'_id': job['_id'], 'match_features': matcher.build_job_features(job['description'])}
+            for job in jobs
+        ]
+        click.echo(f'Built features for {len(ranked_jobs)} jobs in {time.perf_counter() - started:.1f}s')
+        queries = [matcher.build_candidate_data(job_seekers[(i * 7919) % size]) for i in range(queries)]
+        record('rank_top_k', lambda candidate: matcher.rank_top_k(ranked_jobs, candidate, k=k), queries)
+        results['stages']['rank_top_k']['corpus_size'] = len(ranked_jobs)
+    
+    output = output or os.path.join('benchmarks', 'results',
+                                    f"matcher-{size}-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    click.echo(f'Saved results to {output}')
+    
+    if baseline:
+        with open(baseline) as f:
+            compare(results, json.load(f))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+import random
+from services.skills import SKILL_CATEGORIES
+
+# Skill taxonomy display names, as they appear in postings and profiles
+SKILL_NAMES = {
+    'python': 'Python', 'java': 'Java', 'javascript': 'JavaScript', 'typescript': 'TypeScript',
+    'c++': 'C++', 'c#': 'C#', 'php': 'PHP', 'ruby': 'Ruby', 'go': 'Go', 'rust': 'Rust',
+    'swift': 'Swift', 'kotlin': 'Kotlin', 'scala': 'Scala', 'html': 'HTML', 'css': 'CSS',
+    'react': 'React', 'angular': 'Angular', 'vue': 'Vue', 'node.js': 'Node.js', 'express': 'Express',
+    'django': 'Django', 'flask': 'Flask', 'spring': 'Spring', 'laravel': 'Laravel', 'rails': 'Rails',
+    'bootstrap': 'Bootstrap', 'mysql': 'MySQL', 'postgresql': 'PostgreSQL', 'mongodb': 'MongoDB',
+    'redis': 'Redis', 'sqlite': 'SQLite', 'oracle': 'Oracle', 'sql server': 'SQL Server',
+    'cassandra': 'Cassandra', 'aws': 'AWS', 'azure': 'Azure', 'google cloud': 'Google Cloud',
+    'docker': 'Docker', 'kubernetes': 'Kubernetes', 'terraform': 'Terraform', 'jenkins': 'Jenkins',
+    'machine learning': 'Machine Learning', 'artificial intelligence': 'Artificial Intelligence',
+    'data science': 'Data Science', 'pandas': 'Pandas', 'numpy': 'NumPy', 'scikit-learn': 'scikit-learn',
+    'tensorflow': 'TensorFlow', 'pytorch': 'PyTorch', 'r': 'R', 'matplotlib': 'Matplotlib',
+    'seaborn': 'Seaborn', 'android': 'Android', 'ios': 'iOS', 'react native': 'React Native',
+    'flutter': 'Flutter', 'xamarin': 'Xamarin', 'ionic': 'Ionic', 'leadership': 'leadership',
+    'communication': 'communication', 'teamwork': 'teamwork', 'problem solving': 'problem solving',
+    'analytical': 'analytical', 'creative': 'creative', 'time management': 'time management',
+    'project management': 'project management'
+}
+
+# Roles and the skill category most of their skills come from
+ROLES = [
+    ('Backend Developer', 'programming_languages'), ('Frontend Engineer', 'web_technologies'),
+    ('Full Stack Developer', 'web_technologies'), ('Data Scientist', 'data_science'),
+    ('Machine Learning Engineer', 'data_science'), ('DevOps Engineer', 'cloud_platforms'),
+    ('Cloud Architect', 'cloud_platforms'), ('Database Administrator', 'databases'),
+    ('Data Engineer', 'databases'), ('Mobile Developer', 'mobile_development'),
+    ('iOS Developer', 'mobile_development'), ('Software Engineer', 'programming_languages'),
+    ('Engineering Manager', 'soft_skills'), ('Technical Project Manager', 'soft_skills')
+]
+SENIORITIES = ['Junior', 'Mid-level', 'Senior', 'Lead', 'Principal']
+COMPANIES = [
+    'Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries', 'Wayne Tech',
+    'Cyberdyne', 'Soylent Systems', 'Tyrell Analytics', 'Vandelay Imports', 'Wonka Digital'
+]
+CITIES = ['Bangalore', 'Pune', 'Hyderabad', 'Chennai', 'Mumbai', 'Delhi', 'London', 'Berlin', 'New York', 'Remote']
+FIRST_NAMES = [
+    'Aarav', 'Priya', 'Rohan', 'Ananya', 'Vikram', 'Sneha', 'Arjun', 'Kavya', 'James', 'Maria',
+    'Chen', 'Fatima', 'Lukas', 'Sofia', 'Omar', 'Emily', 'Kenji', 'Amara', 'Diego', 'Ingrid'
+]
+LAST_NAMES = [
+    'Sharma', 'Patel', 'Iyer', 'Reddy', 'Gupta', 'Nair', 'Khan', 'Smith', 'Garcia', 'Wang',
+    'Mueller', 'Rossi', 'Okafor', 'Tanaka', 'Silva', 'Johansson', 'Brown', 'Kowalski'
+]
+DEGREES = [
+    ('PhD in Computer Science', 0.04), ("Master's in Computer Science", 0.18), ('Master of Business Administration', 0.05),
+    ('Bachelor of Technology', 0.35), ("Bachelor's in Information Technology", 0.15),
+    ('Diploma in Software Engineering', 0.1), ('Higher Secondary Certificate', 0.08), ('High School', 0.05)
+]
+INSTITUTIONS = ['IIT Bombay', 'NIT Trichy', 'Anna University', 'University of Delhi', 'MIT', 'TU Munich', 'State University']
+
+SHORT_MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+RESPONSIBILITIES = [
+    'Design, build and maintain services written in {skill}.',
+    'Work closely with product and design to ship features using {skill} and {other}.',
+    'Own the reliability of our {skill} infrastructure and improve monitoring.',
+    'Review code, mentor junior engineers and champion best practices.',
+    'Collaborate with cross-functional teams to define requirements and estimates.',
+    'Write clean, well-tested code and contribute to technical documentation.',
+    'Migrate legacy systems to {skill} while keeping downtime to a minimum.',
+    'Optimize queries and data pipelines built on {skill}.',
+    'Participate in on-call rotation and incident reviews.',
+    'Prototype new ideas quickly with {skill} and {other}.',
+    'Build dashboards and reports that help the business make decisions.',
+    'Automate deployment and testing workflows.'
+]
+BENEFITS = [
+    'We offer competitive salary, health insurance and flexible working hours.',
+    'You will get a yearly learning budget and conference tickets.',
+    'Our team works in a hybrid model with two office days a week.',
+    'Stock options, paid parental leave and a generous vacation policy are included.'
+]
+EDUCATION_LINES = [
+    "Bachelor's degree in Computer Science or a related field.",
+    "Master's degree preferred.",
+    'A relevant certification is a plus.'
+]
+
+def _skill_popularity(rng):
+    """Zipf-like weights so a few skills appear in most documents"""
+    skills = list(SKILL_NAMES)
+    rng.shuffle(skills)
+    return skills, [1 / (rank + 1) ** 1.1 for rank in range(len(skills))]
+
+def _sample_skills(rng, popularity, category, count):
+    """Draw distinct skills, mostly from one category and the rest by global popularity"""
+    skills, weights = popularity
+    in_category = list(SKILL_CATEGORIES[category])
+    chosen = []
+    while len(chosen) < min(count, len(skills)):
+        if rng.random() < 0.7:
+            skill = rng.choice(in_category)
+        else:
+            skill = rng.choices(skills, weights)[0]
+        if skill not in chosen:
+            chosen.append(skill)
+    return [SKILL_NAMES[skill] for skill in chosen]
+
+def _duration(rng):
+    """Experience duration in one of the formats profiles actually use"""
+    months = rng.randint(3, 96)
+    style = rng.random()
+    if style < 0.4:
+        years, rest = divmod(months, 12)
+        if years and rest:
+            return f'{years} years {rest} months'
+        return f'{years} years' if years else f'{rest} months'
+    if style < 0.8:
+        end_year = rng.randint(2015, 2024)
+        start = end_year * 12 + rng.randint(0, 11) - months
+        start_year, start_month = divmod(start, 12)
+        end_month = rng.randint(1, 12)
+        return f'{SHORT_MONTHS[start_month]} {start_year} - {SHORT_MONTHS[end_month - 1]} {end_year}'
+    return f'{rng.randint(2016, 2024)} - Present'
+
+def generate_jobs(count, seed=0):
+    """Yield count job postings shaped like the jobs collection"""
+    rng = random.Random(seed)
+    popularity = _skill_popularity(random.Random(seed))
+    for i in range(count):
+        title, category = rng.choice(ROLES)
+        seniority = rng.choice(SENIORITIES)
+        company = rng.choice(COMPANIES)
+        skills = _sample_skills(rng, popularity, category, rng.randint(3, 10))
+        
+        sentences = [f'We are looking for a {seniority} {title} to join {company} in {rng.choice(CITIES)}.']
+        for _ in range(rng.randint(3, 12)):
+            sentences.append(rng.choice(RESPONSIBILITIES).format(skill=rng.choice(skills), other=rng.choice(skills)))
+        
+        requirements = f"Experience with {', '.join(skills[:-1])} and {skills[-1]}." if len(skills) > 1 else ''
+        if rng.random() < 0.8:
+            requirements = f'{rng.randint(1, 10)}+ years of experience required. {requirements}'
+        if rng.random() < 0.6:
+            requirements += ' ' + rng.choice(EDUCATION_LINES)
+        sentences.append(f'Requirements: {requirements}')
+        sentences.append(rng.choice(BENEFITS))
+        
+        yield {
+            '_id': i,
+            'title': f'{seniority} {title}',
+            'company': company,
+            'description': ' '.join(sentences),
+            'is_active': True
+        }
+
+def generate_job_seekers(count, seed=0):
+    """Yield count job seeker profiles shaped like the job_seekers collection"""
+    rng = random.Random(seed + 1)
+    popularity = _skill_popularity(random.Random(seed))
+    degrees, degree_weights = zip(*DEGREES)
+    for i in range(count):
+        title, category = rng.choice(ROLES)
+        experience = [
+            {
+                'company': rng.choice(COMPANIES),
+                'position': f'{rng.choice(SENIORITIES)} {title}',
+                'duration': _duration(rng)
+            }
+            for _ in range(rng.choices(range(6), [10, 30, 25, 18, 10, 7])[0])
+        ]
+        education = [
+            {'degree': degree, 'institution': rng.choice(INSTITUTIONS)}
+            for degree in rng.choices(degrees, degree_weights, k=rng.choices(range(3), [10, 70, 20])[0])
+        ]
+        
+        yield {
+            '_id': i,
+            'first_name': rng.choice(FIRST_NAMES),
+            'last_name': rng.choice(LAST_NAMES),
+            'skills': _sample_skills(rng, popularity, category, rng.randint(2, 15)),
+            'experience': experience,
+            'education': education
+        }
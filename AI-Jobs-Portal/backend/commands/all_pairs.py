@@ -0,0 +1,176 @@
+import resource
+import time
+from itertools import islice
+import click
+import numpy as np
+from flask import current_app
+from flask.cli import with_appcontext
+from config import Config
+from models.job import JobModel
+from models.recommendation import RecommendationModel
+from models.user import UserModel
+from services.matcher import get_matcher
+from services.recommendations import recommendation_item
+
+def _merge_top_k(scores, ids, new_scores, new_ids, k):
+    """Merge a block of scores into running per-row top-k scores and IDs"""
+    scores = np.concatenate([scores, new_scores], axis=1)
+    ids = np.concatenate([ids, np.broadcast_to(new_ids, new_scores.shape)], axis=1)
+    if scores.shape[1] > k:
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(scores, top, axis=1)
+        ids = np.take_along_axis(ids, top, axis=1)
+    return scores, ids
+
+def _ranked(scores, ids):
+    """Finite entries of one top-k row, best first"""
+    order = np.argsort(-scores, kind='stable')
+    return [(float(scores[i]), int(ids[i])) for i in order if np.isfinite(scores[i])]
+
+def _prepare_job_blocks(job_model, matcher, job_ids, block_size):
+    """Features and TF-IDF vectors of every job block, built once and reused by every seeker block"""
+    blocks = []
+    for start in range(0, len(job_ids), block_size):
+        block_ids = job_ids[start:start + block_size]
+        jobs = {job['_id']: job for job in
+                job_model.iter_active_jobs_by_ids(block_ids, {'description': 1, 'match_features': 1})}
+        positions = np.array([start + i for i, job_id in enumerate(block_ids) if job_id in jobs], dtype=np.int64)
+        features = [matcher.get_job_features(jobs[job_ids[position]]) for position in positions]
+        blocks.append({
+            'positions': positions,
+            'features': features,
+            'vectors': matcher.vectorize(features) if features else None
+        })
+    return blocks
+
+def _active_rows(job_model, job_ids, block):
+    """Rows of a prepared job block whose jobs are still active"""
+    block_ids = [job_ids[position] for position in block['positions']]
+    if not block_ids:
+        return []
+    active = {job['_id'] for job in job_model.iter_active_jobs_by_ids(block_ids, {'_id': 1})}
+    return [i for i, job_id in enumerate(block_ids) if job_id in active]
+
+@click.command('score-all-pairs')
+@click.option('--block-size', default=1000, type=int,
+              help="Job seekers and jobs per block; peak memory grows with its square, plus every job's features")
+@click.option('--k', default=None, type=int, help='Job seekers kept per job')
+@click.option('--min-score', default=None, type=float, help='Minimum overall match to count a pair')
+@with_appcontext
+def score_all_pairs_command(block_size, k, min_score):
+    """Score every job seeker against every active job and rebuild both top-K tables"""
+    job_model = JobModel(current_app.db)
+    user_model = UserModel(current_app.db)
+    recommendation_model = RecommendationModel(current_app.db)
+    matcher = get_matcher()
+    k = k or Config.RECOMMENDATIONS_K
+    seeker_k = Config.RECOMMENDATIONS_K + Config.RECOMMENDATION_BUFFER
+    min_score = Config.RECOMMENDATION_MIN_SCORE if min_score is None else min_score
+    
+    # Snapshot active job IDs so every pass walks the same job blocks
+    job_ids = [job['_id'] for job in job_model.iter_active_jobs({'_id': 1}).sort('_id', 1)]
+    job_top_scores = np.full((len(job_ids), k), -np.inf)
+    job_top_seekers = np.full((len(job_ids), k), -1, dtype=np.int64)
+    job_totals = np.zeros(len(job_ids), dtype=np.int64)
+    
+    started = time.time()
+    job_blocks = _prepare_job_blocks(job_model, matcher, job_ids, block_size)
+    click.echo(f'Prepared {len(job_ids)} jobs in {time.time() - started:.1f}s')
+    
+    seeker_ids = []
+    pairs = 0
+    lists_written = 0
+    # Each seeker block waits for a pass over every job block, far longer than Mongo's idle cursor timeout
+    job_seekers = user_model.iter_job_seekers()
+    try:
+        while True:
+            seekers = list(islice(job_seekers, block_size))
+            if not seekers:
+                break
+            
+            offset = len(seeker_ids)
+            seeker_ids.extend(job_seeker['_id'] for job_seeker in seekers)
+            candidate_data = [matcher.build_candidate_data(job_seeker) for job_seeker in seekers]
+            candidate_features = [matcher.get_candidate_features(candidate) for candidate in candidate_data]
+            candidate_vectors = matcher.vectorize(candidate_features)
+            seeker_positions = offset + np.arange(len(seekers))
+            
+            top_scores = np.full((len(seekers), seeker_k), -np.inf)
+            top_jobs = np.full((len(seekers), seeker_k), -1, dtype=np.int64)
+            totals = np.zeros(len(seekers), dtype=np.int64)
+            
+            for block in job_blocks:
+                # Jobs deactivated since the snapshot drop out
+                rows = _active_rows(job_model, job_ids, block)
+                if not rows:
+                    continue
+                if len(rows) == len(block['positions']):
+                    positions, job_features, job_vectors = block['positions'], block['features'], block['vectors']
+                else:
+                    positions = block['positions'][rows]
+                    job_features = [block['features'][i] for i in rows]
+                    job_vectors = block['vectors'][rows] if block['vectors'] is not None else None
+                
+                scores = matcher.score_feature_matrix(job_features, candidate_features, job_vectors, candidate_vectors)
+                
+                # Same pairs as read-time recommendations: a shared skill and the minimum match
+                qualified = (scores['skill_match'] > 0) & (scores['overall_match'] >= min_score)
+                overall = np.where(qualified, scores['overall_match'], -np.inf)
+                pairs += overall.size
+                
+                top_scores, top_jobs = _merge_top_k(top_scores, top_jobs, overall.T, positions, seeker_k)
+                totals += qualified.sum(axis=0)
+                
+                job_top_scores[positions], job_top_seekers[positions] = _merge_top_k(
+                    job_top_scores[positions], job_top_seekers[positions], overall, seeker_positions, k
+                )
+                job_totals[positions] += qualified.sum(axis=1)
+            
+            lists_written += _write_seeker_lists(job_model, recommendation_model, matcher, seekers, candidate_data,
+                                                 top_scores, top_jobs, totals, job_ids)
+            
+            elapsed = time.time() - started
+            click.echo(f'{len(seeker_ids)} job seekers x {len(job_ids)} jobs: {pairs} pairs in {elapsed:.1f}s '
+                       f'({pairs / max(elapsed, 1e-9):.0f} pairs/s)')
+    finally:
+        job_seekers.close()
+    
+    # Top job seekers per job, written in blocks
+    jobs_written = 0
+    for start in range(0, len(job_ids), block_size):
+        rows = []
+        for position in range(start, min(start + block_size, len(job_ids))):
+            candidates = [
+                {'job_seeker_id': seeker_ids[seeker], 'score': score}
+                for score, seeker in _ranked(job_top_scores[position], job_top_seekers[position])
+            ]
+            rows.append((job_ids[position], candidates, int(job_totals[position])))
+        jobs_written += recommendation_model.bulk_replace_top_candidates(rows)
+    
+    elapsed = time.time() - started
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    click.echo(f'Scored {pairs} pairs in {elapsed:.1f}s ({pairs / max(elapsed, 1e-9):.0f} pairs/s, '
+               f'peak RSS {peak_mb:.0f} MB). Wrote {lists_written} job seeker lists and {jobs_written} job lists')
+
+def _write_seeker_lists(job_model, recommendation_model, matcher, seekers, candidate_data,
+                        top_scores, top_jobs, totals, job_ids):
+    """Store recommendation lists for a block of job seekers"""
+    # Only lists the incremental merge can keep current, as at read time
+    writable = [
+        i for i, candidate in enumerate(candidate_data)
+        if 'features' in candidate and candidate['features']['skills']
+    ]
+    ranked = {i: _ranked(top_scores[i], top_jobs[i]) for i in writable}
+    wanted = {job_ids[position] for i in writable for _, position in ranked[i]}
+    jobs = {job['_id']: job for job in job_model.jobs.find({'_id': {'$in': list(wanted)}})} if wanted else {}
+    
+    lists = []
+    for i in writable:
+        top = [jobs[job_ids[position]] for _, position in ranked[i] if job_ids[position] in jobs]
+        # Re-score the few kept jobs for matched skills and the full result
+        items = [
+            recommendation_item(job, match_result)
+            for job, match_result in zip(top, matcher.calculate_overall_match_batch(top, candidate_data[i]))
+        ]
+        lists.append((seekers[i]['_id'], seekers[i].get('updated_at'), items, int(totals[i])))
+    return recommendation_model.bulk_replace_for_job_seekers(lists)
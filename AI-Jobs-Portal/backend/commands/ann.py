@@ -0,0 +1,71 @@
+import time
+import click
+import numpy as np
+from flask import current_app
+from flask.cli import with_appcontext
+from config import Config
+from models.job import JobModel
+from models.user import UserModel
+from services.ann_index import JobAnnIndex
+from services.matcher import get_matcher
+from services.tfidf_model import get_text_model
+
+@click.command('ann-recall')
+@click.option('--seekers', default=200, type=int, help='Job seekers sampled as queries')
+@click.option('--k', default=20, type=int, help='Recommendations compared per seeker')
+@click.option('--min-score', default=30, type=float, help='Minimum overall match, as in recommendations')
+@click.option('--probes', default='0,2,4,8', help='Comma separated ANN_PROBES values to try')
+@click.option('--candidates', default=None, type=int, help='Candidates taken from the index per query')
+@click.option('--bits', default=None, type=int, help='Hyperplanes per table (ANN_BITS)')
+@click.option('--tables', default=None, type=int, help='Hash tables (ANN_TABLES)')
+@with_appcontext
+def ann_recall_command(seekers, k, min_score, probes, candidates, bits, tables):
+    """Measure ANN recall and latency against exact scoring"""
+    text_model = get_text_model()
+    if text_model is None:
+        click.echo('No TF-IDF model found, run `flask rebuild-tfidf` first')
+        return
+    
+    job_model = JobModel(current_app.db)
+    user_model = UserModel(current_app.db)
+    matcher = get_matcher()
+    candidates = candidates or Config.ANN_CANDIDATES
+    
+    started = time.time()
+    index = JobAnnIndex.build(job_model, text_model, n_bits=bits, n_tables=tables)
+    click.echo(f'Built index over {len(index)} jobs in {time.time() - started:.2f}s '
+               f'({index.n_tables} tables x {index.n_bits} bits)')
+    
+    jobs = {str(job['_id']): job for job in job_model.iter_active_jobs({'description': 1, 'match_features': 1})}
+    sample = list(user_model.job_seekers.aggregate([{'$sample': {'size': seekers}}]))
+    queries = [matcher.build_candidate_data(job_seeker) for job_seeker in sample]
+    
+    # Exact top-K over the whole catalog is the ground truth
+    exact = []
+    exact_times = []
+    for candidate_data in queries:
+        started = time.time()
+        ranking = matcher.rank_top_k(jobs.values(), candidate_data, k=k, min_score=min_score)
+        exact_times.append(time.time() - started)
+        exact.append([match_result['overall_match'] for _, match_result in ranking['results']])
+    click.echo(f'exact      p50 {np.percentile(exact_times, 50) * 1000:8.1f}ms  '
+               f'p99 {np.percentile(exact_times, 99) * 1000:8.1f}ms')
+    
+    for n_probes in [int(value) for value in probes.split(',')]:
+        recalls = []
+        ann_times = []
+        for candidate_data, truth in zip(queries, exact):
+            started = time.time()
+            job_ids = index.query(matcher.build_candidate_query(candidate_data), candidates, n_probes)
+            ranking = matcher.rank_top_k((jobs[job_id] for job_id in job_ids if job_id in jobs),
+                                         candidate_data, k=k, min_score=min_score)
+            ann_times.append(time.time() - started)
+            
+            # Jobs tied with the exact K-th score are equally good answers
+            if truth:
+                found = [match_result['overall_match'] for _, match_result in ranking['results']]
+                recalls.append(sum(1 for score in found if score >= truth[-1]) / len(truth))
+        
+        recall = np.mean(recalls) if recalls else 1.0
+        click.echo(f'probes={n_probes:<3} p50 {np.percentile(ann_times, 50) * 1000:8.1f}ms  '
+                   f'p99 {np.percentile(ann_times, 99) * 1000:8.1f}ms  recall@{k} {recall:.3f}')
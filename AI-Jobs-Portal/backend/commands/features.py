@@ -0,0 +1,43 @@
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from pymongo import UpdateOne
+from models.job import JobModel
+from models.skill_demand import SkillDemandModel
+from services.matcher import JOB_FEATURES_VERSION, get_matcher
+
+@click.command('backfill-job-features')
+@click.option('--batch-size', default=500, type=int, help='Jobs per bulk write')
+@with_appcontext
+def backfill_job_features_command(batch_size):
+    """Recompute match features for jobs stored by an older version"""
+    job_model = JobModel(current_app.db)
+    matcher = get_matcher()
+    
+    operations = []
+    updated = 0
+    for job in job_model.iter_jobs_with_stale_features(JOB_FEATURES_VERSION):
+        features = matcher.build_job_features(job.get('description', ''))
+        operations.append(UpdateOne({'_id': job['_id']}, {'$set': {'match_features': features}}))
+        
+        if len(operations) >= batch_size:
+            updated += job_model.jobs.bulk_write(operations, ordered=False).modified_count
+            operations = []
+    
+    if operations:
+        updated += job_model.jobs.bulk_write(operations, ordered=False).modified_count
+    
+    click.echo(f'Updated match features on {updated} jobs (version {JOB_FEATURES_VERSION})')
+    
+    # New features can mean new skill IDs, so recount demand from them
+    if updated:
+        skills = SkillDemandModel(current_app.db).rebuild(job_model.jobs)
+        click.echo(f'Rebuilt skill demand for {skills} skills')
+
+@click.command('rebuild-skill-demand')
+@with_appcontext
+def rebuild_skill_demand_command():
+    """Recount skill demand from every active job's stored match features"""
+    job_model = JobModel(current_app.db)
+    skills = SkillDemandModel(current_app.db).rebuild(job_model.jobs)
+    click.echo(f'Rebuilt skill demand for {skills} skills')
@@ -0,0 +1,104 @@
+import csv
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from config import Config
+from models.ingest_job import MAX_REPORTED_FAILURES, IngestJobModel
+from services.bulk_ingest import ResumeIngester, iter_resume_files
+
+# Seconds between progress writes on a queued job, which also renew its claim
+PROGRESS_INTERVAL = 10
+
+def _ingest(ingester, files, progress_every, on_outcome):
+    """Ingest files, echoing progress every progress_every files, and return the summary"""
+    for outcome in ingester.ingest(files):
+        on_outcome(outcome)
+        if ingester.stats['files'] % progress_every == 0:
+            click.echo(f"{ingester.stats['files']} files ({ingester.files_per_second:.1f}/s), "
+                       f"{ingester.stats['failed']} failed")
+    
+    summary = ingester.summary()
+    click.echo(f"Ingested {summary['files']} files in {summary['seconds']}s ({summary['files_per_second']}/s): "
+               f"{summary['created']} created, {summary['updated']} updated, {summary['failed']} failed "
+               f"({summary['cached']} parses served from cache)")
+    return summary
+
+def _ingest_source(source, workers, batch_size, report, progress_every):
+    """Ingest a local directory or archive, writing failed files to a CSV report"""
+    ingester = ResumeIngester(current_app.db, workers=workers, batch_size=batch_size)
+    with open(report, 'w', newline='') as report_file:
+        writer = csv.writer(report_file)
+        writer.writerow(['file', 'email', 'error'])
+        
+        def on_outcome(outcome):
+            if outcome['status'] == 'failed':
+                writer.writerow([outcome['file'], outcome['email'] or '', outcome['error']])
+        summary = _ingest(ingester, iter_resume_files(source), progress_every, on_outcome)
+    
+    if summary['failed']:
+        click.echo(f'Failures written to {report}')
+
+def _ingest_job(ingest_job_model, job, workers, batch_size, progress_every):
+    """Ingest one claimed archive and record its outcome on the job"""
+    ingester = ResumeIngester(current_app.db, workers=workers, batch_size=batch_size)
+    failures = []
+    last_progress = time.time()
+    
+    def on_outcome(outcome):
+        nonlocal last_progress
+        if outcome['status'] == 'failed' and len(failures) < MAX_REPORTED_FAILURES:
+            failures.append({'file': outcome['file'], 'email': outcome['email'], 'error': outcome['error']})
+        if time.time() - last_progress >= PROGRESS_INTERVAL:
+            ingest_job_model.update_progress(job, ingester.summary())
+            last_progress = time.time()
+    
+    try:
+        # Zip archives are read by seeking around, so work from a local copy
+        with tempfile.TemporaryFile() as archive:
+            shutil.copyfileobj(ingest_job_model.open_archive(job), archive)
+            archive.seek(0)
+            summary = _ingest(ingester, iter_resume_files(archive), progress_every, on_outcome)
+    except Exception as e:
+        click.echo(f'Failed to ingest {job["filename"]}: {e}')
+        ingest_job_model.finish_job(job, 'failed', summary=ingester.summary(), failures=failures, error=str(e))
+        return
+    
+    ingest_job_model.finish_job(job, 'completed', summary=summary, failures=failures)
+
+def _ingest_queued(workers, batch_size, progress_every, once):
+    """Ingest archives uploaded through the admin API as they are queued"""
+    ingest_job_model = IngestJobModel(current_app.db)
+    claim_timeout = timedelta(seconds=Config.SCORING_CLAIM_TIMEOUT)
+    while True:
+        job = ingest_job_model.claim_job(claim_timeout)
+        if job is None:
+            if once:
+                break
+            time.sleep(Config.SCORING_POLL_INTERVAL)
+            continue
+        
+        click.echo(f"Ingesting {job['filename']} (job {job['_id']})")
+        _ingest_job(ingest_job_model, job, workers, batch_size, progress_every)
+
+@click.command('ingest-resumes')
+@click.argument('source', required=False, type=click.Path(exists=True))
+@click.option('--queued', is_flag=True, help='Ingest archives uploaded to /api/admin/ingest-resumes instead of SOURCE')
+@click.option('--once', is_flag=True, help='With --queued, ingest the waiting archives and exit')
+@click.option('--workers', default=None, type=int, help='Parsing processes (default BULK_INGEST_WORKERS)')
+@click.option('--batch-size', default=None, type=int, help='Job seekers per bulk write (default BULK_INGEST_BATCH_SIZE)')
+@click.option('--report', default='ingest-errors.csv', type=click.Path(dir_okay=False), help='CSV of the files that failed')
+@click.option('--progress-every', default=500, type=int, help='Print progress every N files')
+@with_appcontext
+def ingest_resumes_command(source, queued, once, workers, batch_size, report, progress_every):
+    """Create or update job seekers from a directory, zip or tar archive of resumes"""
+    if bool(source) == queued:
+        raise click.UsageError('Give either SOURCE or --queued')
+    
+    if queued:
+        _ingest_queued(workers, batch_size, progress_every, once)
+    else:
+        _ingest_source(source, workers, batch_size, report, progress_every)
@@ -0,0 +1,167 @@
+import os
+import time
+from datetime import datetime
+from itertools import groupby
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from pymongo import UpdateOne
+from models.application import ApplicationModel
+from models.job import JobModel
+from models.user import UserModel
+from services.executor import MatcherExecutor
+from services.matcher import get_matcher
+
+# Progress of the current rescoring run, kept in the meta collection
+CHECKPOINT_ID = 'rescore_applications'
+
+def _windows(applications, batch_size):
+    """Group a (job_id, _id) ordered stream by job and yield whole jobs, about batch_size applications at a time"""
+    window = []
+    size = 0
+    for job_id, group in groupby(applications, key=lambda app: app['job_id']):
+        group = list(group)
+        window.append((job_id, group))
+        size += len(group)
+        if size >= batch_size:
+            yield window
+            window = []
+            size = 0
+    if window:
+        yield window
+
+def _tasks(groups, n_tasks):
+    """Pack (job_data, candidates) groups into about n_tasks similar sized tasks, splitting big jobs"""
+    target = max(1, -(-sum(len(candidates) for _, candidates in groups) // n_tasks))
+    tasks = []
+    task = []
+    task_size = 0
+    for job_data, candidates in groups:
+        for start in range(0, len(candidates), target):
+            part = candidates[start:start + target]
+            task.append((job_data, part))
+            task_size += len(part)
+            if task_size >= target:
+                tasks.append(task)
+                task = []
+                task_size = 0
+    if task:
+        tasks.append(task)
+    return tasks
+
+def _submit_window(window, job_model, user_model, executor):
+    """Load a window's jobs and applicants once and hand them to the scoring workers"""
+    matcher = get_matcher()
+    job_ids = [job_id for job_id, _ in window]
+    jobs = {job['_id']: job for job in job_model.jobs.find({'_id': {'$in': job_ids}},
+                                                           {'description': 1, 'match_features': 1})}
+    job_seekers = user_model.get_job_seeker_profiles(
+        {str(app['job_seeker_id']) for _, applications in window for app in applications}
+    )
+    
+    scorable = []
+    groups = []
+    for job_id, applications in window:
+        job = jobs.get(job_id)
+        applications = [app for app in applications if str(app['job_seeker_id']) in job_seekers] if job else []
+        if not applications:
+            continue
+        
+        # Features are resolved once per job, so workers only receive what they score
+        job_data = {'_id': job_id, 'match_features': matcher.get_job_features(job)}
+        candidates = [matcher.build_candidate_data(job_seekers[str(app['job_seeker_id'])]) for app in applications]
+        scorable.extend(applications)
+        groups.append((job_data, candidates))
+    
+    return {
+        'last_job_id': job_ids[-1],
+        'jobs': len(window),
+        'applications': sum(len(applications) for _, applications in window),
+        'scorable': scorable,
+        'futures': [executor.submit_applicant_groups(task) for task in _tasks(groups, max(1, executor.workers))]
+    }
+
+def _write_window(submitted, application_model, meta):
+    """Write a window's new scores in one unordered bulk write, then advance the checkpoint"""
+    scores = [score for future in submitted['futures'] for group in future.result() for score in group]
+    now = datetime.utcnow()
+    operations = [
+        UpdateOne({'_id': app['_id']}, {'$set': {'skill_match_percentage': score, 'scored_at': now}})
+        for app, score in zip(submitted['scorable'], scores)
+    ]
+    if operations:
+        application_model.applications.bulk_write(operations, ordered=False)
+    
+    # Every job up to last_job_id is written, so a resumed run starts after it
+    skipped = submitted['applications'] - len(operations)
+    meta.update_one(
+        {'_id': CHECKPOINT_ID},
+        {
+            '$set': {'last_job_id': submitted['last_job_id'], 'updated_at': now},
+            '$inc': {'rescored': len(operations), 'skipped': skipped}
+        }
+    )
+    return len(operations), skipped
+
+@click.command('rescore-applications')
+@click.option('--batch-size', default=5000, type=int, help='Applications read, scored and written per window')
+@click.option('--workers', default=None, type=int, help='Scoring processes (default one per CPU)')
+@click.option('--restart', is_flag=True, help='Start over instead of resuming an interrupted run')
+@with_appcontext
+def rescore_applications_command(batch_size, workers, restart):
+    """Recompute skill_match_percentage of every scored application"""
+    application_model = ApplicationModel(current_app.db)
+    job_model = JobModel(current_app.db)
+    user_model = UserModel(current_app.db)
+    meta = current_app.db.meta
+    
+    checkpoint = meta.find_one({'_id': CHECKPOINT_ID})
+    if checkpoint and not checkpoint.get('finished_at') and not restart:
+        click.echo(f"Resuming run started {checkpoint['started_at']:%Y-%m-%d %H:%M:%S} after job "
+                   f"{checkpoint['last_job_id']} ({checkpoint['rescored']} applications already rescored)")
+    else:
+        checkpoint = {
+            '_id': CHECKPOINT_ID,
+            'started_at': datetime.utcnow(),
+            'finished_at': None,
+            'last_job_id': None,
+            'rescored': 0,
+            'skipped': 0
+        }
+        meta.replace_one({'_id': CHECKPOINT_ID}, checkpoint, upsert=True)
+    
+    # A dedicated batch process, so use the whole machine rather than the web pool size
+    executor = MatcherExecutor(workers=workers or os.cpu_count() or 1)
+    applications = application_model.iter_for_rescoring(checkpoint['last_job_id'])
+    rescored = 0
+    skipped = 0
+    jobs = 0
+    started = time.time()
+    try:
+        # Read and prepare the next window while the workers score the current one
+        pending = None
+        for window in _windows(applications, batch_size):
+            submitted = _submit_window(window, job_model, user_model, executor)
+            if pending is not None:
+                written, missing = _write_window(pending, application_model, meta)
+                rescored += written
+                skipped += missing
+                jobs += pending['jobs']
+                elapsed = time.time() - started
+                click.echo(f'{rescored} applications over {jobs} jobs in {elapsed:.1f}s '
+                           f'({rescored / max(elapsed, 1e-9):.0f}/s)')
+            pending = submitted
+        
+        if pending is not None:
+            written, missing = _write_window(pending, application_model, meta)
+            rescored += written
+            skipped += missing
+            jobs += pending['jobs']
+    finally:
+        applications.close()
+        executor.shutdown()
+    
+    meta.update_one({'_id': CHECKPOINT_ID}, {'$set': {'finished_at': datetime.utcnow()}})
+    elapsed = time.time() - started
+    click.echo(f'Rescored {rescored} applications over {jobs} jobs in {elapsed:.1f}s '
+               f'({rescored / max(elapsed, 1e-9):.0f}/s); skipped {skipped} whose job or job seeker is gone')
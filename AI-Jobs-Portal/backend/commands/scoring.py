@@ -0,0 +1,24 @@
+import time
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from services.scoring import ApplicationScorer
+
+@click.command('score-applications')
+@click.option('--once', is_flag=True, help='Drain pending applications and exit')
+@click.option('--batch-size', default=None, type=int, help='Applications claimed per batch')
+@with_appcontext
+def score_applications_command(once, batch_size):
+    """Run an application scoring worker outside the web process"""
+    scorer = ApplicationScorer(current_app.db, mode='inline', batch_size=batch_size)
+    
+    while True:
+        started = time.time()
+        scored = scorer.drain()
+        if scored:
+            elapsed = time.time() - started
+            click.echo(f'Scored {scored} applications in {elapsed:.2f}s ({scored / max(elapsed, 1e-9):.0f}/s)')
+        
+        if once:
+            break
+        time.sleep(scorer.poll_interval)
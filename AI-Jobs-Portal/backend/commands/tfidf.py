@@ -0,0 +1,41 @@
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from config import Config
+from models.job import JobModel
+from services.matcher import JobMatcher
+from services.tfidf_model import TfidfModel, get_text_model
+
+@click.command('rebuild-tfidf')
+@click.option('--min-drift', default=0.0, type=float,
+              help='Only rebuild when this share of corpus words is missing from the current model')
+@with_appcontext
+def rebuild_tfidf_command(min_drift):
+    """Fit the TF-IDF model over all active job descriptions"""
+    job_model = JobModel(current_app.db)
+    matcher = JobMatcher()
+    
+    # Preprocess the whole active corpus once
+    documents = []
+    for job in job_model.iter_active_jobs({'description': 1}):
+        text = matcher.preprocess_text(job.get('description', ''))
+        if text:
+            documents.append(text)
+    
+    if not documents:
+        click.echo('No active job descriptions found, model not rebuilt')
+        return
+    
+    current = get_text_model()
+    if current is not None and min_drift > 0:
+        drift = current.drift(documents)
+        if drift < min_drift:
+            click.echo(f'Corpus drift {drift:.2%} below {min_drift:.2%}, keeping model {current.version}')
+            return
+        click.echo(f'Corpus drift {drift:.2%}, rebuilding model {current.version}')
+    
+    model = TfidfModel.fit(documents)
+    model.save(Config.TFIDF_MODEL_PATH)
+    
+    click.echo(f'Saved TF-IDF model {model.version} fitted on {model.n_documents} jobs '
+               f'({len(model.vectorizer.vocabulary_)} terms) to {Config.TFIDF_MODEL_PATH}')
@@ -0,0 +1,32 @@
+import time
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+@click.command('run-workers')
+@with_appcontext
+def run_workers_command():
+    """Run the background scoring, recommendation and resume parsing workers
+    
+    Run exactly one of these beside the web processes, which leave
+    BACKGROUND_WORKERS_ENABLED off.
+    """
+    workers = [
+        current_app.application_scorer,
+        current_app.recommendation_materializer,
+        current_app.resume_parse_queue
+    ]
+    for worker in workers:
+        if worker.mode != 'async':
+            raise click.ClickException('run-workers needs SCORING_MODE, RECOMMENDATION_MODE and RESUME_PARSE_MODE set to async')
+        worker.start()
+    click.echo('Background workers running, press Ctrl+C to stop')
+    
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for worker in workers:
+            worker.stop()
@@ -25,4 +25,68 @@ class Config:
     # File Upload Configuration
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     UPLOAD_FOLDER = 'uploads'
-    ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt'}
\ No newline at end of file
+    ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt'}
+    # Uploads up to this size are parsed from memory, larger ones spill to a temp file
+    UPLOAD_SPOOL_THRESHOLD = int(os.environ.get('UPLOAD_SPOOL_THRESHOLD') or 1024 * 1024)
+    
+    # Resume text extraction stops at these caps, resume sections sit near the front
+    RESUME_MAX_PAGES = int(os.environ.get('RESUME_MAX_PAGES') or 10)
+    RESUME_MAX_CHARS = int(os.environ.get('RESUME_MAX_CHARS') or 50000)
+    RESUME_PARSE_MODE = os.environ.get('RESUME_PARSE_MODE') or 'async'  # async, inline (local testing)
+    RESUME_PARSE_WORKERS = int(os.environ.get('RESUME_PARSE_WORKERS') or 2)
+    RESUME_PARSE_JOB_TTL = int(os.environ.get('RESUME_PARSE_JOB_TTL') or 86400)  # finished jobs kept for polling
+    RESUME_CACHE_TTL = int(os.environ.get('RESUME_CACHE_TTL') or 30 * 86400)  # parsed resumes kept since last use, 0 disables
+    
+    # Bulk resume ingestion from directories and zip/tar archives
+    BULK_INGEST_WORKERS = int(os.environ.get('BULK_INGEST_WORKERS') or os.cpu_count() or 1)
+    BULK_INGEST_BATCH_SIZE = int(os.environ.get('BULK_INGEST_BATCH_SIZE') or 500)  # job seekers per bulk write
+    BULK_INGEST_MAX_UPLOAD = int(os.environ.get('BULK_INGEST_MAX_UPLOAD') or 1024 * 1024 * 1024)  # archive upload limit
+    
+    # Startup: 'lazy' defers heavy imports to first use, 'eager' loads
+    # everything in create_app (e.g. before forking workers)
+    STARTUP_MODE = os.environ.get('STARTUP_MODE') or 'lazy'
+    STARTUP_IMPORT_REPORT = os.environ.get('STARTUP_IMPORT_REPORT', 'false').lower() in ['true', 'on', '1']
+    NLTK_DATA_PATH = os.environ.get('NLTK_DATA_PATH') or 'data/nltk_data'
+    
+    # Matcher Configuration
+    TFIDF_MODEL_PATH = os.environ.get('TFIDF_MODEL_PATH') or 'data/tfidf_model.pkl'
+    TFIDF_MAX_FEATURES = int(os.environ.get('TFIDF_MAX_FEATURES') or 20000)
+    TFIDF_CHECK_INTERVAL = float(os.environ.get('TFIDF_CHECK_INTERVAL') or 5)  # seconds between checks for a rebuilt model
+    # Matcher processes per web process, so keep it small under gunicorn; 0 or 1 scores inline
+    MATCHER_POOL_SIZE = int(os.environ.get('MATCHER_POOL_SIZE') or 0)
+    MATCHER_CHUNK_SIZE = int(os.environ.get('MATCHER_CHUNK_SIZE') or 2000)
+    # Worker processes start from a clean process, never forked from threaded app code
+    WORKER_START_METHOD = os.environ.get('WORKER_START_METHOD') or 'forkserver'  # forkserver, spawn
+    PREPROCESS_CACHE_SIZE = int(os.environ.get('PREPROCESS_CACHE_SIZE') or 10000)  # 0 disables
+    
+    # Recommendation cache: 'memory' (per process), 'mongo' (shared) or 'none'
+    REC_CACHE_BACKEND = os.environ.get('REC_CACHE_BACKEND') or 'memory'
+    REC_CACHE_TTL = int(os.environ.get('REC_CACHE_TTL') or 600)
+    REC_CACHE_MAX_ENTRIES = int(os.environ.get('REC_CACHE_MAX_ENTRIES') or 10000)
+    REC_CACHE_WAIT_TIMEOUT = int(os.environ.get('REC_CACHE_WAIT_TIMEOUT') or 30)
+    
+    # Materialized recommendations, merged as jobs are posted
+    RECOMMENDATIONS_K = int(os.environ.get('RECOMMENDATIONS_K') or 20)
+    RECOMMENDATION_BUFFER = int(os.environ.get('RECOMMENDATION_BUFFER') or 20)  # extra items to absorb removals
+    RECOMMENDATION_MIN_SCORE = float(os.environ.get('RECOMMENDATION_MIN_SCORE') or 30)
+    RECOMMENDATION_MODE = os.environ.get('RECOMMENDATION_MODE') or 'async'  # async, inline (local testing)
+    RECOMMENDATION_BATCH_SIZE = int(os.environ.get('RECOMMENDATION_BATCH_SIZE') or 500)
+    
+    # Approximate nearest-neighbour candidate generation for recommendations
+    ANN_ENABLED = os.environ.get('ANN_ENABLED', 'false').lower() in ['true', 'on', '1']
+    ANN_BITS = int(os.environ.get('ANN_BITS') or 16)
+    ANN_TABLES = int(os.environ.get('ANN_TABLES') or 8)
+    ANN_PROBES = int(os.environ.get('ANN_PROBES') or 4)  # recall vs latency knob
+    ANN_CANDIDATES = int(os.environ.get('ANN_CANDIDATES') or 300)
+    ANN_REFRESH_SECONDS = int(os.environ.get('ANN_REFRESH_SECONDS') or 600)
+    
+    # Background scoring, recommendation and resume parsing threads. Exactly one
+    # process should own them, e.g. `flask run-workers`, never every gunicorn worker
+    BACKGROUND_WORKERS_ENABLED = os.environ.get('BACKGROUND_WORKERS_ENABLED', 'false').lower() in ['true', 'on', '1']
+    
+    # Application Scoring Configuration
+    SCORING_MODE = os.environ.get('SCORING_MODE') or 'async'  # async, inline (local testing)
+    SCORING_WORKERS = int(os.environ.get('SCORING_WORKERS') or 2)
+    SCORING_BATCH_SIZE = int(os.environ.get('SCORING_BATCH_SIZE') or 200)
+    SCORING_POLL_INTERVAL = float(os.environ.get('SCORING_POLL_INTERVAL') or 5)
+    SCORING_CLAIM_TIMEOUT = int(os.environ.get('SCORING_CLAIM_TIMEOUT') or 300)
\ No newline at end of file
@@ -1,17 +1,26 @@
 from datetime import datetime
 from bson import ObjectId
+from pymongo import UpdateOne
 
 class ApplicationModel:
     def __init__(self, db):
         self.db = db
         self.applications = db.applications
     
+    def ensure_indexes(self):
+        """Create indexes used by application scoring and ranking"""
+        self.applications.create_index('score_status')
+        self.applications.create_index('score_claim', sparse=True)
+        self.applications.create_index([('job_id', 1), ('skill_match_percentage', -1)])
+        self.applications.create_index([('job_id', 1), ('_id', 1)])
+    
     def create_application(self, application_data):
         """Create a new job application"""
         application_data.update({
             'applied_at': datetime.utcnow(),
             'status': 'applied',
             'skill_match_percentage': 0,
+            'score_status': 'pending',
             'notes': '',
             'interview_scheduled': False,
             'interview_date': None,
@@ -70,6 +79,40 @@ class ApplicationModel:
         )
         return result.modified_count > 0
     
+    def bulk_update_skill_match_percentages(self, percentages):
+        """Record live scores for many applications in one round trip, marking them scored
+        
+        Applications claimed by a scoring worker are left to it.
+        """
+        if not percentages:
+            return 0
+        
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {'_id': ObjectId(application_id), 'score_status': {'$ne': 'scoring'}},
+                {'$set': {'skill_match_percentage': percentage, 'score_status': 'scored', 'scored_at': now}}
+            )
+            for application_id, percentage in percentages.items()
+        ]
+        result = self.applications.bulk_write(operations, ordered=False)
+        return result.modified_count
+    
+    def iter_for_rescoring(self, after_job_id=None, batch_size=1000):
+        """Stream applications in (job_id, _id) order, starting after a job
+        
+        Applications still waiting for the scoring pipeline are left to it.
+        The cursor never times out, so the caller must close it.
+        """
+        query = {'score_status': {'$nin': ['pending', 'scoring']}}
+        if after_job_id is not None:
+            query['job_id'] = {'$gt': after_job_id}
+        return self.applications.find(
+            query,
+            {'job_id': 1, 'job_seeker_id': 1},
+            no_cursor_timeout=True
+        ).sort([('job_id', 1), ('_id', 1)]).batch_size(batch_size)
+    
     def schedule_interview(self, application_id, interview_date, notes=None):
         """Schedule interview for application"""
         update_data = {
@@ -0,0 +1,96 @@
+import uuid
+from datetime import datetime
+import gridfs
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+# Failed files kept on a finished job, so a huge bad archive stays below the document limit
+MAX_REPORTED_FAILURES = 1000
+
+class IngestJobModel:
+    """Uploaded resume archives queued for `flask ingest-resumes --queued`
+    
+    Archives are kept in GridFS until a worker has ingested them, so the
+    web process that received one never parses it.
+    """
+    
+    def __init__(self, db):
+        self.db = db
+        self.ingest_jobs = db.ingest_jobs
+        self.archives = gridfs.GridFS(db, collection='ingest_archives')
+    
+    def ensure_indexes(self):
+        """Create the index used to claim jobs"""
+        self.ingest_jobs.create_index([('status', 1), ('created_at', 1)])
+    
+    def create_job(self, admin_id, filename, upload):
+        """Queue an uploaded archive, given as bytes or a file object, for ingestion"""
+        with self.archives.new_file(filename=filename) as grid_in:
+            grid_in.write(upload)
+        
+        try:
+            result = self.ingest_jobs.insert_one({
+                'admin_id': ObjectId(admin_id),
+                'filename': filename,
+                'size': grid_in.length,
+                'file_id': grid_in._id,
+                'status': 'pending',
+                'created_at': datetime.utcnow()
+            })
+        except Exception:
+            self.archives.delete(grid_in._id)
+            raise
+        return str(result.inserted_id)
+    
+    def get_job(self, job_id):
+        """Get an ingest job without its archive reference"""
+        if not ObjectId.is_valid(job_id):
+            return None
+        return self.ingest_jobs.find_one({'_id': ObjectId(job_id)}, {'file_id': 0, 'ingest_claim': 0})
+    
+    def claim_job(self, claim_timeout):
+        """Atomically claim the oldest pending job"""
+        now = datetime.utcnow()
+        return self.ingest_jobs.find_one_and_update(
+            {'$or': [
+                {'status': 'pending'},
+                # Claims from workers that stopped reporting progress
+                {'status': 'ingesting', 'ingest_claimed_at': {'$lt': now - claim_timeout}}
+            ]},
+            {'$set': {
+                'status': 'ingesting',
+                'ingest_claim': uuid.uuid4().hex,
+                'ingest_claimed_at': now,
+                'started_at': now
+            }},
+            sort=[('created_at', 1)],
+            return_document=ReturnDocument.AFTER
+        )
+    
+    def open_archive(self, job):
+        """Readable file of a claimed job's archive"""
+        return self.archives.get(job['file_id'])
+    
+    def update_progress(self, job, summary):
+        """Record counts so far, which also renews the claim"""
+        self.ingest_jobs.update_one(
+            {'_id': job['_id'], 'ingest_claim': job['ingest_claim']},
+            {'$set': {'summary': summary, 'ingest_claimed_at': datetime.utcnow()}}
+        )
+    
+    def finish_job(self, job, status, summary=None, failures=None, error=None):
+        """Record a claimed job's outcome and delete its archive"""
+        update = {'status': status, 'finished_at': datetime.utcnow()}
+        if summary is not None:
+            update['summary'] = summary
+        if failures is not None:
+            update['failures'] = failures[:MAX_REPORTED_FAILURES]
+        if error is not None:
+            update['error'] = error
+        
+        result = self.ingest_jobs.update_one(
+            {'_id': job['_id'], 'ingest_claim': job['ingest_claim']},
+            {'$set': update, '$unset': {'file_id': '', 'ingest_claim': '', 'ingest_claimed_at': ''}}
+        )
+        if result.modified_count:
+            self.archives.delete(job['file_id'])
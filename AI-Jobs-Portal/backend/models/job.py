@@ -1,11 +1,44 @@
 from datetime import datetime
 from bson import ObjectId
+from pymongo import ReturnDocument
+from services.matcher import get_matcher
+from services.ann_index import index_job, unindex_job
+from models.recommendation import RecommendationModel
+from models.skill_demand import SkillDemandModel
+
+def _active_skill_ids(job):
+    """Skills a stored job counts towards demand for: none once inactive"""
+    if not job.get('is_active'):
+        return []
+    return job.get('match_features', {}).get('skill_ids', [])
 
 class JobModel:
     def __init__(self, db):
         self.db = db
         self.jobs = db.jobs
         self.applications = db.applications
+        self.meta = db.meta
+    
+    def ensure_indexes(self):
+        """Create indexes used by job matching"""
+        # Inverted skill -> active job index. Mongo keeps the multikey index
+        # in step with create/update, and the partial filter drops jobs as
+        # soon as they are soft deleted.
+        self.jobs.create_index(
+            'match_features.skills',
+            name='active_jobs_by_skill',
+            partialFilterExpression={'is_active': True}
+        )
+        self.jobs.create_index('recommendation_status')
+    
+    def get_catalog_version(self):
+        """Version of the job catalog, bumped by every job write that can change matches"""
+        document = self.meta.find_one({'_id': 'job_catalog'})
+        return document['version'] if document else 0
+    
+    def _bump_catalog_version(self):
+        """Mark every cached match result against the catalog as stale"""
+        self.meta.update_one({'_id': 'job_catalog'}, {'$inc': {'version': 1}}, upsert=True)
     
     def create_job(self, job_data):
         """Create a new job posting"""
@@ -14,9 +47,17 @@ class JobModel:
             'updated_at': datetime.utcnow(),
             'is_active': True,
             'applications_count': 0,
-            'views_count': 0
+            'views_count': 0,
+            'recommendation_status': 'pending',
+            'match_features': get_matcher().build_job_features(job_data.get('description', ''))
         })
         result = self.jobs.insert_one(job_data)
+        
+        # Keep this process's ANN index current without a rebuild
+        index_job(result.inserted_id, job_data['match_features']['tokens'])
+        
+        SkillDemandModel(self.db).apply_job_change([], job_data['match_features']['skill_ids'])
+        self._bump_catalog_version()
         return str(result.inserted_id)
     
     def get_job_by_id(self, job_id):
@@ -38,6 +79,31 @@ class JobModel:
         
         return list(self.jobs.find(query).skip(skip).limit(limit).sort('created_at', -1))
     
+    def iter_active_jobs(self, projection=None, batch_size=1000):
+        """Stream all active jobs without loading them into memory"""
+        return self.jobs.find({'is_active': True}, projection).batch_size(batch_size)
+    
+    def iter_active_jobs_by_ids(self, job_ids, projection=None):
+        """Stream active jobs from a list of IDs"""
+        return self.jobs.find(
+            {'is_active': True, '_id': {'$in': [ObjectId(job_id) for job_id in job_ids]}},
+            projection
+        )
+    
+    def iter_jobs_for_skills(self, skills, projection=None, batch_size=1000):
+        """Stream active jobs that share at least one canonical skill"""
+        return self.jobs.find(
+            {'is_active': True, 'match_features.skills': {'$in': list(skills)}},
+            projection
+        ).batch_size(batch_size)
+    
+    def iter_jobs_with_stale_features(self, version, batch_size=1000):
+        """Stream jobs whose stored match features are missing or outdated"""
+        return self.jobs.find(
+            {'match_features.version': {'$ne': version}},
+            {'description': 1}
+        ).batch_size(batch_size)
+    
     def get_jobs_by_recruiter(self, recruiter_id):
         """Get jobs posted by specific recruiter"""
         return list(self.jobs.find({'recruiter_id': ObjectId(recruiter_id)}).sort('created_at', -1))
@@ -45,19 +111,62 @@ class JobModel:
     def update_job(self, job_id, update_data):
         """Update job posting"""
         update_data['updated_at'] = datetime.utcnow()
-        result = self.jobs.update_one(
+        
+        # Keep precomputed match features in step with the description
+        if 'description' in update_data:
+            update_data['match_features'] = get_matcher().build_job_features(update_data['description'])
+        
+        update = {'$set': update_data}
+        if update_data.get('is_active') is False:
+            RecommendationModel(self.db).remove_job(job_id)
+        else:
+            # Re-merge into recommendation lists, superseding any merge in flight
+            update_data['recommendation_status'] = 'pending'
+            update['$unset'] = {'recommendation_claim': '', 'recommendation_claimed_at': ''}
+        
+        # The previous state tells which skills the job stops or starts demanding
+        before = self.jobs.find_one_and_update(
             {'_id': ObjectId(job_id)},
-            {'$set': update_data}
+            update,
+            projection={'is_active': 1, 'match_features.skill_ids': 1},
+            return_document=ReturnDocument.BEFORE
         )
-        return result.modified_count > 0
+        
+        if update_data.get('is_active') is False:
+            unindex_job(job_id)
+        elif 'match_features' in update_data:
+            index_job(job_id, update_data['match_features']['tokens'])
+        
+        if before is None:
+            return False
+        
+        is_active = update_data.get('is_active', before.get('is_active'))
+        features = update_data.get('match_features') or before.get('match_features', {})
+        SkillDemandModel(self.db).apply_job_change(
+            _active_skill_ids(before),
+            features.get('skill_ids', []) if is_active else []
+        )
+        self._bump_catalog_version()
+        return True
     
     def delete_job(self, job_id):
         """Soft delete job (mark as inactive)"""
-        result = self.jobs.update_one(
+        before = self.jobs.find_one_and_update(
             {'_id': ObjectId(job_id)},
-            {'$set': {'is_active': False, 'updated_at': datetime.utcnow()}}
+            {'$set': {'is_active': False, 'updated_at': datetime.utcnow()}},
+            projection={'is_active': 1, 'match_features.skill_ids': 1},
+            return_document=ReturnDocument.BEFORE
         )
-        return result.modified_count > 0
+        RecommendationModel(self.db).remove_job(job_id)
+        
+        unindex_job(job_id)
+        
+        if before is None:
+            return False
+        
+        SkillDemandModel(self.db).apply_job_change(_active_skill_ids(before), [])
+        self._bump_catalog_version()
+        return True
     
     def increment_views(self, job_id):
         """Increment job views count"""
@@ -71,7 +180,8 @@ class JobModel:
         application_data.update({
             'applied_at': datetime.utcnow(),
             'status': 'applied',
-            'skill_match_percentage': 0
+            'skill_match_percentage': 0,
+            'score_status': 'pending'
         })
         result = self.applications.insert_one(application_data)
         
@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime
+import gridfs
+from bson import ObjectId
+from pymongo import ReturnDocument
+from config import Config
+
+# Fields returned when reporting on a job, the uploaded document's reference is left behind
+STATUS_FIELDS = {'file_id': 0, 'parse_claim': 0}
+
+class ParseJobModel:
+    """Queued resume parsing jobs, one document per upload
+    
+    The uploaded document is kept in GridFS until it is parsed, so any app
+    process can pick it up and any process can answer status polls. Jobs
+    only hold its file ID, which keeps them far below the 16MB document limit.
+    """
+    
+    def __init__(self, db):
+        self.db = db
+        self.parse_jobs = db.parse_jobs
+        self.uploads = gridfs.GridFS(db, collection='resume_uploads')
+    
+    def ensure_indexes(self):
+        """Create indexes used to claim jobs and expire finished ones"""
+        self.parse_jobs.create_index([('status', 1), ('created_at', 1)])
+        # Only finished jobs carry finished_at, so queued ones never expire
+        self.parse_jobs.create_index('finished_at', expireAfterSeconds=Config.RESUME_PARSE_JOB_TTL)
+    
+    def create_job(self, job_seeker_id, filename, file_type, sha256, upload):
+        """Queue an uploaded resume, given as bytes or a file object, for parsing"""
+        # Written chunk by chunk, so a spooled upload is never read into memory whole
+        with self.uploads.new_file(filename=filename, sha256=sha256) as grid_in:
+            grid_in.write(upload)
+        
+        try:
+            result = self.parse_jobs.insert_one({
+                'job_seeker_id': ObjectId(job_seeker_id),
+                'filename': filename,
+                'file_type': file_type,
+                'sha256': sha256,
+                'size': grid_in.length,
+                'file_id': grid_in._id,
+                'status': 'pending',
+                'created_at': datetime.utcnow()
+            })
+        except Exception:
+            self.uploads.delete(grid_in._id)
+            raise
+        return str(result.inserted_id)
+    
+    def read_upload(self, job):
+        """Uploaded document of a claimed job"""
+        return self.uploads.get(job['file_id']).read()
+    
+    def get_for_job_seeker(self, job_id, job_seeker_id):
+        """Get a job seeker's parse job without the uploaded document"""
+        if not ObjectId.is_valid(job_id):
+            return None
+        return self.parse_jobs.find_one(
+            {'_id': ObjectId(job_id), 'job_seeker_id': ObjectId(job_seeker_id)},
+            STATUS_FIELDS
+        )
+    
+    def queue_position(self, job):
+        """Number of pending jobs queued ahead of this one"""
+        return self.parse_jobs.count_documents({'status': 'pending', 'created_at': {'$lt': job['created_at']}})
+    
+    def claim_job(self, claim_timeout):
+        """Atomically claim the oldest pending job"""
+        now = datetime.utcnow()
+        return self.parse_jobs.find_one_and_update(
+            {'$or': [
+                {'status': 'pending'},
+                # Claims from workers that died mid-parse
+                {'status': 'parsing', 'parse_claimed_at': {'$lt': now - claim_timeout}}
+            ]},
+            {'$set': {
+                'status': 'parsing',
+                'parse_claim': uuid.uuid4().hex,
+                'parse_claimed_at': now,
+                'started_at': now
+            }},
+            sort=[('created_at', 1)],
+            return_document=ReturnDocument.AFTER
+        )
+    
+    def finish_job(self, job, status, result=None, error=None):
+        """Record a claimed job's outcome and delete its uploaded document"""
+        update = {'status': status, 'finished_at': datetime.utcnow()}
+        if result is not None:
+            update['result'] = result
+        if error is not None:
+            update['error'] = error
+        
+        result = self.parse_jobs.update_one(
+            {'_id': job['_id'], 'parse_claim': job['parse_claim']},
+            {'$set': update, '$unset': {'file_id': '', 'parse_claim': '', 'parse_claimed_at': ''}}
+        )
+        # A worker whose claim timed out leaves the document to the one that took over
+        if result.modified_count:
+            self.uploads.delete(job['file_id'])
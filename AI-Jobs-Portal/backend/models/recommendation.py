@@ -0,0 +1,130 @@
+from datetime import datetime
+from bson import ObjectId
+from pymongo import ReplaceOne, UpdateOne
+
+class RecommendationModel:
+    """Materialized top-K job recommendations, one document per job seeker"""
+    
+    def __init__(self, db):
+        self.db = db
+        self.recommendations = db.recommendations
+        self.top_candidates = db.job_top_candidates
+    
+    def ensure_indexes(self):
+        """Create indexes used to pull jobs out of every list holding them"""
+        self.recommendations.create_index('items.job_id')
+    
+    def get_for_job_seeker(self, job_seeker_id, profile_version):
+        """Get a job seeker's list if it was built from this profile version"""
+        return self.recommendations.find_one({
+            '_id': ObjectId(job_seeker_id),
+            'profile_version': profile_version,
+            'stale': {'$ne': True}
+        })
+    
+    def replace_for_job_seeker(self, job_seeker_id, profile_version, items, total):
+        """Store a freshly computed list for a job seeker"""
+        self.recommendations.replace_one(
+            {'_id': ObjectId(job_seeker_id)},
+            {
+                '_id': ObjectId(job_seeker_id),
+                'profile_version': profile_version,
+                'items': items,
+                'total': total,
+                'updated_at': datetime.utcnow()
+            },
+            upsert=True
+        )
+    
+    def bulk_replace_for_job_seekers(self, lists):
+        """Store many (job_seeker_id, profile_version, items, total) lists in one round trip"""
+        if not lists:
+            return 0
+        
+        now = datetime.utcnow()
+        operations = [
+            ReplaceOne(
+                {'_id': job_seeker_id},
+                {
+                    '_id': job_seeker_id,
+                    'profile_version': profile_version,
+                    'items': items,
+                    'total': total,
+                    'updated_at': now
+                },
+                upsert=True
+            )
+            for job_seeker_id, profile_version, items, total in lists
+        ]
+        self.recommendations.bulk_write(operations, ordered=False)
+        return len(operations)
+    
+    def bulk_replace_top_candidates(self, rows):
+        """Store many (job_id, candidates, total) top job seeker lists in one round trip"""
+        if not rows:
+            return 0
+        
+        now = datetime.utcnow()
+        operations = [
+            ReplaceOne(
+                {'_id': job_id},
+                {'_id': job_id, 'candidates': candidates, 'total': total, 'updated_at': now},
+                upsert=True
+            )
+            for job_id, candidates, total in rows
+        ]
+        self.top_candidates.bulk_write(operations, ordered=False)
+        return len(operations)
+    
+    def get_top_candidates(self, job_id):
+        """Get the best matching job seekers for a job from the last full scoring run"""
+        return self.top_candidates.find_one({'_id': ObjectId(job_id)})
+    
+    def mark_stale(self, job_seeker_id):
+        """Force the next read to rebuild a job seeker's list"""
+        self.recommendations.update_one(
+            {'_id': ObjectId(job_seeker_id)},
+            {'$set': {'stale': True}}
+        )
+    
+    def existing_job_seeker_ids(self, job_seeker_ids):
+        """Subset of job seekers that have a materialized list"""
+        documents = self.recommendations.find({'_id': {'$in': list(job_seeker_ids)}}, {'_id': 1})
+        return {document['_id'] for document in documents}
+    
+    def merge_job(self, items_by_job_seeker, k, count=True):
+        """Merge one job into the lists of many job seekers, keeping the k best
+        
+        count adds the job to each list's total, for jobs never merged before.
+        """
+        if not items_by_job_seeker:
+            return 0
+        
+        update = {'$set': {'updated_at': datetime.utcnow()}}
+        if count:
+            update['$inc'] = {'total': 1}
+        operations = [
+            UpdateOne(
+                {'_id': job_seeker_id},
+                dict(update, **{'$push': {'items': {'$each': [item], '$sort': {'score': -1}, '$slice': k}}})
+            )
+            for job_seeker_id, item in items_by_job_seeker.items()
+        ]
+        result = self.recommendations.bulk_write(operations, ordered=False)
+        return result.modified_count
+    
+    def remove_job(self, job_id, count=True):
+        """Pull a job out of every list holding it
+        
+        count takes the job off each list's total. Lists that qualified the
+        job without holding it keep counting it until they are recomputed.
+        """
+        job_id = ObjectId(job_id)
+        update = {
+            '$pull': {'items': {'job_id': job_id}},
+            '$set': {'updated_at': datetime.utcnow()}
+        }
+        if count:
+            update['$inc'] = {'total': -1}
+        result = self.recommendations.update_many({'items.job_id': job_id}, update)
+        return result.modified_count
@@ -0,0 +1,79 @@
+from collections import Counter
+from datetime import datetime
+from pymongo import ReplaceOne, UpdateOne
+
+class SkillDemandModel:
+    """Market demand per canonical skill ID across active jobs
+    
+    jobs counts the active jobs requiring the skill. demand sums each job's
+    share, 1 / its number of skills, so a skill among three requirements
+    counts for more than one among fifteen. Taxonomy weights are applied
+    when reading, so weight changes need no rebuild.
+    """
+    
+    def __init__(self, db):
+        self.db = db
+        self.skill_demand = db.skill_demand
+    
+    def ensure_indexes(self):
+        """Create indexes used to list the most demanded skills"""
+        self.skill_demand.create_index([('jobs', -1)])
+    
+    def apply_job_change(self, before_skill_ids, after_skill_ids):
+        """Move one job's contribution from its old skills to its new ones
+        
+        Pass no skills for the side where the job is missing or inactive.
+        """
+        changes = Counter()
+        shares = Counter()
+        for skill_ids, sign in ((before_skill_ids or [], -1), (after_skill_ids or [], 1)):
+            for skill_id in skill_ids:
+                changes[skill_id] += sign
+                shares[skill_id] += sign / len(skill_ids)
+        
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {'_id': skill_id},
+                {'$inc': {'jobs': changes[skill_id], 'demand': shares[skill_id]}, '$set': {'updated_at': now}},
+                upsert=True
+            )
+            for skill_id in changes
+            if changes[skill_id] or abs(shares[skill_id]) > 1e-12
+        ]
+        if operations:
+            self.skill_demand.bulk_write(operations, ordered=False)
+        return len(operations)
+    
+    def rebuild(self, jobs):
+        """Recount the whole table from active jobs' stored match features"""
+        pipeline = [
+            {'$match': {'is_active': True, 'match_features.skill_ids.0': {'$exists': True}}},
+            {'$project': {
+                'skill_ids': '$match_features.skill_ids',
+                'share': {'$divide': [1, {'$size': '$match_features.skill_ids'}]}
+            }},
+            {'$unwind': '$skill_ids'},
+            {'$group': {'_id': '$skill_ids', 'jobs': {'$sum': 1}, 'demand': {'$sum': '$share'}}}
+        ]
+        now = datetime.utcnow()
+        rows = list(jobs.aggregate(pipeline))
+        operations = [
+            ReplaceOne(
+                {'_id': row['_id']},
+                {'_id': row['_id'], 'jobs': row['jobs'], 'demand': row['demand'], 'updated_at': now},
+                upsert=True
+            )
+            for row in rows
+        ]
+        if operations:
+            self.skill_demand.bulk_write(operations, ordered=False)
+        self.skill_demand.delete_many({'_id': {'$nin': [row['_id'] for row in rows]}})
+        return len(rows)
+    
+    def get_demand(self, skill_ids=None):
+        """Demand rows keyed by skill ID, for the given skills or every demanded skill"""
+        query = {'jobs': {'$gt': 0}}
+        if skill_ids is not None:
+            query['_id'] = {'$in': list(skill_ids)}
+        return {row['_id']: row for row in self.skill_demand.find(query)}
@@ -1,5 +1,12 @@
 from datetime import datetime
 from bson import ObjectId
+from pymongo import UpdateOne
+from services.matcher import get_matcher
+
+# Profile fields that feed the matcher's candidate features
+MATCH_FIELDS = ['skills', 'experience', 'education', 'first_name', 'last_name']
+# Attempts at writing matcher inputs while other updates keep changing them
+MATCH_UPDATE_ATTEMPTS = 5
 
 class UserModel:
     def __init__(self, db):
@@ -8,9 +15,22 @@ class UserModel:
         self.recruiters = db.recruiters
         self.admins = db.admins
     
+    def ensure_indexes(self):
+        """Create indexes used by job matching"""
+        # Inverted skill -> job seeker index for scoring a new job
+        self.job_seekers.create_index('match_features.skill_ids')
+        # Bulk resume ingestion upserts job seekers by email
+        self.job_seekers.create_index('email')
+    
     def create_job_seeker(self, user_data):
         """Create a new job seeker profile"""
-        user_data.update({
+        user_data.update(self._job_seeker_defaults())
+        result = self.job_seekers.insert_one(user_data)
+        return str(result.inserted_id)
+    
+    def _job_seeker_defaults(self):
+        """Fields of a newly created job seeker"""
+        return {
             'created_at': datetime.utcnow(),
             'updated_at': datetime.utcnow(),
             'profile_completed': False,
@@ -25,9 +45,32 @@ class UserModel:
                 'salary_range': {'min': 0, 'max': 0},
                 'remote_work': False
             }
-        })
-        result = self.job_seekers.insert_one(user_data)
-        return str(result.inserted_id)
+        }
+    
+    def bulk_upsert_job_seekers(self, profiles):
+        """Create or update job seekers by email in one unordered bulk write
+        
+        Each profile must set every matcher input, as a parsed resume does,
+        so match features are derived from it without reading the stored one.
+        """
+        matcher = get_matcher()
+        now = datetime.utcnow()
+        operations = []
+        for profile in profiles:
+            update_data = dict(profile, updated_at=now)
+            update_data['match_features'] = matcher.build_candidate_features(
+                matcher.build_candidate_data(update_data),
+                updated_at=now
+            )
+            # Defaults for new seekers, minus the fields the profile sets
+            defaults = {key: value for key, value in self._job_seeker_defaults().items() if key not in update_data}
+            # Bump the revision so a partial update built on the old inputs retries
+            operations.append(UpdateOne(
+                {'email': update_data['email']},
+                {'$set': update_data, '$setOnInsert': defaults, '$inc': {'match_revision': 1}},
+                upsert=True
+            ))
+        return self.job_seekers.bulk_write(operations, ordered=False)
     
     def create_recruiter(self, user_data):
         """Create a new recruiter profile"""
@@ -65,12 +108,46 @@ class UserModel:
         """Update user profile"""
         collection = getattr(self, f'{user_type}s')
         update_data['updated_at'] = datetime.utcnow()
+        
+        if user_type == 'job_seeker' and any(field in update_data for field in MATCH_FIELDS):
+            return self._update_match_fields(user_id, update_data)
+        if user_type == 'job_seeker':
+            # Inputs unchanged, so the stored features still hold for the new timestamp
+            update_data['match_features.updated_at'] = update_data['updated_at']
+        
         result = collection.update_one(
             {'_id': ObjectId(user_id)},
             {'$set': update_data}
         )
         return result.modified_count > 0
     
+    def _update_match_fields(self, user_id, update_data):
+        """Update matcher inputs with candidate features built from exactly the profile written
+        
+        Features are derived from the stored profile merged with this update,
+        so the write only lands if no other input change got in between
+        (compare-and-set on match_revision), and is retried otherwise.
+        """
+        matcher = get_matcher()
+        for _ in range(MATCH_UPDATE_ATTEMPTS):
+            profile = self.job_seekers.find_one({'_id': ObjectId(user_id)}, MATCH_FIELDS + ['match_revision'])
+            if profile is None:
+                return False
+            
+            revision = profile.get('match_revision')
+            profile.update(update_data)
+            update_data['match_features'] = matcher.build_candidate_features(
+                matcher.build_candidate_data(profile),
+                updated_at=update_data['updated_at']
+            )
+            result = self.job_seekers.update_one(
+                {'_id': ObjectId(user_id), 'match_revision': revision},
+                {'$set': update_data, '$inc': {'match_revision': 1}}
+            )
+            if result.matched_count:
+                return result.modified_count > 0
+        raise Exception('Profile was changed by another update, please try again')
+    
     def authenticate_user(self, email, password, user_type):
         """Authenticate user login"""
         user = self.get_user_by_email(email, user_type)
@@ -82,6 +159,29 @@ class UserModel:
         """Get complete job seeker profile"""
         return self.job_seekers.find_one({'_id': ObjectId(user_id)})
     
+    def get_job_seeker_profiles(self, user_ids):
+        """Get job seeker profiles for many users, keyed by ID string"""
+        profiles = self.job_seekers.find({'_id': {'$in': [ObjectId(user_id) for user_id in user_ids]}})
+        return {str(profile['_id']): profile for profile in profiles}
+    
+    def iter_job_seekers(self, batch_size=1000):
+        """Stream every job seeker's matcher inputs in _id order
+        
+        The cursor never times out, so the caller must close it.
+        """
+        return self.job_seekers.find(
+            {},
+            MATCH_FIELDS + ['updated_at', 'match_features'],
+            no_cursor_timeout=True
+        ).sort('_id', 1).batch_size(batch_size)
+    
+    def iter_job_seekers_for_skill_ids(self, skill_ids, batch_size=1000):
+        """Stream job seekers whose materialized features share at least one skill"""
+        return self.job_seekers.find(
+            {'match_features.skill_ids': {'$in': list(skill_ids)}},
+            MATCH_FIELDS + ['updated_at', 'match_features']
+        ).batch_size(batch_size)
+    
     def get_recruiter_profile(self, user_id):
         """Get complete recruiter profile"""
         return self.recruiters.find_one({'_id': ObjectId(user_id)})
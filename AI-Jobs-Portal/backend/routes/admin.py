@@ -1,9 +1,12 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from werkzeug.utils import secure_filename
 from models.user import UserModel
 from models.job import JobModel
 from models.application import ApplicationModel
+from models.ingest_job import IngestJobModel
 from bson import ObjectId
+from services.bulk_ingest import iter_resume_files
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -372,4 +375,65 @@ def get_analytics():
         }), 200
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
+
+def ingest_job_response(job):
+    """Ingest job status as the API returns it, with counts and failed files as they are known"""
+    return {
+        'job_id': str(job['_id']),
+        'status': job['status'],
+        'filename': job['filename'],
+        'size': job['size'],
+        'created_at': job['created_at'].isoformat(),
+        'started_at': job['started_at'].isoformat() if job.get('started_at') else None,
+        'finished_at': job['finished_at'].isoformat() if job.get('finished_at') else None,
+        'summary': job.get('summary'),
+        'failures': job.get('failures', []),
+        'error': job.get('error')
+    }
+
+@admin_bp.route('/ingest-resumes', methods=['POST'])
+@jwt_required()
+def ingest_resumes():
+    try:
+        current_user = get_jwt_identity()
+        if current_user['user_type'] != 'admin':
+            return jsonify({'error': 'Access denied'}), 403
+        
+        if 'archive' not in request.files:
+            return jsonify({'error': 'No archive provided'}), 400
+        
+        # Only the format is checked here; `flask ingest-resumes --queued` parses the archive
+        archive = request.files['archive']
+        try:
+            iter_resume_files(archive.stream)
+        except Exception as e:
+            return jsonify({'error': str(e)}), 400
+        archive.stream.seek(0)
+        
+        ingest_job_model = IngestJobModel(current_app.db)
+        job_id = ingest_job_model.create_job(current_user['user_id'], secure_filename(archive.filename), archive.stream)
+        return jsonify({
+            'message': 'Archive queued for ingestion',
+            'job': ingest_job_response(ingest_job_model.get_job(job_id))
+        }), 202
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@admin_bp.route('/ingest-jobs/<job_id>', methods=['GET'])
+@jwt_required()
+def get_ingest_job(job_id):
+    try:
+        current_user = get_jwt_identity()
+        if current_user['user_type'] != 'admin':
+            return jsonify({'error': 'Access denied'}), 403
+        
+        job = IngestJobModel(current_app.db).get_job(job_id)
+        if not job:
+            return jsonify({'error': 'Ingest job not found'}), 404
+        
+        return jsonify({'job': ingest_job_response(job)}), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
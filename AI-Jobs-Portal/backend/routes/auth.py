@@ -127,8 +127,10 @@ def get_profile():
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
-        # Remove sensitive data
+        # Remove sensitive data and matcher internals
         user.pop('password', None)
+        user.pop('match_features', None)
+        user.pop('match_revision', None)
         user['_id'] = str(user['_id'])
         
         return jsonify({'user': user}), 200
@@ -1,12 +1,15 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
-import openai
 import os
+from utils.startup import lazy_import
 
 chatbot_bp = Blueprint('chatbot', __name__)
 
-# Initialize OpenAI
-openai.api_key = os.environ.get('OPENAI_API_KEY')
+def _configure_openai(module):
+    """Initialize OpenAI"""
+    module.api_key = os.environ.get('OPENAI_API_KEY')
+
+openai = lazy_import('openai', setup=_configure_openai)
 
 @chatbot_bp.route('/chat', methods=['POST'])
 @jwt_required()
@@ -22,7 +25,7 @@ def chat():
         
         # Get user context
         from models.user import UserModel
-        user_model = UserModel(request.app.db)
+        user_model = UserModel(current_app.db)
         
         user_context = ""
         if current_user['user_type'] == 'job_seeker':
@@ -95,7 +98,7 @@ def get_interview_questions():
         
         # Get job seeker skills for personalized questions
         from models.user import UserModel
-        user_model = UserModel(request.app.db)
+        user_model = UserModel(current_app.db)
         profile = user_model.get_job_seeker_profile(current_user['user_id'])
         
         skills = profile.get('skills', []) if profile else []
@@ -240,59 +243,15 @@ def get_upskilling_recommendations():
         if current_user['user_type'] != 'job_seeker':
             return jsonify({'error': 'Only job seekers can get upskilling recommendations'}), 403
         
-        # Get job seeker skills
         from models.user import UserModel
-        user_model = UserModel(request.app.db)
+        from services.upskilling import recommend_skills
+        user_model = UserModel(current_app.db)
         profile = user_model.get_job_seeker_profile(current_user['user_id'])
+        if not profile:
+            return jsonify({'error': 'Job seeker profile not found'}), 404
         
-        skills = profile.get('skills', []) if profile else []
-        
-        # Generate recommendations based on current skills
-        recommendations = []
-        
-        # Programming languages
-        if 'python' in [skill.lower() for skill in skills]:
-            recommendations.append({
-                'skill': 'Advanced Python',
-                'resources': [
-                    {'type': 'YouTube', 'title': 'Python Advanced Concepts', 'url': 'https://youtube.com/watch?v=example1'},
-                    {'type': 'Course', 'title': 'Python for Data Science', 'url': 'https://coursera.org/learn/python-data-science'},
-                    {'type': 'Documentation', 'title': 'Python Official Docs', 'url': 'https://docs.python.org/3/'}
-                ]
-            })
-        
-        if 'javascript' in [skill.lower() for skill in skills]:
-            recommendations.append({
-                'skill': 'Advanced JavaScript',
-                'resources': [
-                    {'type': 'YouTube', 'title': 'JavaScript ES6+ Features', 'url': 'https://youtube.com/watch?v=example2'},
-                    {'type': 'Course', 'title': 'Modern JavaScript', 'url': 'https://udemy.com/course/modern-javascript'},
-                    {'type': 'Book', 'title': 'You Don\'t Know JS', 'url': 'https://github.com/getify/You-Dont-Know-JS'}
-                ]
-            })
-        
-        # Add more recommendations based on skills
-        if not recommendations:
-            recommendations = [
-                {
-                    'skill': 'Web Development',
-                    'resources': [
-                        {'type': 'YouTube', 'title': 'Complete Web Development Course', 'url': 'https://youtube.com/watch?v=example3'},
-                        {'type': 'Course', 'title': 'Full Stack Web Development', 'url': 'https://freecodecamp.org'},
-                        {'type': 'Practice', 'title': 'Frontend Mentor', 'url': 'https://frontendmentor.io'}
-                    ]
-                },
-                {
-                    'skill': 'Data Science',
-                    'resources': [
-                        {'type': 'YouTube', 'title': 'Data Science Tutorial', 'url': 'https://youtube.com/watch?v=example4'},
-                        {'type': 'Course', 'title': 'Data Science Specialization', 'url': 'https://coursera.org/specializations/data-science'},
-                        {'type': 'Practice', 'title': 'Kaggle Learn', 'url': 'https://kaggle.com/learn'}
-                    ]
-                }
-            ]
-        
-        return jsonify({'recommendations': recommendations}), 200
+        # Skill demand table lookup against the seeker's top matched jobs
+        return jsonify(recommend_skills(current_app.db, profile)), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
@@ -1,21 +1,23 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models.job import JobModel
 from models.application import ApplicationModel
-from services.matcher import JobMatcher
+from models.recommendation import RecommendationModel
+from models.user import UserModel
+from services.matcher import get_matcher
+from services.executor import get_executor
+from services.ann_index import get_ann_index
+from services.recommendations import recommendation_item
+from config import Config
 from bson import ObjectId
 
 jobs_bp = Blueprint('jobs', __name__)
 
-def init_job_routes(app):
-    job_model = JobModel(app.db)
-    application_model = ApplicationModel(app.db)
-    matcher = JobMatcher()
-
 @jobs_bp.route('/post', methods=['POST'])
 @jwt_required()
 def post_job():
     try:
+        job_model = JobModel(current_app.db)
         current_user = get_jwt_identity()
         if current_user['user_type'] != 'recruiter':
             return jsonify({'error': 'Only recruiters can post jobs'}), 403
@@ -34,6 +36,9 @@ def post_job():
         # Create job
         job_id = job_model.create_job(data)
         
+        # Merge it into job seekers' recommendation lists in the background
+        current_app.recommendation_materializer.submit()
+        
         return jsonify({
             'message': 'Job posted successfully',
             'job_id': job_id
@@ -45,6 +50,7 @@ def post_job():
 @jobs_bp.route('/', methods=['GET'])
 def get_jobs():
     try:
+        job_model = JobModel(current_app.db)
         # Get query parameters
         page = int(request.args.get('page', 1))
         limit = int(request.args.get('limit', 20))
@@ -82,6 +88,7 @@ def get_jobs():
 @jobs_bp.route('/<job_id>', methods=['GET'])
 def get_job(job_id):
     try:
+        job_model = JobModel(current_app.db)
         job = job_model.get_job_by_id(job_id)
         if not job:
             return jsonify({'error': 'Job not found'}), 404
@@ -102,6 +109,8 @@ def get_job(job_id):
 @jwt_required()
 def apply_job(job_id):
     try:
+        job_model = JobModel(current_app.db)
+        application_model = ApplicationModel(current_app.db)
         current_user = get_jwt_identity()
         if current_user['user_type'] != 'job_seeker':
             return jsonify({'error': 'Only job seekers can apply for jobs'}), 403
@@ -131,23 +140,8 @@ def apply_job(job_id):
         # Create application
         application_id = application_model.create_application(application_data)
         
-        # Calculate skill match (this would be done asynchronously in production)
-        # For now, we'll calculate it synchronously
-        from models.user import UserModel
-        user_model = UserModel(job_model.db)
-        job_seeker = user_model.get_job_seeker_profile(current_user['user_id'])
-        
-        if job_seeker:
-            # Calculate match percentage
-            candidate_data = {
-                'skills_text': ', '.join(job_seeker.get('skills', [])),
-                'profile_text': f"{job_seeker.get('first_name', '')} {job_seeker.get('last_name', '')}",
-                'experience': job_seeker.get('experience', []),
-                'education': job_seeker.get('education', [])
-            }
-            
-            match_result = matcher.calculate_overall_match(job, candidate_data)
-            application_model.update_skill_match_percentage(application_id, match_result['overall_match'])
+        # Score the application off the request path
+        current_app.application_scorer.submit()
         
         return jsonify({
             'message': 'Application submitted successfully',
@@ -161,30 +155,54 @@ def apply_job(job_id):
 @jwt_required()
 def get_job_applications(job_id):
     try:
+        job_model = JobModel(current_app.db)
+        application_model = ApplicationModel(current_app.db)
         current_user = get_jwt_identity()
         if current_user['user_type'] not in ['recruiter', 'admin']:
             return jsonify({'error': 'Access denied'}), 403
         
         # Check if user owns the job (for recruiters)
-        if current_user['user_type'] == 'recruiter':
-            job = job_model.get_job_by_id(job_id)
-            if not job or str(job['recruiter_id']) != current_user['user_id']:
-                return jsonify({'error': 'Access denied'}), 403
+        job = job_model.get_job_by_id(job_id)
+        if not job:
+            return jsonify({'error': 'Job not found'}), 404
+        if current_user['user_type'] == 'recruiter' and str(job['recruiter_id']) != current_user['user_id']:
+            return jsonify({'error': 'Access denied'}), 403
         
         # Get applications
         applications = job_model.get_applications_for_job(job_id)
         
-        # Convert ObjectId to string and add job seeker details
-        from models.user import UserModel
-        user_model = UserModel(job_model.db)
+        # Load every applicant profile in one query
+        user_model = UserModel(current_app.db)
+        job_seekers = user_model.get_job_seeker_profiles([app['job_seeker_id'] for app in applications])
+        
+        # Rank all applicants against the job in one pass
+        scored = [app for app in applications if str(app['job_seeker_id']) in job_seekers]
+        matcher = get_matcher()
+        candidates = [matcher.build_candidate_data(job_seekers[str(app['job_seeker_id'])]) for app in scored]
+        match_results = get_executor().score_applicants(job, candidates)
+        
+        changed = {}
+        for app, match_result in zip(scored, match_results):
+            if (app.get('skill_match_percentage') != match_result['overall_match']
+                    or app.get('score_status') not in ('scored', 'scoring')):
+                changed[str(app['_id'])] = match_result['overall_match']
+                if app.get('score_status') != 'scoring':
+                    app['score_status'] = 'scored'
+            app['skill_match_percentage'] = match_result['overall_match']
+            app['matched_skills'] = match_result['matched_skills']
+        
+        # Write back only the scores that moved, or that the scoring pipeline has not settled
+        application_model.bulk_update_skill_match_percentages(changed)
+        applications.sort(key=lambda x: x.get('skill_match_percentage', 0), reverse=True)
         
+        # Convert ObjectId to string and add job seeker details
         for app in applications:
             app['_id'] = str(app['_id'])
             app['job_id'] = str(app['job_id'])
             app['job_seeker_id'] = str(app['job_seeker_id'])
             
             # Get job seeker details
-            job_seeker = user_model.get_job_seeker_profile(app['job_seeker_id'])
+            job_seeker = job_seekers.get(app['job_seeker_id'])
             if job_seeker:
                 app['job_seeker'] = {
                     'name': f"{job_seeker.get('first_name', '')} {job_seeker.get('last_name', '')}",
@@ -202,57 +220,87 @@ def get_job_applications(job_id):
 @jwt_required()
 def get_job_recommendations():
     try:
+        job_model = JobModel(current_app.db)
         current_user = get_jwt_identity()
         if current_user['user_type'] != 'job_seeker':
             return jsonify({'error': 'Only job seekers can get recommendations'}), 403
         
         # Get job seeker profile
-        from models.user import UserModel
-        user_model = UserModel(job_model.db)
+        user_model = UserModel(current_app.db)
         job_seeker = user_model.get_job_seeker_profile(current_user['user_id'])
         
         if not job_seeker:
             return jsonify({'error': 'Job seeker profile not found'}), 404
         
-        # Get all active jobs
-        all_jobs = job_model.get_all_jobs(limit=100)
-        
-        # Calculate matches for each job
-        recommendations = []
-        matcher = JobMatcher()
-        
-        for job in all_jobs:
-            candidate_data = {
-                'skills_text': ', '.join(job_seeker.get('skills', [])),
-                'profile_text': f"{job_seeker.get('first_name', '')} {job_seeker.get('last_name', '')}",
-                'experience': job_seeker.get('experience', []),
-                'education': job_seeker.get('education', [])
-            }
-            
-            match_result = matcher.calculate_overall_match(job, candidate_data)
-            
-            if match_result['overall_match'] >= 30:  # Only recommend jobs with 30%+ match
-                job['_id'] = str(job['_id'])
-                job['recruiter_id'] = str(job['recruiter_id'])
-                job['match_percentage'] = match_result['overall_match']
-                job['matched_skills'] = match_result['matched_skills']
-                recommendations.append(job)
-        
-        # Sort by match percentage
-        recommendations.sort(key=lambda x: x['match_percentage'], reverse=True)
-        
-        return jsonify({
-            'recommendations': recommendations[:20],  # Return top 20
-            'total': len(recommendations)
-        }), 200
+        # Materialized list, kept current as jobs are posted and removed
+        recommendation_model = RecommendationModel(current_app.db)
+        materialized = recommendation_model.get_for_job_seeker(current_user['user_id'], job_seeker.get('updated_at'))
+        items = materialized['items'] if materialized else []
+        
+        # Removals can leave a list short while more jobs qualify, recompute then
+        if materialized and (len(items) >= Config.RECOMMENDATIONS_K or materialized['total'] <= len(items)):
+            return jsonify({
+                'recommendations': [item['job'] for item in items[:Config.RECOMMENDATIONS_K]],
+                'total': materialized['total']
+            }), 200
+        
+        # No list yet or the profile changed: compute once, from cache until the profile or any job changes
+        catalog_version = job_model.get_catalog_version()
+        result = current_app.recommendation_cache.get_or_compute(
+            current_user['user_id'],
+            job_seeker.get('updated_at'),
+            catalog_version,
+            lambda: _compute_recommendations(job_seeker, job_model, recommendation_model, catalog_version)
+        )
+        return jsonify(result), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def _compute_recommendations(job_seeker, job_model, recommendation_model, catalog_version):
+    """Rank jobs for a job seeker and materialize the list when it can be kept current"""
+    matcher = get_matcher()
+    candidate_data = matcher.build_candidate_data(job_seeker)
+    
+    # Only score jobs that share at least one skill with the seeker
+    skills = [skill['skill'] for skill in matcher.get_candidate_features(candidate_data)['skills']]
+    ann_index = get_ann_index(job_model) if Config.ANN_ENABLED else None
+    if ann_index is not None:
+        # A few hundred nearest jobs by text, re-scored exactly below
+        job_ids = ann_index.query(matcher.build_candidate_query(candidate_data))
+        all_jobs = job_model.iter_active_jobs_by_ids(job_ids)
+    elif skills:
+        all_jobs = job_model.iter_jobs_for_skills(skills)
+    else:
+        all_jobs = job_model.get_all_jobs(limit=100)
+    
+    # Keep the top K jobs above the minimum match without holding every score
+    # The list keeps a buffer beyond K so removed jobs can be backfilled
+    ranking = get_executor().rank_top_k(all_jobs, candidate_data,
+                                        k=Config.RECOMMENDATIONS_K + Config.RECOMMENDATION_BUFFER,
+                                        min_score=Config.RECOMMENDATION_MIN_SCORE)
+    
+    items = [recommendation_item(job, match_result) for job, match_result in ranking['results']]
+    
+    # New jobs reach lists through the stored features' skill index, so
+    # only skill-based lists of seekers with current features stay current
+    if skills and ann_index is None and 'features' in candidate_data:
+        recommendation_model.replace_for_job_seeker(job_seeker['_id'], job_seeker.get('updated_at'),
+                                                    items, ranking['total'])
+        if job_model.get_catalog_version() != catalog_version:
+            # A job changed while ranking and its merge may have been overwritten
+            recommendation_model.mark_stale(job_seeker['_id'])
+    
+    return {
+        'recommendations': [item['job'] for item in items[:Config.RECOMMENDATIONS_K]],
+        'total': ranking['total']
+    }
+
 @jobs_bp.route('/my-applications', methods=['GET'])
 @jwt_required()
 def get_my_applications():
     try:
+        job_model = JobModel(current_app.db)
         current_user = get_jwt_identity()
         if current_user['user_type'] != 'job_seeker':
             return jsonify({'error': 'Only job seekers can view applications'}), 403
@@ -285,6 +333,7 @@ def get_my_applications():
 @jwt_required()
 def update_application_status(job_id):
     try:
+        application_model = ApplicationModel(current_app.db)
         current_user = get_jwt_identity()
         if current_user['user_type'] not in ['recruiter', 'admin']:
             return jsonify({'error': 'Access denied'}), 403
@@ -1,12 +1,30 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from werkzeug.utils import secure_filename
-import os
-from services.parser import ResumeParser
+from services.parser import ResumeParser, normalize_text
 from models.user import UserModel
+from models.parse_job import ParseJobModel
+from utils.uploads import upload_sha256
 
 resume_bp = Blueprint('resume', __name__)
 
+def parse_job_response(job):
+    """Parse job status as the API returns it, with parsed data once completed"""
+    response = {
+        'job_id': str(job['_id']),
+        'status': job['status'],
+        'filename': job['filename'],
+        'size': job['size'],
+        'created_at': job['created_at'].isoformat(),
+        'started_at': job['started_at'].isoformat() if job.get('started_at') else None,
+        'finished_at': job['finished_at'].isoformat() if job.get('finished_at') else None
+    }
+    if job['status'] == 'completed':
+        response['parsed_data'] = job['result']
+    elif job['status'] == 'failed':
+        response['error'] = job.get('error')
+    return response
+
 def allowed_file(filename):
     ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt'}
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -29,52 +47,42 @@ def upload_resume():
         if not allowed_file(file.filename):
             return jsonify({'error': 'Invalid file type. Allowed: PDF, DOC, DOCX, TXT'}), 400
         
-        # Save file
         filename = secure_filename(file.filename)
-        file_path = os.path.join('uploads', f"{current_user['user_id']}_{filename}")
-        file.save(file_path)
-        
-        # Parse resume
-        parser = ResumeParser()
-        file_extension = filename.rsplit('.', 1)[1].lower()
-        
-        try:
-            parsed_data = parser.parse_resume(file_path, file_extension)
-            
-            # Update user profile with parsed data
-            user_model = UserModel(request.app.db)
-            update_data = {
-                'resume_url': file_path,
-                'first_name': parsed_data['name'].split()[0] if parsed_data['name'] else '',
-                'last_name': ' '.join(parsed_data['name'].split()[1:]) if len(parsed_data['name'].split()) > 1 else '',
-                'skills': parsed_data['skills'],
-                'experience': parsed_data['experience'],
-                'education': parsed_data['education'],
-                'profile_completed': True
-            }
-            
-            # Add contact info if available
-            if parsed_data['contact_info'].get('phone'):
-                update_data['phone'] = parsed_data['contact_info']['phone']
-            
-            success = user_model.update_user(current_user['user_id'], 'job_seeker', update_data)
-            
-            if not success:
-                return jsonify({'error': 'Failed to update profile'}), 500
-            
-            # Clean up file
-            os.remove(file_path)
-            
-            return jsonify({
-                'message': 'Resume parsed and profile updated successfully',
-                'parsed_data': parsed_data
-            }), 200
-            
-        except Exception as e:
-            # Clean up file on error
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            return jsonify({'error': f'Failed to parse resume: {str(e)}'}), 500
+        file_extension = filename.rsplit('.', 1)[1].lower() if '.' in filename else file.filename.rsplit('.', 1)[1].lower()
+        
+        # Hashed while it was received; parsing happens off the request thread
+        resume_sha256 = upload_sha256(file.stream)
+        job_id = current_app.resume_parse_queue.submit(
+            current_user['user_id'], filename, file_extension, resume_sha256, file.stream
+        )
+        
+        job = ParseJobModel(current_app.db).get_for_job_seeker(job_id, current_user['user_id'])
+        return jsonify({
+            'message': 'Resume queued for parsing',
+            'job': parse_job_response(job)
+        }), 202
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@resume_bp.route('/jobs/<job_id>', methods=['GET'])
+@jwt_required()
+def get_parse_job(job_id):
+    try:
+        current_user = get_jwt_identity()
+        if current_user['user_type'] != 'job_seeker':
+            return jsonify({'error': 'Only job seekers can view parse jobs'}), 403
+        
+        parse_job_model = ParseJobModel(current_app.db)
+        job = parse_job_model.get_for_job_seeker(job_id, current_user['user_id'])
+        if not job:
+            return jsonify({'error': 'Parse job not found'}), 404
+        
+        response = parse_job_response(job)
+        if job['status'] == 'pending':
+            response['queue_position'] = parse_job_model.queue_position(job)
+        
+        return jsonify({'job': response}), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -93,26 +101,12 @@ def parse_resume_text():
         if not resume_text:
             return jsonify({'error': 'No resume text provided'}), 400
         
-        # Parse resume text
-        parser = ResumeParser()
-        
-        # Extract information from text
-        contact_info = parser.extract_contact_info(resume_text)
-        skills = parser.extract_skills(resume_text)
-        experience = parser.extract_experience(resume_text)
-        education = parser.extract_education(resume_text)
-        
-        # Extract name (first line usually contains name)
-        lines = resume_text.split('\n')
-        name = lines[0].strip() if lines else ""
-        
-        parsed_data = {
-            'name': name,
-            'contact_info': contact_info,
-            'skills': skills,
-            'experience': experience,
-            'education': education
-        }
+        # Texts differing only in line endings or trailing whitespace share one cached parse
+        resume_text = normalize_text(resume_text)
+        parsed_data = current_app.resume_cache.get_or_parse(
+            current_app.resume_cache.text_key(resume_text),
+            lambda: ResumeParser().parse_text(resume_text)
+        )
         
         return jsonify({
             'message': 'Resume text parsed successfully',
@@ -137,7 +131,7 @@ def update_skills():
             return jsonify({'error': 'Skills must be a list'}), 400
         
         # Update user skills
-        user_model = UserModel(request.app.db)
+        user_model = UserModel(current_app.db)
         success = user_model.update_user(current_user['user_id'], 'job_seeker', {'skills': skills})
         
         if not success:
@@ -163,7 +157,7 @@ def update_experience():
             return jsonify({'error': 'Experience must be a list'}), 400
         
         # Update user experience
-        user_model = UserModel(request.app.db)
+        user_model = UserModel(current_app.db)
         success = user_model.update_user(current_user['user_id'], 'job_seeker', {'experience': experience})
         
         if not success:
@@ -189,7 +183,7 @@ def update_education():
             return jsonify({'error': 'Education must be a list'}), 400
         
         # Update user education
-        user_model = UserModel(request.app.db)
+        user_model = UserModel(current_app.db)
         success = user_model.update_user(current_user['user_id'], 'job_seeker', {'education': education})
         
         if not success:
@@ -209,14 +203,16 @@ def get_profile():
             return jsonify({'error': 'Only job seekers can view profile'}), 403
         
         # Get job seeker profile
-        user_model = UserModel(request.app.db)
+        user_model = UserModel(current_app.db)
         profile = user_model.get_job_seeker_profile(current_user['user_id'])
         
         if not profile:
             return jsonify({'error': 'Profile not found'}), 404
         
-        # Remove sensitive data
+        # Remove sensitive data and matcher internals
         profile.pop('password', None)
+        profile.pop('match_features', None)
+        profile.pop('match_revision', None)
         profile['_id'] = str(profile['_id'])
         
         return jsonify({'profile': profile}), 200
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import Counter, defaultdict
+import numpy as np
+from config import Config
+from services.tfidf_model import get_text_model
+
+class JobAnnIndex:
+    """Random-hyperplane LSH index over job TF-IDF vectors
+    
+    Each table hashes a vector to the sign pattern of its projections on
+    n_bits random hyperplanes, so jobs with a small angle to the query tend
+    to share a bucket. More tables and more probes raise recall at the cost
+    of latency.
+    """
+    
+    def __init__(self, text_model, n_bits=None, n_tables=None, seed=0):
+        self.text_model = text_model
+        self.version = text_model.version
+        self.n_bits = n_bits or Config.ANN_BITS
+        self.n_tables = n_tables or Config.ANN_TABLES
+        
+        dimensions = len(text_model.vectorizer.vocabulary_)
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((self.n_tables, dimensions, self.n_bits)).astype(np.float32)
+        self.powers = 1 << np.arange(self.n_bits, dtype=np.int64)
+        
+        self.tables = [defaultdict(set) for _ in range(self.n_tables)]
+        self.job_keys = {}
+        self.built_at = time.time()
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self.job_keys)
+    
+    def _project(self, vectors):
+        """Project sparse vectors onto every table's hyperplanes (n x tables x bits)"""
+        return np.stack([np.asarray(vectors @ self.planes[t]) for t in range(self.n_tables)], axis=1)
+    
+    def _keys(self, projections):
+        """Bucket key per table from the projection signs"""
+        return (projections > 0).astype(np.int64) @ self.powers
+    
+    def add_many(self, job_ids, token_strings):
+        """Index jobs by their preprocessed description tokens"""
+        if not job_ids:
+            return
+        
+        keys = self._keys(self._project(self.text_model.transform(token_strings)))
+        with self._lock:
+            for job_id, job_keys in zip(job_ids, keys):
+                self._remove(job_id)
+                job_keys = tuple(int(key) for key in job_keys)
+                for table, key in zip(self.tables, job_keys):
+                    table[key].add(job_id)
+                self.job_keys[job_id] = job_keys
+    
+    def add(self, job_id, tokens):
+        """Index or re-index a single job"""
+        self.add_many([str(job_id)], [tokens])
+    
+    def remove(self, job_id):
+        """Drop a job from the index"""
+        with self._lock:
+            self._remove(str(job_id))
+    
+    def _remove(self, job_id):
+        job_keys = self.job_keys.pop(job_id, None)
+        if job_keys is None:
+            return
+        for table, key in zip(self.tables, job_keys):
+            bucket = table.get(key)
+            if bucket is not None:
+                bucket.discard(job_id)
+                if not bucket:
+                    del table[key]
+    
+    def query(self, tokens, n_candidates=None, n_probes=None):
+        """Get IDs of jobs likely to be closest to the query text
+        
+        n_probes also visits the buckets reached by flipping each of the
+        n_probes least certain bits in every table (multi-probe LSH).
+        """
+        n_candidates = n_candidates or Config.ANN_CANDIDATES
+        n_probes = Config.ANN_PROBES if n_probes is None else n_probes
+        
+        vector = self.text_model.transform([tokens])
+        if not vector.nnz:
+            return []
+        
+        projections = self._project(vector)[0]
+        keys = self._keys(projections)
+        
+        counts = Counter()
+        with self._lock:
+            for t, table in enumerate(self.tables):
+                probes = [int(keys[t])]
+                for bit in np.argsort(np.abs(projections[t]))[:n_probes]:
+                    probes.append(int(keys[t]) ^ int(self.powers[bit]))
+                for key in probes:
+                    counts.update(table.get(key, ()))
+        
+        # Jobs that collide in more tables are more likely to be close
+        return [job_id for job_id, _ in counts.most_common(n_candidates)]
+    
+    @classmethod
+    def build(cls, job_model, text_model, batch_size=1000, **kwargs):
+        """Build an index over all active jobs"""
+        index = cls(text_model, **kwargs)
+        job_ids = []
+        token_strings = []
+        for job in job_model.iter_active_jobs({'match_features.tokens': 1}):
+            job_ids.append(str(job['_id']))
+            token_strings.append(job.get('match_features', {}).get('tokens', ''))
+            if len(job_ids) >= batch_size:
+                index.add_many(job_ids, token_strings)
+                job_ids, token_strings = [], []
+        index.add_many(job_ids, token_strings)
+        return index
+
+_shared_index = None
+_build_lock = threading.Lock()
+# Job changes made while a rebuild runs, replayed into the new index before it is swapped in
+_rebuild_changes = None
+
+def _rebuild(job_model, text_model):
+    """Build a fresh index off the request path and swap it in"""
+    global _shared_index, _rebuild_changes
+    try:
+        index = JobAnnIndex.build(job_model, text_model)
+    except Exception as e:
+        print(f"Error building ANN index: {e}")
+        with _build_lock:
+            _rebuild_changes = None
+        return
+    
+    with _build_lock:
+        for job_id, tokens in _rebuild_changes:
+            if tokens is None:
+                index.remove(job_id)
+            else:
+                index.add(job_id, tokens)
+        _shared_index = index
+        _rebuild_changes = None
+
+def get_ann_index(job_model):
+    """Get the process-wide index, rebuilding it in the background when the model or age requires
+    
+    Requests keep using the current index while a rebuild runs, and get
+    None (exact scoring) until the first build finishes.
+    """
+    global _rebuild_changes
+    text_model = get_text_model()
+    if text_model is None:
+        return None
+    
+    index = _shared_index
+    is_fresh = (index is not None and index.version == text_model.version
+                and time.time() - index.built_at < Config.ANN_REFRESH_SECONDS)
+    if not is_fresh:
+        with _build_lock:
+            if _rebuild_changes is None:
+                _rebuild_changes = []
+                threading.Thread(target=_rebuild, args=(job_model, text_model),
+                                 name='ann-index-build', daemon=True).start()
+    return index
+
+def _record_change(job_id, tokens):
+    """Apply a job change to the current index and to any rebuild in progress"""
+    with _build_lock:
+        if _rebuild_changes is not None:
+            _rebuild_changes.append((str(job_id), tokens))
+        index = _shared_index
+    
+    if index is not None:
+        if tokens is None:
+            index.remove(job_id)
+        else:
+            index.add(job_id, tokens)
+
+def index_job(job_id, tokens):
+    """Index or re-index a job in this process's index, without a rebuild"""
+    _record_change(job_id, tokens)
+
+def unindex_job(job_id):
+    """Drop a job from this process's index"""
+    _record_change(job_id, None)
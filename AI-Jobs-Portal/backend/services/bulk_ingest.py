@@ -0,0 +1,240 @@
+import hashlib
+import os
+import tarfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from concurrent.futures.process import BrokenProcessPool
+from pymongo.errors import BulkWriteError
+from config import Config
+from models.user import UserModel
+from services.executor import worker_pool
+from services.resume_cache import ParsedResumeCache
+from services.resume_jobs import init_parse_worker, parse_document, resume_profile_update
+
+def _resume_file_type(name):
+    """Extension of a resume file, None for files nobody meant to ingest"""
+    base = os.path.basename(name)
+    if not base or base.startswith('.') or '__MACOSX/' in name:
+        # Hidden files and archive metadata, e.g. .DS_Store
+        return None
+    return base.rsplit('.', 1)[1].lower() if '.' in base else ''
+
+def _too_large(size):
+    """Whether a file is over the single upload limit"""
+    return size > Config.MAX_CONTENT_LENGTH
+
+def _iter_directory(path):
+    """Files under a directory, in a stable order"""
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for filename in sorted(files):
+            file_path = os.path.join(root, filename)
+            name = os.path.relpath(file_path, path)
+            if _resume_file_type(name) is None:
+                continue
+            if _too_large(os.path.getsize(file_path)):
+                yield name, None, 'File too large'
+                continue
+            with open(file_path, 'rb') as file:
+                yield name, file.read(), None
+
+def _iter_zip(source):
+    """Members of a zip archive, decompressed one at a time"""
+    with zipfile.ZipFile(source) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or _resume_file_type(info.filename) is None:
+                continue
+            if _too_large(info.file_size):
+                yield info.filename, None, 'File too large'
+                continue
+            try:
+                content = archive.read(info)
+            except Exception as e:
+                yield info.filename, None, f'Error reading archive member: {str(e)}'
+                continue
+            yield info.filename, content, None
+
+def _iter_tar(source):
+    """Members of a tar archive, compressed or not, read one at a time"""
+    if isinstance(source, (str, os.PathLike)):
+        archive = tarfile.open(source, mode='r:*')
+    else:
+        archive = tarfile.open(fileobj=source, mode='r:*')
+    with archive:
+        while True:
+            member = archive.next()
+            if member is None:
+                break
+            # TarFile keeps every member it has read; drop them so memory stays flat
+            archive.members = []
+            if not member.isfile() or _resume_file_type(member.name) is None:
+                continue
+            if _too_large(member.size):
+                yield member.name, None, 'File too large'
+                continue
+            yield member.name, archive.extractfile(member).read(), None
+
+def iter_resume_files(source):
+    """Yield (name, content, error) for every file of a directory, zip or tar archive, one at a time
+    
+    source is a path, or a seekable binary file object holding an archive.
+    """
+    is_path = isinstance(source, (str, os.PathLike))
+    if is_path and os.path.isdir(source):
+        return _iter_directory(source)
+    
+    for is_archive, iter_archive in ((zipfile.is_zipfile, _iter_zip), (tarfile.is_tarfile, _iter_tar)):
+        matched = is_archive(source)
+        if not is_path:
+            # The format checks read from the file object
+            source.seek(0)
+        if matched:
+            return iter_archive(source)
+    raise Exception('Source must be a directory, a zip archive or a tar archive')
+
+class ResumeIngester:
+    """Parse many resumes on a process pool and create or update their job seekers
+    
+    At most max_in_flight files are read ahead of the writes, so memory
+    stays flat however large the source is. Job seekers are matched by the
+    email found in their resume and written batch_size at a time.
+    """
+    
+    def __init__(self, db, workers=None, batch_size=None):
+        self.user_model = UserModel(db)
+        self.resume_cache = ParsedResumeCache(db)
+        self.workers = workers or Config.BULK_INGEST_WORKERS
+        self.batch_size = batch_size or Config.BULK_INGEST_BATCH_SIZE
+        self.max_in_flight = self.workers * 2
+        self.stats = {'files': 0, 'created': 0, 'updated': 0, 'failed': 0, 'cached': 0}
+        self.started = None
+        self._pool = None
+    
+    @property
+    def files_per_second(self):
+        """Files finished per second since ingestion started"""
+        elapsed = time.time() - self.started if self.started else 0
+        return self.stats['files'] / max(elapsed, 1e-9)
+    
+    def summary(self):
+        """Counts so far, with elapsed seconds and files per second"""
+        elapsed = time.time() - self.started if self.started else 0
+        return dict(self.stats, seconds=round(elapsed, 2), files_per_second=round(self.files_per_second, 1))
+    
+    def ingest(self, files):
+        """Yield one outcome per (name, content, error) file, in the order they finish"""
+        self.started = time.time()
+        in_flight = {}
+        batch = []
+        self._pool = worker_pool(self.workers, init_parse_worker)
+        try:
+            for name, content, error in files:
+                future, item = self._submit(name, content, error)
+                in_flight[future] = item
+                if len(in_flight) >= self.max_in_flight:
+                    yield from self._collect_finished(in_flight, batch)
+            
+            while in_flight:
+                yield from self._collect_finished(in_flight, batch)
+            yield from self._flush(batch)
+        finally:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+    
+    def _collect_finished(self, in_flight, batch):
+        """Wait for at least one file to finish parsing and collect every finished one"""
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield from self._collect(in_flight.pop(future), future, batch)
+    
+    def _submit(self, name, content, error):
+        """Start parsing one file; cached parses and unreadable files get an already finished future"""
+        item = {'file': name}
+        file_type = _resume_file_type(name)
+        if error is None and file_type not in Config.ALLOWED_EXTENSIONS:
+            error = 'Unsupported file type'
+        if error is not None:
+            future = Future()
+            future.set_exception(Exception(error))
+            return future, item
+        
+        item['sha256'] = hashlib.sha256(content).hexdigest()
+        item['cache_key'] = self.resume_cache.file_key(item['sha256'], file_type)
+        parsed_data = self.resume_cache.get(item['cache_key'])
+        if parsed_data is not None:
+            item['cached'] = True
+            future = Future()
+            future.set_result(parsed_data)
+            return future, item
+        try:
+            return self._pool.submit(parse_document, content, file_type), item
+        except BrokenProcessPool:
+            # A worker died on an earlier file, whose future reports it; carry on with a fresh pool
+            self._pool.shutdown(wait=False)
+            self._pool = worker_pool(self.workers, init_parse_worker)
+            return self._pool.submit(parse_document, content, file_type), item
+    
+    def _collect(self, item, future, batch):
+        """Queue a parsed file for the next bulk write, flushing when the batch is full"""
+        try:
+            parsed_data = future.result()
+        except Exception as e:
+            yield self._outcome(item, 'failed', error=str(e))
+            return
+        
+        if item.get('cached'):
+            self.stats['cached'] += 1
+        else:
+            self.resume_cache.set(item['cache_key'], parsed_data)
+        
+        email = parsed_data['contact_info'].get('email')
+        if not email:
+            yield self._outcome(item, 'failed', error='No email address found in resume')
+            return
+        
+        update_data = resume_profile_update(parsed_data, os.path.basename(item['file']), item['sha256'])
+        update_data['email'] = email.lower()
+        batch.append((item, update_data))
+        if len(batch) >= self.batch_size:
+            yield from self._flush(batch)
+    
+    def _flush(self, batch):
+        """Upsert a batch of job seekers in one bulk write and report each file"""
+        if not batch:
+            return
+        
+        # The same seeker twice in one unordered write could be inserted twice, keep the last file
+        latest = {}
+        for index, (item, update_data) in enumerate(batch):
+            latest[update_data['email']] = index
+        writes = []
+        for index, (item, update_data) in enumerate(batch):
+            if latest[update_data['email']] == index:
+                writes.append((item, update_data))
+            else:
+                yield self._outcome(item, 'failed', email=update_data['email'],
+                                    error='Superseded by a later file for the same email')
+        batch.clear()
+        
+        try:
+            result = self.user_model.bulk_upsert_job_seekers([update_data for _, update_data in writes])
+            upserted = result.upserted_ids
+            errors = {}
+        except BulkWriteError as e:
+            upserted = {entry['index']: entry['_id'] for entry in e.details.get('upserted', [])}
+            errors = {entry['index']: entry['errmsg'] for entry in e.details.get('writeErrors', [])}
+        
+        for index, (item, update_data) in enumerate(writes):
+            if index in errors:
+                yield self._outcome(item, 'failed', email=update_data['email'], error=errors[index])
+            elif index in upserted:
+                yield self._outcome(item, 'created', email=update_data['email'])
+            else:
+                yield self._outcome(item, 'updated', email=update_data['email'])
+    
+    def _outcome(self, item, status, email=None, error=None):
+        """Count and describe what happened to one file"""
+        self.stats['files'] += 1
+        self.stats[status] += 1
+        return {'file': item['file'], 'status': status, 'email': email, 'error': error}
@@ -0,0 +1,149 @@
+import heapq
+import multiprocessing
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from config import Config
+from services.matcher import JobMatcher, get_matcher
+
+# Matcher loaded once per worker process by _init_worker
+_worker_matcher = None
+
+def worker_pool(workers, initializer):
+    """Process pool whose workers start clean instead of forking the threaded app process
+    
+    A forked child inherits every lock as it was at fork time, so one held
+    by another thread (e.g. a matcher or import lock) would never be released.
+    """
+    method = Config.WORKER_START_METHOD
+    if method not in multiprocessing.get_all_start_methods():
+        # forkserver is POSIX only
+        method = 'spawn'
+    return ProcessPoolExecutor(max_workers=workers, initializer=initializer,
+                               mp_context=multiprocessing.get_context(method))
+
+def _init_worker():
+    """Load taxonomy, stopwords and the TF-IDF model once per worker"""
+    global _worker_matcher
+    _worker_matcher = JobMatcher()
+    _worker_matcher.text_model
+
+def _rank_chunk(jobs, candidate_data, k, min_score):
+    """Rank one chunk of jobs in a worker process"""
+    return _worker_matcher.rank_top_k(jobs, candidate_data, k=k, min_score=min_score)
+
+def _score_applicants_chunk(job_data, candidates):
+    """Score one chunk of applicants in a worker process"""
+    return _worker_matcher.calculate_applicant_scores_batch(job_data, candidates)
+
+def _overall_matches(matcher, groups):
+    """Overall match of every candidate in (job_data, candidates) groups"""
+    return [
+        [match_result['overall_match'] for match_result in matcher.calculate_applicant_scores_batch(job_data, candidates)]
+        for job_data, candidates in groups
+    ]
+
+def _score_applicant_groups(groups):
+    """Score (job_data, candidates) groups in a worker process"""
+    return _overall_matches(_worker_matcher, groups)
+
+class MatcherExecutor:
+    """Spread CPU-bound matcher work over a pool of worker processes"""
+    
+    def __init__(self, workers=None, chunk_size=None):
+        self.workers = Config.MATCHER_POOL_SIZE if workers is None else workers
+        self.chunk_size = chunk_size or Config.MATCHER_CHUNK_SIZE
+        self._pool = None
+        self._lock = threading.Lock()
+    
+    @property
+    def pool(self):
+        """Worker pool, started on first use"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = worker_pool(self.workers, _init_worker)
+            return self._pool
+    
+    def shutdown(self):
+        """Stop the worker processes"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+    
+    def rank_top_k(self, jobs, candidate_data, k=20, min_score=30):
+        """Rank jobs for a candidate across workers and merge the partial top-K lists"""
+        iterator = iter(jobs)
+        first = list(islice(iterator, self.chunk_size))
+        second = list(islice(iterator, self.chunk_size))
+        
+        # Small batches are not worth the inter-process round trip
+        if self.workers <= 1 or not second:
+            return get_matcher().rank_top_k(first + second, candidate_data, k=k, min_score=min_score)
+        
+        heap = []
+        total = 0
+        evaluated = 0
+        seq = 0
+        
+        def merge(future):
+            nonlocal total, evaluated, seq
+            partial = future.result()
+            total += partial['total']
+            evaluated += partial['evaluated']
+            for job, match_result in partial['results']:
+                seq += 1
+                entry = (match_result['overall_match'], -seq, job, match_result)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry[0] > heap[0][0]:
+                    heapq.heapreplace(heap, entry)
+        
+        # Keep a bounded number of chunks in flight so memory stays flat
+        pending = set()
+        chunks = iter(lambda: list(islice(iterator, self.chunk_size)), [])
+        for chunk in [first, second]:
+            pending.add(self.pool.submit(_rank_chunk, chunk, candidate_data, k, min_score))
+        for chunk in chunks:
+            if len(pending) >= self.workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    merge(future)
+            pending.add(self.pool.submit(_rank_chunk, chunk, candidate_data, k, min_score))
+        
+        for future in pending:
+            merge(future)
+        
+        results = [(job, match_result) for _, _, job, match_result in sorted(heap, reverse=True)]
+        return {'results': results, 'total': total, 'evaluated': evaluated}
+    
+    def score_applicants(self, job_data, candidates):
+        """Score one job against many candidates across workers, keeping order"""
+        if self.workers <= 1 or len(candidates) <= self.chunk_size:
+            return get_matcher().calculate_applicant_scores_batch(job_data, candidates)
+        
+        chunks = [candidates[i:i + self.chunk_size] for i in range(0, len(candidates), self.chunk_size)]
+        results = []
+        for partial in self.pool.map(_score_applicants_chunk, [job_data] * len(chunks), chunks):
+            results.extend(partial)
+        return results
+    
+    def submit_applicant_groups(self, groups):
+        """Score (job_data, candidates) groups on a worker, returning a future of overall matches
+        
+        Only the scores travel back, which keeps bulk rescoring cheap on IPC.
+        """
+        if self.workers <= 1:
+            future = Future()
+            future.set_result(_overall_matches(get_matcher(), groups))
+            return future
+        return self.pool.submit(_score_applicant_groups, groups)
+
+_shared_executor = None
+
+def get_executor():
+    """Get the process-wide matcher executor"""
+    global _shared_executor
+    if _shared_executor is None:
+        _shared_executor = MatcherExecutor()
+    return _shared_executor
@@ -1,131 +1,215 @@
+import hashlib
+import heapq
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from itertools import islice
 import numpy as np
+from config import Config
+from services.skills import SKILL_CATEGORIES, get_skill_scanner
+from services.tfidf_model import build_vectorizer, get_text_model
+from utils.startup import get_stop_words, lazy_import
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+pairwise = lazy_import('sklearn.metrics.pairwise')
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# Weights of each component in the overall match
+MATCH_WEIGHTS = {
+    'skills': 0.4,
+    'text': 0.2,
+    'experience': 0.25,
+    'education': 0.15
+}
+
+NON_LETTERS = re.compile(r'[^a-zA-Z\s]')
+
+# Once only letters and whitespace are left, NLTK's word_tokenize just
+# splits on whitespace and breaks up these informal contractions, so the
+# same tokens come from str.split without Punkt
+SPLIT_WORDS = {
+    'cannot': ('can', 'not'), 'gimme': ('gim', 'me'), 'gonna': ('gon', 'na'),
+    'gotta': ('got', 'ta'), 'lemme': ('lem', 'me'), 'wanna': ('wan', 'na')
+}
+
+EXPERIENCE_PATTERN = re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience')
+EDUCATION_KEYWORDS = ['bachelor', 'master', 'phd', 'degree', 'diploma', 'certification']
+
+# Ordinal education levels and the score each one earns
+EDUCATION_LEVEL_SCORES = {4: 100, 3: 85, 2: 70, 1: 50, 0: 30}
+
+# Upskilling priority of a missing skill, from its taxonomy weight
+PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+
+# Experience durations: "2 years 6 months", "18 mos", or "Jan 2019 - Present"
+DURATION_AMOUNT_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\+?\s*(years?|yrs?|months?|mos?)\b')
+DURATION_RANGE_PATTERN = re.compile(
+    r'(?:(?P<start_month>[a-z]{3,9})\.?\s+|(?P<start_month_num>\d{1,2})/)?(?P<start_year>(?:19|20)\d{2})'
+    r'\s*(?:-|–|to)\s*'
+    r'(?:(?:(?P<end_month>[a-z]{3,9})\.?\s+|(?P<end_month_num>\d{1,2})/)?(?P<end_year>(?:19|20)\d{2})'
+    r'|(?P<ongoing>present|current|now|date))'
+)
+MONTHS = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
+
+# Bump when the shape or meaning of stored match_features changes
+JOB_FEATURES_VERSION = 3
+CANDIDATE_FEATURES_VERSION = 3
+
+def skill_priority(weight):
+    """Upskilling priority of a skill with this taxonomy weight"""
+    return 'high' if weight >= 0.9 else 'medium' if weight >= 0.7 else 'low'
+
+def _chunks(items, size):
+    """Yield lists of up to size items from any iterable"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _month_number(name, number):
+    """Get month 1-12 from a month name or number, defaulting to January"""
+    if name and name[:3] in MONTHS:
+        return MONTHS.index(name[:3]) + 1
+    if number and 1 <= int(number) <= 12:
+        return int(number)
+    return 1
+
+def normalize_duration_months(duration, today=None):
+    """Convert an experience duration string into a number of months"""
+    if not duration:
+        return 0
+    
+    text = duration.lower()
+    
+    # Explicit amounts like "2 years 6 months"
+    amounts = DURATION_AMOUNT_PATTERN.findall(text)
+    if amounts:
+        months = 0
+        for amount, unit in amounts:
+            months += float(amount) * (12 if unit.startswith('y') else 1)
+        return int(round(months))
+    
+    # Date ranges like "Jan 2019 - Mar 2021" or "2019 - Present"
+    match = DURATION_RANGE_PATTERN.search(text)
+    if match:
+        start = int(match.group('start_year')) * 12 + _month_number(
+            match.group('start_month'), match.group('start_month_num'))
+        if match.group('ongoing'):
+            today = today or datetime.utcnow()
+            end = today.year * 12 + today.month
+        else:
+            end = int(match.group('end_year')) * 12 + _month_number(
+                match.group('end_month'), match.group('end_month_num'))
+        return max(0, end - start)
+    
+    return 0
 
 class JobMatcher:
-    def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
-        self.vectorizer = TfidfVectorizer(
-            stop_words='english',
-            ngram_range=(1, 2),
-            max_features=1000
-        )
+    def __init__(self, text_model=None):
+        self.stop_words = get_stop_words()
+        
+        # Corpus-level TF-IDF model, fitted offline by `flask rebuild-tfidf`
+        self._text_model = text_model
         
         # Skill categories and their weights
-        self.skill_categories = {
-            'programming_languages': {
-                'python': 1.0, 'java': 1.0, 'javascript': 1.0, 'typescript': 1.0,
-                'c++': 1.0, 'c#': 1.0, 'php': 1.0, 'ruby': 1.0, 'go': 1.0,
-                'rust': 1.0, 'swift': 1.0, 'kotlin': 1.0, 'scala': 1.0
-            },
-            'web_technologies': {
-                'html': 0.8, 'css': 0.8, 'react': 1.0, 'angular': 1.0, 'vue': 1.0,
-                'node.js': 1.0, 'express': 0.9, 'django': 1.0, 'flask': 1.0,
-                'spring': 1.0, 'laravel': 1.0, 'rails': 1.0, 'bootstrap': 0.7
-            },
-            'databases': {
-                'mysql': 1.0, 'postgresql': 1.0, 'mongodb': 1.0, 'redis': 0.9,
-                'sqlite': 0.8, 'oracle': 1.0, 'sql server': 1.0, 'cassandra': 0.9
-            },
-            'cloud_platforms': {
-                'aws': 1.0, 'azure': 1.0, 'google cloud': 1.0, 'docker': 0.9,
-                'kubernetes': 0.9, 'terraform': 0.8, 'jenkins': 0.8
-            },
-            'data_science': {
-                'machine learning': 1.0, 'artificial intelligence': 1.0,
-                'data science': 1.0, 'pandas': 0.9, 'numpy': 0.9,
-                'scikit-learn': 0.9, 'tensorflow': 0.9, 'pytorch': 0.9,
-                'r': 0.8, 'matplotlib': 0.7, 'seaborn': 0.7
-            },
-            'mobile_development': {
-                'android': 1.0, 'ios': 1.0, 'react native': 1.0, 'flutter': 1.0,
-                'xamarin': 0.8, 'ionic': 0.7
-            },
-            'soft_skills': {
-                'leadership': 0.8, 'communication': 0.8, 'teamwork': 0.7,
-                'problem solving': 0.9, 'analytical': 0.8, 'creative': 0.6,
-                'time management': 0.7, 'project management': 0.8
-            }
-        }
+        self.skill_categories = SKILL_CATEGORIES
+        self.skill_scanner = get_skill_scanner()
+        
+        # Preprocessed text by content hash, so repeated descriptions are tokenized once
+        self.preprocess_cache_size = Config.PREPROCESS_CACHE_SIZE
+        self.preprocess_hits = 0
+        self.preprocess_misses = 0
+        self._preprocessed = OrderedDict()
+        self._preprocess_lock = threading.Lock()
+    
+    @property
+    def text_model(self):
+        """TF-IDF model in use, picking up rebuilt models from disk"""
+        return self._text_model or get_text_model()
     
     def preprocess_text(self, text):
         """Preprocess text for matching"""
         if not text:
             return ""
         
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        with self._preprocess_lock:
+            cached = self._preprocessed.get(key)
+            if cached is not None:
+                self._preprocessed.move_to_end(key)
+                self.preprocess_hits += 1
+                return cached
+            self.preprocess_misses += 1
+        
+        processed = self._preprocess_text(text)
+        
+        if self.preprocess_cache_size > 0:
+            with self._preprocess_lock:
+                self._preprocessed[key] = processed
+                while len(self._preprocessed) > self.preprocess_cache_size:
+                    self._preprocessed.popitem(last=False)
+        return processed
+    
+    def _preprocess_text(self, text):
+        """Lowercase, keep letters, tokenize and drop stop words"""
         # Convert to lowercase
         text = text.lower()
         
         # Remove special characters and digits
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
+        text = NON_LETTERS.sub('', text)
         
         # Tokenize and remove stop words
-        tokens = word_tokenize(text)
-        tokens = [token for token in tokens if token not in self.stop_words]
+        tokens = []
+        for word in text.split():
+            for token in SPLIT_WORDS.get(word, (word,)):
+                if token not in self.stop_words:
+                    tokens.append(token)
         
         return ' '.join(tokens)
     
+    def preprocess_cache_info(self):
+        """Hit and miss counts of the preprocessed text cache"""
+        with self._preprocess_lock:
+            return {
+                'hits': self.preprocess_hits,
+                'misses': self.preprocess_misses,
+                'size': len(self._preprocessed),
+                'max_size': self.preprocess_cache_size
+            }
+    
+    def preprocess_cache_clear(self):
+        """Empty the preprocessed text cache and reset its counts"""
+        with self._preprocess_lock:
+            self._preprocessed.clear()
+            self.preprocess_hits = 0
+            self.preprocess_misses = 0
+    
     def extract_skills_from_text(self, text):
         """Extract skills from job description or resume text"""
         if not text:
             return []
         
-        text_lower = text.lower()
-        found_skills = []
-        
-        # Extract skills from all categories
-        for category, skills in self.skill_categories.items():
-            for skill, weight in skills.items():
-                if skill.lower() in text_lower:
-                    found_skills.append({
-                        'skill': skill,
-                        'category': category,
-                        'weight': weight
-                    })
-        
-        return found_skills
+        # One pass over the text regardless of taxonomy size
+        return self.skill_scanner.extract(text)
     
     def calculate_skill_match_percentage(self, job_skills, candidate_skills):
         """Calculate skill match percentage between job and candidate"""
         if not job_skills or not candidate_skills:
             return 0
         
-        # Convert to dictionaries for easier lookup
-        job_skill_dict = {skill['skill'].lower(): skill for skill in job_skills}
-        candidate_skill_dict = {skill['skill'].lower(): skill for skill in candidate_skills}
-        
-        total_weight = 0
-        matched_weight = 0
-        
-        # Calculate weighted match
-        for skill_name, job_skill in job_skill_dict.items():
-            total_weight += job_skill['weight']
-            
-            if skill_name in candidate_skill_dict:
-                candidate_skill = candidate_skill_dict[skill_name]
-                # Use the minimum weight to avoid over-weighting
-                matched_weight += min(job_skill['weight'], candidate_skill['weight'])
+        # Both sides carry taxonomy weights, so the minimum of the two weights
+        # is the shared skill's own weight
+        bitsets = self.skill_scanner.bitsets
+        job_bits = bitsets.pack(self.skill_scanner.ids_for(skill['skill'].lower() for skill in job_skills))
+        candidate_bits = bitsets.pack(self.skill_scanner.ids_for(skill['skill'].lower() for skill in candidate_skills))
         
+        total_weight = bitsets.weight(job_bits)
         if total_weight == 0:
             return 0
         
-        match_percentage = (matched_weight / total_weight) * 100
-        return round(match_percentage, 2)
+        match_percentage = (bitsets.overlap(job_bits, candidate_bits) / total_weight) * 100
+        return round(float(match_percentage), 2)
     
     def calculate_text_similarity(self, job_description, candidate_profile):
         """Calculate text similarity using TF-IDF and cosine similarity"""
@@ -139,41 +223,48 @@ class JobMatcher:
         if not job_text or not candidate_text:
             return 0
         
+        text_model = self.text_model
         try:
-            # Create TF-IDF vectors
-            texts = [job_text, candidate_text]
-            tfidf_matrix = self.vectorizer.fit_transform(texts)
+            if text_model is None:
+                # No corpus model built yet, fall back to fitting on the pair
+                tfidf_matrix = build_vectorizer().fit_transform([job_text, candidate_text])
+                similarity = pairwise.cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            else:
+                # Vectors are L2-normalised, so the dot product is the cosine
+                tfidf_matrix = text_model.transform([job_text, candidate_text])
+                similarity = tfidf_matrix[0].multiply(tfidf_matrix[1]).sum()
             
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            
-            return round(similarity * 100, 2)
+            return round(float(similarity) * 100, 2)
         except Exception as e:
             print(f"Error calculating text similarity: {e}")
             return 0
     
+    def get_required_years(self, job_requirements):
+        """Get required years of experience from job description, or None"""
+        required_years = EXPERIENCE_PATTERN.findall(job_requirements.lower())
+        return int(required_years[0]) if required_years else None
+    
+    def get_experience_months(self, candidate_experience):
+        """Get candidate's total experience in months"""
+        return sum(normalize_duration_months(exp.get('duration', '')) for exp in candidate_experience)
+    
+    def get_candidate_years(self, candidate_experience):
+        """Get candidate's total years of experience"""
+        return self.get_experience_months(candidate_experience) / 12
+    
     def calculate_experience_match(self, job_requirements, candidate_experience):
         """Calculate experience match based on years and relevance"""
         if not job_requirements or not candidate_experience:
             return 0
         
         # Extract required experience years from job description
-        exp_pattern = r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'
-        required_years = re.findall(exp_pattern, job_requirements.lower())
+        required_years = self.get_required_years(job_requirements)
         
-        if not required_years:
+        if required_years is None:
             return 50  # Default score if no specific requirement
         
-        required_years = int(required_years[0])
-        
         # Calculate candidate's total experience
-        candidate_years = 0
-        for exp in candidate_experience:
-            # Simple extraction of years from duration
-            duration = exp.get('duration', '')
-            years = re.findall(r'(\d+)\s*years?', duration.lower())
-            if years:
-                candidate_years += int(years[0])
+        candidate_years = self.get_candidate_years(candidate_experience)
         
         # Calculate match percentage
         if candidate_years >= required_years:
@@ -181,80 +272,343 @@ class JobMatcher:
         else:
             return (candidate_years / required_years) * 100
     
-    def calculate_education_match(self, job_requirements, candidate_education):
-        """Calculate education match"""
-        if not job_requirements or not candidate_education:
-            return 50  # Default score
-        
+    def requires_education(self, job_requirements):
+        """Check if job description asks for a specific education"""
         job_text = job_requirements.lower()
-        education_keywords = ['bachelor', 'master', 'phd', 'degree', 'diploma', 'certification']
-        
-        # Check if job requires specific education
-        requires_education = any(keyword in job_text for keyword in education_keywords)
-        
-        if not requires_education:
-            return 50  # No specific education requirement
-        
-        # Check candidate's education level
+        return any(keyword in job_text for keyword in EDUCATION_KEYWORDS)
+    
+    def get_education_level(self, candidate_education):
+        """Get candidate's highest education level as an ordinal"""
         candidate_degrees = [edu.get('degree', '').lower() for edu in candidate_education]
         candidate_text = ' '.join(candidate_degrees)
         
         # Simple scoring based on degree level
         if 'phd' in candidate_text or 'doctorate' in candidate_text:
-            return 100
+            return 4
         elif 'master' in candidate_text:
-            return 85
+            return 3
         elif 'bachelor' in candidate_text or 'b.s.' in candidate_text or 'b.a.' in candidate_text:
-            return 70
+            return 2
         elif 'diploma' in candidate_text or 'certificate' in candidate_text:
-            return 50
+            return 1
         else:
-            return 30
+            return 0
+    
+    def get_education_score(self, candidate_education):
+        """Score candidate's highest education level"""
+        return EDUCATION_LEVEL_SCORES[self.get_education_level(candidate_education)]
+    
+    def calculate_education_match(self, job_requirements, candidate_education):
+        """Calculate education match"""
+        if not job_requirements or not candidate_education:
+            return 50  # Default score
+        
+        # Check if job requires specific education
+        if not self.requires_education(job_requirements):
+            return 50  # No specific education requirement
+        
+        # Check candidate's education level
+        return self.get_education_score(candidate_education)
+    
+    def build_job_features(self, description):
+        """Derive everything the matcher needs from a job description"""
+        description = description or ''
+        skill_ids = self.skill_scanner.extract_ids(description)
+        
+        return {
+            'version': JOB_FEATURES_VERSION,
+            'has_description': bool(description),
+            'skills': [self.skill_scanner.entries_by_id[i]['skill'].lower() for i in skill_ids],
+            'skill_ids': skill_ids,
+            'required_years': self.get_required_years(description) if description else None,
+            'requires_education': bool(description) and self.requires_education(description),
+            'tokens': self.preprocess_text(description)
+        }
+    
+    def get_job_features(self, job_data):
+        """Get stored job features, rebuilding them when missing or stale"""
+        features = job_data.get('match_features')
+        if not features or features.get('version') != JOB_FEATURES_VERSION:
+            features = self.build_job_features(job_data.get('description', ''))
+        return features
+    
+    def build_candidate_features(self, candidate_data, updated_at=None):
+        """Derive everything the matcher needs from candidate data"""
+        experience = candidate_data.get('experience', [])
+        education = candidate_data.get('education', [])
+        skill_ids = self.skill_scanner.extract_ids(candidate_data.get('skills_text', ''))
+        
+        return {
+            'version': CANDIDATE_FEATURES_VERSION,
+            'updated_at': updated_at,
+            'skills': [
+                {'skill': entry['skill'].lower(), 'weight': entry['weight']}
+                for entry in (self.skill_scanner.entries_by_id[i] for i in skill_ids)
+            ],
+            'skill_ids': skill_ids,
+            'experience_months': self.get_experience_months(experience) if experience else None,
+            'education_level': self.get_education_level(education) if education else None,
+            'tokens': self.preprocess_text(candidate_data.get('profile_text', ''))
+        }
+    
+    def get_candidate_features(self, candidate_data):
+        """Get candidate features, rebuilding them when missing or stale"""
+        features = candidate_data.get('features')
+        if not features or features.get('version') != CANDIDATE_FEATURES_VERSION:
+            features = self.build_candidate_features(candidate_data)
+        return features
+    
+    def build_candidate_query(self, candidate_data):
+        """Preprocessed text describing a candidate, for searching job vectors"""
+        positions = ' '.join(exp.get('position', '') for exp in candidate_data.get('experience', []))
+        return self.preprocess_text(' '.join([
+            candidate_data.get('skills_text', ''),
+            positions,
+            candidate_data.get('profile_text', '')
+        ]))
+    
+    def build_candidate_data(self, job_seeker):
+        """Build matcher input from a job seeker profile"""
+        candidate_data = {
+            'skills_text': ', '.join(job_seeker.get('skills', [])),
+            'profile_text': f"{job_seeker.get('first_name', '')} {job_seeker.get('last_name', '')}",
+            'experience': job_seeker.get('experience', []),
+            'education': job_seeker.get('education', [])
+        }
+        
+        # Trust the stored features only if they belong to this profile version
+        features = job_seeker.get('match_features')
+        if (features and features.get('version') == CANDIDATE_FEATURES_VERSION
+                and features.get('updated_at') == job_seeker.get('updated_at')):
+            candidate_data['features'] = features
+        return candidate_data
     
     def calculate_overall_match(self, job_data, candidate_data):
         """Calculate overall match percentage"""
-        # Extract skills
-        job_skills = self.extract_skills_from_text(job_data.get('description', ''))
-        candidate_skills = self.extract_skills_from_text(candidate_data.get('skills_text', ''))
-        
-        # Calculate individual scores
-        skill_score = self.calculate_skill_match_percentage(job_skills, candidate_skills)
-        text_score = self.calculate_text_similarity(
-            job_data.get('description', ''),
-            candidate_data.get('profile_text', '')
-        )
-        experience_score = self.calculate_experience_match(
-            job_data.get('description', ''),
-            candidate_data.get('experience', [])
-        )
-        education_score = self.calculate_education_match(
-            job_data.get('description', ''),
-            candidate_data.get('education', [])
+        scores = self._score_matrix([job_data], [candidate_data])
+        return self._match_result(scores, 0, 0)
+    
+    def calculate_overall_match_batch(self, jobs, candidate_data):
+        """Calculate overall match of one candidate against many jobs"""
+        if not jobs:
+            return []
+        
+        # Candidate features are built once for the whole batch
+        scores = self._score_matrix(jobs, [candidate_data])
+        return [self._match_result(scores, i, 0) for i in range(len(jobs))]
+    
+    def calculate_applicant_scores_batch(self, job_data, candidates):
+        """Calculate overall match of one job against many candidates"""
+        if not candidates:
+            return []
+        
+        # Job features are built once for the whole batch
+        scores = self._score_matrix([job_data], candidates)
+        return [self._match_result(scores, 0, j) for j in range(len(candidates))]
+    
+    def rank_top_k(self, jobs, candidate_data, k=20, min_score=30, chunk_size=256):
+        """Keep the k best matching jobs for a candidate using O(k) memory
+        
+        Skills, experience and education are cheap to score in bulk, so each
+        chunk is scored on those first. Text similarity can add at most its
+        weight, and nothing when the texts share no word, so jobs whose upper
+        bound cannot beat the current k-th best skip full scoring.
+        """
+        candidate_features = [self.get_candidate_features(candidate_data)]
+        candidate_terms = set(candidate_features[0]['tokens'].split())
+        text_bound = 100 * MATCH_WEIGHTS['text']
+        heap = []
+        total = 0
+        evaluated = 0
+        seq = 0
+        
+        for chunk in _chunks(jobs, chunk_size):
+            job_features = [self.get_job_features(job) for job in chunk]
+            scores = self._partial_score_matrix(job_features, candidate_features)
+            lower = scores['partial_match'][:, 0]
+            shares_terms = np.array([
+                bool(candidate_terms) and not candidate_terms.isdisjoint(features['tokens'].split())
+                for features in job_features
+            ])
+            upper = lower + np.where(shares_terms, text_bound, 0.0)
+            
+            # Anything below the current k-th best cannot enter the heap
+            threshold = heap[0][0] if len(heap) >= k else -1
+            survivors = []
+            for i in np.argsort(-upper, kind='stable'):
+                if upper[i] + 0.01 < min_score:
+                    continue
+                if upper[i] + 0.01 < threshold and lower[i] >= min_score:
+                    # Cannot make the top k but certainly counts towards total
+                    total += 1
+                    continue
+                survivors.append(int(i))
+            
+            if not survivors:
+                continue
+            
+            # Text similarity only where the texts overlap, it is zero elsewhere
+            scores = self._subset_scores(scores, survivors)
+            text_rows = [row for row, i in enumerate(survivors) if shares_terms[i]]
+            scores['text_similarity'] = np.zeros((len(survivors), 1))
+            if text_rows:
+                evaluated += len(text_rows)
+                scores['text_similarity'][text_rows] = self._text_score_matrix(
+                    [job_features[survivors[row]]['tokens'] for row in text_rows],
+                    [candidate_features[0]['tokens']]
+                )
+            scores['overall_match'] = self._overall_scores(scores)
+            
+            for row, i in enumerate(survivors):
+                overall = scores['overall_match'][row, 0]
+                if overall < min_score:
+                    continue
+                total += 1
+                
+                seq += 1
+                if len(heap) < k:
+                    heapq.heappush(heap, (overall, -seq, chunk[i], self._match_result(scores, row, 0)))
+                elif overall > heap[0][0]:
+                    heapq.heapreplace(heap, (overall, -seq, chunk[i], self._match_result(scores, row, 0)))
+        
+        results = [(job, match_result) for _, _, job, match_result in sorted(heap, reverse=True)]
+        return {'results': results, 'total': total, 'evaluated': evaluated}
+    
+    def _score_matrix(self, jobs, candidates):
+        """Score every job against every candidate with array operations"""
+        job_features = [self.get_job_features(job) for job in jobs]
+        candidate_features = [self.get_candidate_features(candidate) for candidate in candidates]
+        return self.score_feature_matrix(job_features, candidate_features)
+    
+    def score_feature_matrix(self, job_features, candidate_features, job_vectors=None, candidate_vectors=None):
+        """Score every job against every candidate from prebuilt features
+        
+        Callers scoring the same rows repeatedly can pass their TF-IDF
+        vectors from vectorize() instead of having them transformed again.
+        """
+        scores = self._partial_score_matrix(job_features, candidate_features)
+        
+        # Text: cosine similarity of TF-IDF vectors
+        scores['text_similarity'] = self._text_score_matrix(
+            [features['tokens'] for features in job_features],
+            [features['tokens'] for features in candidate_features],
+            job_vectors,
+            candidate_vectors
         )
+        scores['overall_match'] = self._overall_scores(scores)
+        return scores
+    
+    def vectorize(self, feature_rows):
+        """TF-IDF vectors of job or candidate features, None without a corpus model"""
+        text_model = self.text_model
+        if text_model is None:
+            return None
+        return text_model.transform([features['tokens'] for features in feature_rows])
+    
+    def _partial_score_matrix(self, job_features, candidate_features):
+        """Score skills, experience and education, everything but text"""
+        has_description = np.array([features['has_description'] for features in job_features])
+        
+        # Skills: weighted overlap of job and candidate skill bitsets. Skill
+        # weights come from the same taxonomy on both sides, so the minimum
+        # of the two weights is just the shared skill's weight
+        bitsets = self.skill_scanner.bitsets
+        job_bits = bitsets.pack_many([features['skill_ids'] for features in job_features])
+        candidate_bits = bitsets.pack_many([features['skill_ids'] for features in candidate_features])
+        
+        matched_weight = bitsets.overlap_matrix(job_bits, candidate_bits)
+        total_weight = bitsets.weight(job_bits).reshape(-1, 1)
+        has_skills = candidate_bits.any(axis=1).reshape(1, -1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skill_scores = np.where(
+                (total_weight > 0) & has_skills,
+                np.round(matched_weight / total_weight * 100, 2),
+                0.0
+            )
+        
+        # Experience: required years per job against total years per candidate
+        required_years = np.array([features['required_years'] for features in job_features], dtype=float)
+        experience_months = np.array([features['experience_months'] for features in candidate_features], dtype=float)
+        has_experience = ~np.isnan(experience_months)
+        candidate_years = np.nan_to_num(experience_months) / 12
+        
+        required = required_years.reshape(-1, 1)
+        years = candidate_years.reshape(1, -1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            experience_scores = np.where(years >= required, 100.0, years / required * 100)
+        experience_scores = np.where(np.isnan(required), 50.0, experience_scores)
+        experience_scores = np.where(has_description.reshape(-1, 1) & has_experience.reshape(1, -1),
+                                     experience_scores, 0.0)
+        
+        # Education: candidate level where the job asks for one, 50 otherwise
+        requires_education = np.array([features['requires_education'] for features in job_features])
+        education_levels = np.array([
+            EDUCATION_LEVEL_SCORES[features['education_level']] if features['education_level'] is not None else 50
+            for features in candidate_features
+        ], dtype=float)
+        education_scores = np.where(requires_education.reshape(-1, 1), education_levels.reshape(1, -1), 50.0)
         
-        # Weighted average
-        weights = {
-            'skills': 0.4,
-            'text': 0.2,
-            'experience': 0.25,
-            'education': 0.15
+        return {
+            'partial_match': (
+                skill_scores * MATCH_WEIGHTS['skills'] +
+                experience_scores * MATCH_WEIGHTS['experience'] +
+                education_scores * MATCH_WEIGHTS['education']
+            ),
+            'skill_match': skill_scores,
+            'experience_match': experience_scores,
+            'education_match': education_scores,
+            'job_bits': job_bits,
+            'candidate_bits': candidate_bits
         }
+    
+    def _subset_scores(self, scores, job_rows):
+        """Keep only the given job rows of a score matrix"""
+        subset = dict(scores)
+        for key in ('partial_match', 'skill_match', 'experience_match', 'education_match'):
+            subset[key] = scores[key][job_rows]
+        subset['job_bits'] = scores['job_bits'][job_rows]
+        return subset
+    
+    def _overall_scores(self, scores):
+        """Weighted average of the component score matrices"""
+        return np.round(scores['partial_match'] + scores['text_similarity'] * MATCH_WEIGHTS['text'], 2)
+    
+    def _text_score_matrix(self, job_texts, candidate_texts, job_vectors=None, candidate_vectors=None):
+        """Cosine similarity (0-100) of every job text against every candidate text"""
+        scores = np.zeros((len(job_texts), len(candidate_texts)))
+        text_model = self.text_model
         
-        overall_score = (
-            skill_score * weights['skills'] +
-            text_score * weights['text'] +
-            experience_score * weights['experience'] +
-            education_score * weights['education']
-        )
+        try:
+            if text_model is None:
+                # No corpus model built yet, fall back to fitting on each pair
+                for i, job_text in enumerate(job_texts):
+                    for j, candidate_text in enumerate(candidate_texts):
+                        if job_text and candidate_text:
+                            tfidf_matrix = build_vectorizer().fit_transform([job_text, candidate_text])
+                            scores[i, j] = pairwise.cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            else:
+                if job_vectors is None:
+                    job_vectors = text_model.transform(job_texts)
+                if candidate_vectors is None:
+                    candidate_vectors = text_model.transform(candidate_texts)
+                scores = (job_vectors @ candidate_vectors.T).toarray()
+        except Exception as e:
+            print(f"Error calculating text similarity: {e}")
+            return np.zeros((len(job_texts), len(candidate_texts)))
         
+        return np.round(scores * 100, 2)
+    
+    def _match_result(self, scores, job_index, candidate_index):
+        """Build a calculate_overall_match style result from a score matrix"""
+        bitsets = self.skill_scanner.bitsets
+        shared = np.bitwise_and(scores['job_bits'][job_index], scores['candidate_bits'][candidate_index])
         return {
-            'overall_match': round(overall_score, 2),
-            'skill_match': skill_score,
-            'text_similarity': text_score,
-            'experience_match': experience_score,
-            'education_match': education_score,
-            'matched_skills': [skill['skill'] for skill in job_skills 
-                             if skill['skill'].lower() in [s['skill'].lower() for s in candidate_skills]]
+            'overall_match': float(scores['overall_match'][job_index, candidate_index]),
+            'skill_match': float(scores['skill_match'][job_index, candidate_index]),
+            'text_similarity': float(scores['text_similarity'][job_index, candidate_index]),
+            'experience_match': float(scores['experience_match'][job_index, candidate_index]),
+            'education_match': float(scores['education_match'][job_index, candidate_index]),
+            'matched_skills': [self.skill_scanner.entries_by_id[i]['skill'] for i in bitsets.ids(shared)]
         }
     
     def get_upskilling_recommendations(self, job_skills, candidate_skills):
@@ -262,18 +616,27 @@ class JobMatcher:
         if not job_skills or not candidate_skills:
             return []
         
-        candidate_skill_names = [skill['skill'].lower() for skill in candidate_skills]
+        candidate_skill_names = {skill['skill'].lower() for skill in candidate_skills}
         missing_skills = []
         
         for skill in job_skills:
             if skill['skill'].lower() not in candidate_skill_names:
-                missing_skills.append({
+                missing_skills.append((skill['weight'], {
                     'skill': skill['skill'],
                     'category': skill['category'],
-                    'priority': 'high' if skill['weight'] >= 0.9 else 'medium' if skill['weight'] >= 0.7 else 'low'
-                })
+                    'priority': skill_priority(skill['weight'])
+                }))
         
-        # Sort by priority and weight
-        missing_skills.sort(key=lambda x: (x['priority'] == 'high', x['priority'] == 'medium', -job_skills[next(i for i, s in enumerate(job_skills) if s['skill'].lower() == x['skill'].lower())]['weight']))
+        # Highest priority first, then by weight
+        missing_skills.sort(key=lambda item: (PRIORITY_ORDER[item[1]['priority']], -item[0]))
         
-        return missing_skills[:10]  # Return top 10 recommendations
\ No newline at end of file
+        return [skill for _, skill in missing_skills[:10]]  # Return top 10 recommendations
+
+_shared_matcher = None
+
+def get_matcher():
+    """Get the process-wide matcher instance"""
+    global _shared_matcher
+    if _shared_matcher is None:
+        _shared_matcher = JobMatcher()
+    return _shared_matcher
\ No newline at end of file
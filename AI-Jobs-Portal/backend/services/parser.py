@@ -1,27 +1,42 @@
-import PyPDF2
-import docx
+import codecs
+import io
+import os
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import json
+import unicodedata
+from contextlib import contextmanager
+from itertools import islice
+from config import Config
+from utils.startup import get_stop_words, lazy_import
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+PyPDF2 = lazy_import('PyPDF2')
+docx = lazy_import('docx')
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# Bump when extraction or parsing changes so cached results are parsed again
+PARSER_VERSION = 1
+
+def normalize_text(text):
+    """Canonical form of pasted resume text: NFC, Unix newlines, no trailing whitespace"""
+    text = unicodedata.normalize('NFC', text).replace('\r\n', '\n').replace('\r', '\n')
+    return '\n'.join(line.rstrip() for line in text.split('\n')).rstrip()
+
+@contextmanager
+def open_binary(source):
+    """Binary file object for a path, a bytes buffer or an open file-like object
+    
+    Only files opened here are closed here; file-like objects stay with the caller.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield file
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        yield io.BytesIO(source)
+    else:
+        yield source
 
 class ResumeParser:
     def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
+        self.stop_words = get_stop_words()
         self.skill_keywords = [
             'python', 'java', 'javascript', 'react', 'node.js', 'angular', 'vue.js',
             'html', 'css', 'bootstrap', 'sql', 'mongodb', 'mysql', 'postgresql',
@@ -34,47 +49,93 @@ class ResumeParser:
             'problem solving', 'analytical', 'creative', 'teamwork', 'time management'
         ]
     
-    def extract_text_from_pdf(self, file_path):
-        """Extract text from PDF file"""
+    def iter_pdf_pages(self, source, max_pages=None):
+        """Yield the text of each PDF page lazily, reading at most max_pages"""
+        max_pages = max_pages or Config.RESUME_MAX_PAGES
         try:
-            with open(file_path, 'rb') as file:
+            with open_binary(source) as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-                return text
+                for page in islice(pdf_reader.pages, max_pages):
+                    yield page.extract_text() or ''
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
     
-    def extract_text_from_docx(self, file_path):
-        """Extract text from DOCX file"""
+    def iter_docx_paragraphs(self, source):
+        """Yield DOCX paragraph lines lazily"""
         try:
-            doc = docx.Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            with open_binary(source) as file:
+                doc = docx.Document(file)
+                for paragraph in doc.paragraphs:
+                    yield paragraph.text + "\n"
         except Exception as e:
             raise Exception(f"Error reading DOCX: {str(e)}")
     
-    def extract_text_from_txt(self, file_path):
-        """Extract text from TXT file"""
+    def iter_txt_chunks(self, source, chunk_size=65536):
+        """Yield a UTF-8 TXT file in chunks instead of reading it whole"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
+            # Decode as text mode would, universal newlines included
+            decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+            with open_binary(source) as file:
+                for block in iter(lambda: file.read(chunk_size), b''):
+                    chunk = decoder.decode(block)
+                    if chunk:
+                        yield chunk
+            tail = decoder.decode(b'', final=True)
+            if tail:
+                yield tail
         except Exception as e:
             raise Exception(f"Error reading TXT: {str(e)}")
     
-    def extract_text(self, file_path, file_type):
-        """Extract text based on file type"""
-        if file_type.lower() == 'pdf':
-            return self.extract_text_from_pdf(file_path)
-        elif file_type.lower() in ['doc', 'docx']:
-            return self.extract_text_from_docx(file_path)
-        elif file_type.lower() == 'txt':
-            return self.extract_text_from_txt(file_path)
+    def limit_chars(self, chunks, max_chars=None):
+        """Pass chunks through until max_chars, then stop reading the source"""
+        max_chars = max_chars or Config.RESUME_MAX_CHARS
+        remaining = max_chars
+        try:
+            for chunk in chunks:
+                if len(chunk) >= remaining:
+                    yield chunk[:remaining]
+                    return
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            # Closing the source releases its file before the caller moves on
+            close = getattr(chunks, 'close', None)
+            if close:
+                close()
+    
+    def iter_text(self, source, file_type, max_pages=None, max_chars=None):
+        """Stream resume text in pieces, bounded by the page and character caps
+        
+        source is a file path, a bytes buffer or a binary file-like object
+        such as an upload's stream.
+        """
+        file_type = file_type.lower()
+        if file_type == 'pdf':
+            chunks = self.iter_pdf_pages(source, max_pages)
+        elif file_type in ['doc', 'docx']:
+            chunks = self.iter_docx_paragraphs(source)
+        elif file_type == 'txt':
+            chunks = self.iter_txt_chunks(source)
         else:
             raise Exception("Unsupported file type")
+        return self.limit_chars(chunks, max_chars)
+    
+    def extract_text_from_pdf(self, file_path):
+        """Extract text from PDF file"""
+        # One join at the end instead of copying the text once per page
+        return ''.join(self.iter_text(file_path, 'pdf'))
+    
+    def extract_text_from_docx(self, file_path):
+        """Extract text from DOCX file"""
+        return ''.join(self.iter_text(file_path, 'docx'))
+    
+    def extract_text_from_txt(self, file_path):
+        """Extract text from TXT file"""
+        return ''.join(self.iter_text(file_path, 'txt'))
+    
+    def extract_text(self, source, file_type):
+        """Extract text based on file type, from a path, bytes or a file-like object"""
+        return ''.join(self.iter_text(source, file_type))
     
     def extract_contact_info(self, text):
         """Extract contact information from resume text"""
@@ -191,30 +252,35 @@ class ResumeParser:
         
         return education
     
-    def parse_resume(self, file_path, file_type):
+    def parse_text(self, text):
+        """Extract name, contact info, skills, experience and education from resume text"""
+        # Extract information
+        contact_info = self.extract_contact_info(text)
+        skills = self.extract_skills(text)
+        experience = self.extract_experience(text)
+        education = self.extract_education(text)
+        
+        # Extract name (first line usually contains name)
+        lines = text.split('\n')
+        name = lines[0].strip() if lines else ""
+        
+        return {
+            'name': name,
+            'contact_info': contact_info,
+            'skills': skills,
+            'experience': experience,
+            'education': education
+        }
+    
+    def parse_resume(self, source, file_type):
         """Main method to parse resume and extract all information"""
         try:
             # Extract text
-            text = self.extract_text(file_path, file_type)
-            
-            # Extract information
-            contact_info = self.extract_contact_info(text)
-            skills = self.extract_skills(text)
-            experience = self.extract_experience(text)
-            education = self.extract_education(text)
-            
-            # Extract name (first line usually contains name)
-            lines = text.split('\n')
-            name = lines[0].strip() if lines else ""
+            text = self.extract_text(source, file_type)
             
-            return {
-                'name': name,
-                'contact_info': contact_info,
-                'skills': skills,
-                'experience': experience,
-                'education': education,
-                'raw_text': text
-            }
+            parsed_data = self.parse_text(text)
+            parsed_data['raw_text'] = text
+            return parsed_data
             
         except Exception as e:
             raise Exception(f"Error parsing resume: {str(e)}")
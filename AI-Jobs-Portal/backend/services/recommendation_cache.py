@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from config import Config
+
+class MemoryCacheBackend:
+    """In-process LRU cache whose entries expire after ttl seconds"""
+    
+    def __init__(self, max_entries=None, ttl=None):
+        self.max_entries = max_entries or Config.REC_CACHE_MAX_ENTRIES
+        self.ttl = ttl or Config.REC_CACHE_TTL
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Get a live entry, or None"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+    
+    def set(self, key, entry):
+        """Store an entry, evicting the least recently used past max_entries"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def delete(self, key):
+        """Drop an entry"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+class MongoCacheBackend:
+    """Cache shared by every worker, kept in a Mongo collection"""
+    
+    def __init__(self, db, ttl=None):
+        self.collection = db.recommendation_cache
+        self.ttl = ttl or Config.REC_CACHE_TTL
+    
+    def ensure_indexes(self):
+        """Let Mongo remove expired entries"""
+        self.collection.create_index('cached_at', expireAfterSeconds=self.ttl)
+    
+    def get(self, key):
+        """Get a live entry, or None"""
+        # The TTL monitor only runs every minute, so check the age here too
+        document = self.collection.find_one({
+            '_id': key,
+            'cached_at': {'$gt': datetime.utcnow() - timedelta(seconds=self.ttl)}
+        })
+        return document['entry'] if document else None
+    
+    def set(self, key, entry):
+        """Store an entry"""
+        self.collection.replace_one(
+            {'_id': key},
+            {'_id': key, 'entry': entry, 'cached_at': datetime.utcnow()},
+            upsert=True
+        )
+    
+    def delete(self, key):
+        """Drop an entry"""
+        self.collection.delete_one({'_id': key})
+
+class RecommendationCache:
+    """Per-seeker recommendation results, tagged with the inputs they came from
+    
+    An entry is only served while the seeker's profile updated_at and the
+    job catalog version match the ones it was computed with. Concurrent
+    misses for one seeker in this process share a single computation.
+    """
+    
+    def __init__(self, db, backend=None):
+        backend = backend or Config.REC_CACHE_BACKEND
+        if backend == 'mongo':
+            self.backend = MongoCacheBackend(db)
+        elif backend == 'memory':
+            self.backend = MemoryCacheBackend()
+        else:
+            self.backend = None
+        
+        self.hits = 0
+        self.misses = 0
+        self._inflight = {}
+        self._lock = threading.Lock()
+    
+    def ensure_indexes(self):
+        """Create indexes the backend needs"""
+        if isinstance(self.backend, MongoCacheBackend):
+            self.backend.ensure_indexes()
+    
+    def get_or_compute(self, seeker_id, profile_version, catalog_version, compute):
+        """Get cached recommendations, computing them once if missing or stale"""
+        if self.backend is None:
+            return compute()
+        
+        key = str(seeker_id)
+        tag = {'profile_version': profile_version, 'catalog_version': catalog_version}
+        while True:
+            entry = self.backend.get(key)
+            if entry is not None and entry['tag'] == tag:
+                self.hits += 1
+                return entry['value']
+            
+            with self._lock:
+                pending = self._inflight.get(key)
+                if pending is None:
+                    pending = self._inflight[key] = threading.Event()
+                    leader = True
+                else:
+                    leader = False
+            
+            if not leader:
+                # Another request is computing this seeker, wait and re-check
+                pending.wait(Config.REC_CACHE_WAIT_TIMEOUT)
+                if pending.is_set():
+                    continue
+                return compute()
+            
+            try:
+                self.misses += 1
+                value = compute()
+                self.backend.set(key, {'tag': tag, 'value': value})
+                return value
+            finally:
+                with self._lock:
+                    del self._inflight[key]
+                pending.set()
+    
+    def invalidate(self, seeker_id):
+        """Drop a seeker's cached recommendations"""
+        if self.backend is not None:
+            self.backend.delete(str(seeker_id))
@@ -0,0 +1,145 @@
+import threading
+import uuid
+from datetime import datetime, timedelta
+from itertools import islice
+from pymongo import ReturnDocument
+from config import Config
+from models.job import JobModel
+from models.recommendation import RecommendationModel
+from models.user import UserModel
+from services.matcher import get_matcher
+
+# Job fields used by matching and the pipeline, never returned by the API
+INTERNAL_JOB_FIELDS = [
+    'match_features', 'recommendation_status', 'recommendation_merged',
+    'recommendation_claim', 'recommendation_claimed_at'
+]
+
+def recommendation_item(job, match_result):
+    """Entry of a materialized recommendation list: the job as the API returns it"""
+    entry = {key: value for key, value in job.items() if key not in INTERNAL_JOB_FIELDS}
+    entry['_id'] = str(job['_id'])
+    entry['recruiter_id'] = str(job['recruiter_id'])
+    entry['match_percentage'] = match_result['overall_match']
+    entry['matched_skills'] = match_result['matched_skills']
+    return {'job_id': job['_id'], 'score': match_result['overall_match'], 'job': entry}
+
+class RecommendationMaterializer:
+    """Background pipeline that merges new and changed jobs into seekers' top-K lists"""
+    
+    def __init__(self, db, mode=None, poll_interval=None):
+        self.job_model = JobModel(db)
+        self.user_model = UserModel(db)
+        self.recommendation_model = RecommendationModel(db)
+        self.mode = mode or Config.RECOMMENDATION_MODE
+        self.poll_interval = poll_interval or Config.SCORING_POLL_INTERVAL
+        self.claim_timeout = timedelta(seconds=Config.SCORING_CLAIM_TIMEOUT)
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """Start the worker thread (no-op in inline mode)"""
+        if self.mode != 'async' or self._thread:
+            return
+        
+        self._thread = threading.Thread(target=self._run, name='recommendation-materializer', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Ask the worker thread to exit after its current job"""
+        self._stopped.set()
+        self._wakeup.set()
+    
+    def submit(self):
+        """Tell the pipeline jobs are waiting to be merged"""
+        if self.mode == 'inline':
+            # Local test mode: merge on the request thread
+            self.drain()
+        else:
+            self._wakeup.set()
+    
+    def drain(self):
+        """Merge pending jobs until none are left"""
+        merged = 0
+        while not self._stopped.is_set():
+            job = self._claim_job()
+            if job is None:
+                break
+            self.merge_job(job)
+            self.job_model.jobs.update_one(
+                {'_id': job['_id'], 'recommendation_claim': job['recommendation_claim']},
+                {
+                    '$set': {'recommendation_status': 'merged', 'recommendation_merged': True},
+                    '$unset': {'recommendation_claim': '', 'recommendation_claimed_at': ''}
+                }
+            )
+            merged += 1
+        return merged
+    
+    def merge_job(self, job):
+        """Score one job against job seekers sharing a skill and merge it into their lists"""
+        # Drop the previous version of the job before merging the current one.
+        # Totals already count a job merged before, so re-merges leave them alone
+        first_merge = not job.get('recommendation_merged')
+        self.recommendation_model.remove_job(job['_id'], count=False)
+        if not job.get('is_active'):
+            return 0
+        
+        matcher = get_matcher()
+        skill_ids = matcher.get_job_features(job)['skill_ids']
+        if not skill_ids:
+            return 0
+        
+        merged = 0
+        job_seekers = self.user_model.iter_job_seekers_for_skill_ids(skill_ids)
+        while True:
+            chunk = list(islice(job_seekers, Config.RECOMMENDATION_BATCH_SIZE))
+            if not chunk:
+                break
+            
+            # Seekers without a list get a full one computed on their next read
+            with_lists = self.recommendation_model.existing_job_seeker_ids(job_seeker['_id'] for job_seeker in chunk)
+            chunk = [job_seeker for job_seeker in chunk if job_seeker['_id'] in with_lists]
+            if not chunk:
+                continue
+            
+            candidates = [matcher.build_candidate_data(job_seeker) for job_seeker in chunk]
+            match_results = matcher.calculate_applicant_scores_batch(job, candidates)
+            items = {
+                job_seeker['_id']: recommendation_item(job, match_result)
+                for job_seeker, match_result in zip(chunk, match_results)
+                if match_result['overall_match'] >= Config.RECOMMENDATION_MIN_SCORE
+            }
+            merged += self.recommendation_model.merge_job(
+                items, Config.RECOMMENDATIONS_K + Config.RECOMMENDATION_BUFFER, count=first_merge
+            )
+        return merged
+    
+    def _claim_job(self):
+        """Atomically claim one job waiting to be merged"""
+        now = datetime.utcnow()
+        return self.job_model.jobs.find_one_and_update(
+            {'$or': [
+                {'recommendation_status': 'pending'},
+                # Claims from workers that died mid-merge
+                {'recommendation_status': 'merging', 'recommendation_claimed_at': {'$lt': now - self.claim_timeout}}
+            ]},
+            {'$set': {
+                'recommendation_status': 'merging',
+                'recommendation_claim': uuid.uuid4().hex,
+                'recommendation_claimed_at': now
+            }},
+            return_document=ReturnDocument.AFTER
+        )
+    
+    def _run(self):
+        """Worker loop: drain, then sleep until woken or the poll interval passes"""
+        while not self._stopped.is_set():
+            try:
+                self.drain()
+            except Exception as e:
+                print(f"Error materializing recommendations: {e}")
+            
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
@@ -0,0 +1,78 @@
+import hashlib
+from datetime import datetime, timedelta
+from pymongo import ReturnDocument
+from config import Config
+from services.parser import PARSER_VERSION
+
+class ParsedResumeCache:
+    """Parsed resumes shared by every worker, keyed by content hash and parser version
+    
+    Every hit refreshes last_used_at and entries unused for ttl seconds
+    expire, so the collection keeps the recently uploaded resumes, as an
+    LRU would. Failed parses are never cached.
+    """
+    
+    def __init__(self, db, ttl=None):
+        self.collection = db.parsed_resumes
+        self.ttl = Config.RESUME_CACHE_TTL if ttl is None else ttl
+        self.hits = 0
+        self.misses = 0
+    
+    def ensure_indexes(self):
+        """Let Mongo remove entries nobody has used within the TTL"""
+        if self.ttl > 0:
+            self.collection.create_index('last_used_at', expireAfterSeconds=self.ttl)
+    
+    def file_key(self, sha256, file_type):
+        """Key of an uploaded file; the extraction caps change its text, so they are part of it"""
+        return f'file:{file_type}:{sha256}:{PARSER_VERSION}:{Config.RESUME_MAX_PAGES}:{Config.RESUME_MAX_CHARS}'
+    
+    def text_key(self, text):
+        """Key of normalized resume text"""
+        return f"text:{hashlib.sha256(text.encode('utf-8')).hexdigest()}:{PARSER_VERSION}"
+    
+    def get(self, key):
+        """Get a cached parse and mark it used, or None"""
+        if self.ttl <= 0:
+            return None
+        
+        now = datetime.utcnow()
+        # The TTL monitor only runs every minute, so check the age here too
+        document = self.collection.find_one_and_update(
+            {'_id': key, 'last_used_at': {'$gt': now - timedelta(seconds=self.ttl)}},
+            {'$set': {'last_used_at': now}, '$inc': {'hits': 1}},
+            {'parsed_data': 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if document is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return document['parsed_data']
+    
+    def set(self, key, parsed_data):
+        """Cache a parse"""
+        if self.ttl <= 0:
+            return
+        
+        now = datetime.utcnow()
+        self.collection.replace_one(
+            {'_id': key},
+            {
+                '_id': key,
+                'parser_version': PARSER_VERSION,
+                'parsed_data': parsed_data,
+                'hits': 0,
+                'created_at': now,
+                'last_used_at': now
+            },
+            upsert=True
+        )
+    
+    def get_or_parse(self, key, parse):
+        """Get a cached parse, or call parse() and cache what it returns"""
+        parsed_data = self.get(key)
+        if parsed_data is None:
+            parsed_data = parse()
+            self.set(key, parsed_data)
+        return parsed_data
@@ -0,0 +1,150 @@
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+from config import Config
+from models.parse_job import ParseJobModel
+from models.user import UserModel
+from services.executor import worker_pool
+from services.parser import ResumeParser
+from services.resume_cache import ParsedResumeCache
+
+# Parser loaded once per worker process by init_parse_worker
+_worker_parser = None
+
+def init_parse_worker():
+    """Load stopwords and skill keywords once per worker"""
+    global _worker_parser
+    _worker_parser = ResumeParser()
+
+def parse_document(content, file_type):
+    """Parse one uploaded document in a worker process"""
+    return _worker_parser.parse_resume(content, file_type)
+
+def resume_profile_update(parsed_data, filename, sha256):
+    """Job seeker fields set from a parsed resume"""
+    name_parts = parsed_data['name'].split()
+    update_data = {
+        'resume_filename': filename,
+        'resume_sha256': sha256,
+        'first_name': name_parts[0] if name_parts else '',
+        'last_name': ' '.join(name_parts[1:]),
+        'skills': parsed_data['skills'],
+        'experience': parsed_data['experience'],
+        'education': parsed_data['education'],
+        'profile_completed': True
+    }
+    
+    # Add contact info if available
+    if parsed_data['contact_info'].get('phone'):
+        update_data['phone'] = parsed_data['contact_info']['phone']
+    return update_data
+
+class ResumeParseQueue:
+    """Background pipeline that parses uploaded resumes and updates profiles
+    
+    Worker threads claim jobs and hand the CPU-bound parsing to a process
+    pool, so a large PDF never holds a request worker or the GIL.
+    """
+    
+    def __init__(self, db, mode=None, workers=None, poll_interval=None, resume_cache=None):
+        self.parse_job_model = ParseJobModel(db)
+        self.user_model = UserModel(db)
+        self.resume_cache = resume_cache or ParsedResumeCache(db)
+        self.mode = mode or Config.RESUME_PARSE_MODE
+        self.workers = workers or Config.RESUME_PARSE_WORKERS
+        self.poll_interval = poll_interval or Config.SCORING_POLL_INTERVAL
+        self.claim_timeout = timedelta(seconds=Config.SCORING_CLAIM_TIMEOUT)
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._threads = []
+        self._pool = None
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Start worker threads (no-op in inline mode)"""
+        if self.mode != 'async' or self._threads:
+            return
+        
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f'resume-parser-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self):
+        """Ask worker threads to exit after their current job and stop the pool"""
+        self._stopped.set()
+        self._wakeup.set()
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+    
+    def submit(self, job_seeker_id, filename, file_type, sha256, upload):
+        """Queue an uploaded resume and return its parse job ID"""
+        job_id = self.parse_job_model.create_job(job_seeker_id, filename, file_type, sha256, upload)
+        if self.mode == 'inline':
+            # Local test mode: parse on the request thread
+            self.drain()
+        else:
+            self._wakeup.set()
+        return job_id
+    
+    def drain(self):
+        """Parse pending jobs until none are left"""
+        parsed = 0
+        while not self._stopped.is_set():
+            job = self.parse_job_model.claim_job(self.claim_timeout)
+            if job is None:
+                break
+            self.process_job(job)
+            parsed += 1
+        return parsed
+    
+    def process_job(self, job):
+        """Parse one claimed job, update the job seeker's profile and record the outcome"""
+        try:
+            # A file uploaded before skips extraction and parsing
+            parsed_data = self.resume_cache.get_or_parse(
+                self.resume_cache.file_key(job['sha256'], job['file_type']),
+                lambda: self._parse(self.parse_job_model.read_upload(job), job['file_type'])
+            )
+        except Exception as e:
+            self.parse_job_model.finish_job(job, 'failed', error=f'Failed to parse resume: {str(e)}')
+            return
+        
+        update_data = resume_profile_update(parsed_data, job['filename'], job['sha256'])
+        if not self.user_model.update_user(job['job_seeker_id'], 'job_seeker', update_data):
+            self.parse_job_model.finish_job(job, 'failed', error='Failed to update profile')
+            return
+        
+        self.parse_job_model.finish_job(job, 'completed', result=parsed_data)
+    
+    def _parse(self, content, file_type):
+        """Parse on the worker pool, or on this thread in inline mode"""
+        if self.mode == 'inline':
+            return ResumeParser().parse_resume(content, file_type)
+        
+        with self._lock:
+            if self._pool is None:
+                self._pool = worker_pool(self.workers, init_parse_worker)
+            pool = self._pool
+        
+        try:
+            return pool.submit(parse_document, content, file_type).result()
+        except BrokenProcessPool:
+            # A worker died (e.g. on a hostile document): fail this job, start a fresh pool for the next
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = None
+            raise
+    
+    def _run(self):
+        """Worker loop: drain, then sleep until woken or the poll interval passes"""
+        while not self._stopped.is_set():
+            try:
+                self.drain()
+            except Exception as e:
+                print(f"Error parsing resumes: {e}")
+            
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
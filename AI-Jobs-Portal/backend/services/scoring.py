@@ -0,0 +1,144 @@
+import threading
+import uuid
+from datetime import datetime, timedelta
+from pymongo import UpdateOne
+from config import Config
+from models.application import ApplicationModel
+from models.job import JobModel
+from models.user import UserModel
+from services.matcher import get_matcher
+
+class ApplicationScorer:
+    """Background pipeline that scores pending applications in batches"""
+    
+    def __init__(self, db, mode=None, workers=None, batch_size=None, poll_interval=None):
+        self.application_model = ApplicationModel(db)
+        self.job_model = JobModel(db)
+        self.user_model = UserModel(db)
+        self.mode = mode or Config.SCORING_MODE
+        self.workers = workers or Config.SCORING_WORKERS
+        self.batch_size = batch_size or Config.SCORING_BATCH_SIZE
+        self.poll_interval = poll_interval or Config.SCORING_POLL_INTERVAL
+        self.claim_timeout = timedelta(seconds=Config.SCORING_CLAIM_TIMEOUT)
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._threads = []
+    
+    def start(self):
+        """Start worker threads (no-op in inline mode)"""
+        if self.mode != 'async' or self._threads:
+            return
+        
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f'application-scorer-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self):
+        """Ask worker threads to exit after their current batch"""
+        self._stopped.set()
+        self._wakeup.set()
+    
+    def submit(self):
+        """Tell the pipeline new applications are pending"""
+        if self.mode == 'inline':
+            # Local test mode: score on the request thread
+            self.drain()
+        else:
+            self._wakeup.set()
+    
+    def drain(self):
+        """Score pending applications until none are left"""
+        scored = 0
+        while not self._stopped.is_set():
+            applications = self._claim_batch()
+            if not applications:
+                break
+            scored += self.score_batch(applications)
+        return scored
+    
+    def score_batch(self, applications):
+        """Score a batch of applications and write them back in one bulk write"""
+        job_ids = list({app['job_id'] for app in applications})
+        jobs = {job['_id']: job for job in self.job_model.jobs.find({'_id': {'$in': job_ids}})}
+        job_seekers = self.user_model.get_job_seeker_profiles([app['job_seeker_id'] for app in applications])
+        
+        # Group applicants by job so each job is scored once against all of them
+        by_job = {}
+        for app in applications:
+            by_job.setdefault(app['job_id'], []).append(app)
+        
+        matcher = get_matcher()
+        now = datetime.utcnow()
+        operations = []
+        for job_id, job_applications in by_job.items():
+            job = jobs.get(job_id)
+            scorable = [app for app in job_applications if str(app['job_seeker_id']) in job_seekers] if job else []
+            scorable_ids = {app['_id'] for app in scorable}
+            
+            if scorable:
+                candidates = [matcher.build_candidate_data(job_seekers[str(app['job_seeker_id'])])
+                              for app in scorable]
+                match_results = matcher.calculate_applicant_scores_batch(job, candidates)
+                for app, match_result in zip(scorable, match_results):
+                    operations.append(UpdateOne(
+                        {'_id': app['_id']},
+                        {
+                            '$set': {
+                                'skill_match_percentage': match_result['overall_match'],
+                                'score_status': 'scored',
+                                'scored_at': now
+                            },
+                            '$unset': {'score_claim': '', 'score_claimed_at': ''}
+                        }
+                    ))
+            
+            # Job or job seeker is gone, nothing to score against
+            for app in job_applications:
+                if app['_id'] not in scorable_ids:
+                    operations.append(UpdateOne(
+                        {'_id': app['_id']},
+                        {
+                            '$set': {'score_status': 'failed', 'scored_at': now},
+                            '$unset': {'score_claim': '', 'score_claimed_at': ''}
+                        }
+                    ))
+        
+        if operations:
+            self.application_model.applications.bulk_write(operations, ordered=False)
+        return len(operations)
+    
+    def _claim_batch(self):
+        """Atomically claim up to batch_size pending applications"""
+        now = datetime.utcnow()
+        claimable = {'$or': [
+            {'score_status': 'pending'},
+            # Claims from workers that died mid-batch
+            {'score_status': 'scoring', 'score_claimed_at': {'$lt': now - self.claim_timeout}}
+        ]}
+        
+        ids = [app['_id'] for app in self.application_model.applications
+               .find(claimable, {'_id': 1}).limit(self.batch_size)]
+        if not ids:
+            return []
+        
+        claim = uuid.uuid4().hex
+        self.application_model.applications.update_many(
+            {'$and': [{'_id': {'$in': ids}}, claimable]},
+            {'$set': {'score_status': 'scoring', 'score_claim': claim, 'score_claimed_at': now}}
+        )
+        return list(self.application_model.applications.find(
+            {'score_claim': claim},
+            {'job_id': 1, 'job_seeker_id': 1}
+        ))
+    
+    def _run(self):
+        """Worker loop: drain, then sleep until woken or the poll interval passes"""
+        while not self._stopped.is_set():
+            try:
+                self.drain()
+            except Exception as e:
+                print(f"Error scoring applications: {e}")
+            
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
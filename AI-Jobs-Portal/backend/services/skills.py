@@ -0,0 +1,223 @@
+import re
+import numpy as np
+
+# Skill categories and their weights
+SKILL_CATEGORIES = {
+    'programming_languages': {
+        'python': 1.0, 'java': 1.0, 'javascript': 1.0, 'typescript': 1.0,
+        'c++': 1.0, 'c#': 1.0, 'php': 1.0, 'ruby': 1.0, 'go': 1.0,
+        'rust': 1.0, 'swift': 1.0, 'kotlin': 1.0, 'scala': 1.0
+    },
+    'web_technologies': {
+        'html': 0.8, 'css': 0.8, 'react': 1.0, 'angular': 1.0, 'vue': 1.0,
+        'node.js': 1.0, 'express': 0.9, 'django': 1.0, 'flask': 1.0,
+        'spring': 1.0, 'laravel': 1.0, 'rails': 1.0, 'bootstrap': 0.7
+    },
+    'databases': {
+        'mysql': 1.0, 'postgresql': 1.0, 'mongodb': 1.0, 'redis': 0.9,
+        'sqlite': 0.8, 'oracle': 1.0, 'sql server': 1.0, 'cassandra': 0.9
+    },
+    'cloud_platforms': {
+        'aws': 1.0, 'azure': 1.0, 'google cloud': 1.0, 'docker': 0.9,
+        'kubernetes': 0.9, 'terraform': 0.8, 'jenkins': 0.8
+    },
+    'data_science': {
+        'machine learning': 1.0, 'artificial intelligence': 1.0,
+        'data science': 1.0, 'pandas': 0.9, 'numpy': 0.9,
+        'scikit-learn': 0.9, 'tensorflow': 0.9, 'pytorch': 0.9,
+        'r': 0.8, 'matplotlib': 0.7, 'seaborn': 0.7
+    },
+    'mobile_development': {
+        'android': 1.0, 'ios': 1.0, 'react native': 1.0, 'flutter': 1.0,
+        'xamarin': 0.8, 'ionic': 0.7
+    },
+    'soft_skills': {
+        'leadership': 0.8, 'communication': 0.8, 'teamwork': 0.7,
+        'problem solving': 0.9, 'analytical': 0.8, 'creative': 0.6,
+        'time management': 0.7, 'project management': 0.8
+    }
+}
+
+# Stable integer ID per lowercase skill name. Stored features and bitsets
+# refer to skills by these IDs, so never renumber or reuse one: give new
+# skills the next free ID and leave retired IDs unassigned
+SKILL_IDS = {
+    # programming_languages
+    'python': 0, 'java': 1, 'javascript': 2, 'typescript': 3, 'c++': 4, 'c#': 5, 'php': 6,
+    'ruby': 7, 'go': 8, 'rust': 9, 'swift': 10, 'kotlin': 11, 'scala': 12,
+    # web_technologies
+    'html': 13, 'css': 14, 'react': 15, 'angular': 16, 'vue': 17, 'node.js': 18, 'express': 19,
+    'django': 20, 'flask': 21, 'spring': 22, 'laravel': 23, 'rails': 24, 'bootstrap': 25,
+    # databases
+    'mysql': 26, 'postgresql': 27, 'mongodb': 28, 'redis': 29, 'sqlite': 30, 'oracle': 31,
+    'sql server': 32, 'cassandra': 33,
+    # cloud_platforms
+    'aws': 34, 'azure': 35, 'google cloud': 36, 'docker': 37, 'kubernetes': 38, 'terraform': 39,
+    'jenkins': 40,
+    # data_science
+    'machine learning': 41, 'artificial intelligence': 42, 'data science': 43, 'pandas': 44,
+    'numpy': 45, 'scikit-learn': 46, 'tensorflow': 47, 'pytorch': 48, 'r': 49, 'matplotlib': 50,
+    'seaborn': 51,
+    # mobile_development
+    'android': 52, 'ios': 53, 'react native': 54, 'flutter': 55, 'xamarin': 56, 'ionic': 57,
+    # soft_skills
+    'leadership': 58, 'communication': 59, 'teamwork': 60, 'problem solving': 61, 'analytical': 62,
+    'creative': 63, 'time management': 64, 'project management': 65
+}
+
+# A skill only counts when it is not glued to other letters or digits,
+# so "go" does not match inside "google" and "r" does not match "rust".
+# A version number may follow it, as in "html5", "python3.11" or "c++17"
+_BOUNDARY_BEFORE = r'(?<![a-z0-9])'
+_BOUNDARY_AFTER = r'(?:\d+(?:\.\d+)*)?(?![a-z0-9])'
+
+class SkillBitsets:
+    """Skill sets packed into uint64 words, with one shared weight per skill ID
+    
+    Bit i of word i // 64 is set when the set holds skill ID i. Functions
+    take a single bitset (n_words,) or a stack of them (n, n_words).
+    Weights are summed as whole thousandths, so totals do not depend on the
+    order the dot product adds them in.
+    """
+    
+    WEIGHT_SCALE = 1000
+    
+    def __init__(self, weights):
+        self.n_words = max(1, -(-len(weights) // 64))
+        self.weights = np.zeros(self.n_words * 64)
+        self.weights[:len(weights)] = np.round(np.asarray(weights, dtype=float) * self.WEIGHT_SCALE)
+        
+        # Total weight of every possible value of every byte, so summing a
+        # bitset's weight is one lookup per byte
+        byte_values = np.unpackbits(np.arange(256, dtype=np.uint8).reshape(-1, 1), axis=1, bitorder='little')
+        self.byte_weights = np.stack([
+            byte_values @ self.weights[byte * 8:(byte + 1) * 8] for byte in range(self.n_words * 8)
+        ])
+        self.byte_positions = np.arange(self.n_words * 8)
+    
+    def pack(self, ids):
+        """Pack one collection of skill IDs"""
+        mask = 0
+        for i in ids:
+            mask |= 1 << i
+        return np.frombuffer(mask.to_bytes(self.n_words * 8, 'little'), dtype='<u8').copy()
+    
+    def pack_many(self, rows_of_ids):
+        """Pack many collections of skill IDs into an (n, n_words) matrix"""
+        flags = np.zeros((len(rows_of_ids), self.n_words * 64), dtype=np.uint8)
+        for row, ids in enumerate(rows_of_ids):
+            flags[row, list(ids)] = 1
+        return np.packbits(flags, axis=1, bitorder='little').view('<u8')
+    
+    def unpack(self, bits):
+        """Expand bitsets to 0/1 flags per skill ID"""
+        bits = np.ascontiguousarray(bits, dtype='<u8')
+        return np.unpackbits(bits.view(np.uint8), axis=-1, bitorder='little')
+    
+    def ids(self, bits):
+        """Skill IDs held by one bitset, ascending"""
+        return [int(i) for i in np.flatnonzero(self.unpack(bits))]
+    
+    def weight(self, bits):
+        """Total weight of the skills in each bitset"""
+        bits = np.ascontiguousarray(bits, dtype='<u8')
+        byte_values = bits.view(np.uint8)
+        return self.byte_weights[self.byte_positions, byte_values].sum(axis=-1) / self.WEIGHT_SCALE
+    
+    def overlap(self, a, b):
+        """Weight of the skills shared by a and b, element-wise"""
+        return self.weight(np.bitwise_and(a, b))
+    
+    def overlap_matrix(self, a, b):
+        """Weight of the skills shared by every row of a with every row of b"""
+        # AND of 0/1 flags is their product, so the weighted overlap of
+        # every pair is one matrix product
+        return ((self.unpack(a) * self.weights) @ self.unpack(b).T.astype(float)) / self.WEIGHT_SCALE
+
+class SkillScanner:
+    """Single-pass scanner for every skill in a taxonomy"""
+    
+    def __init__(self, skill_categories, skill_ids=None):
+        # Entries in taxonomy order, keyed by their stable skill ID
+        skill_ids = dict(skill_ids or {})
+        next_id = max(skill_ids.values(), default=-1) + 1
+        self.entries = []
+        self.entries_by_id = {}
+        self.ids_by_skill = {}
+        for category, skills in skill_categories.items():
+            for skill, weight in skills.items():
+                name = skill.lower()
+                if name in self.ids_by_skill:
+                    continue
+                if name not in skill_ids:
+                    # Skills without a registered ID get the next free ones
+                    skill_ids[name] = next_id
+                    next_id += 1
+                entry = {
+                    'id': skill_ids[name],
+                    'skill': skill,
+                    'category': category,
+                    'weight': weight
+                }
+                self.entries.append(entry)
+                self.entries_by_id[entry['id']] = entry
+                self.ids_by_skill[name] = entry['id']
+        
+        weights = np.zeros(max(self.entries_by_id, default=-1) + 1)
+        for entry in self.entries:
+            weights[entry['id']] = entry['weight']
+        self.bitsets = SkillBitsets(weights)
+        
+        # Longest alternatives first so multi-word skills win over their prefixes
+        names = sorted(self.ids_by_skill, key=len, reverse=True)
+        self.pattern = re.compile(
+            _BOUNDARY_BEFORE + '(' + '|'.join(re.escape(name) for name in names) + ')' + _BOUNDARY_AFTER
+        )
+        
+        # A match consumes its text, so remember which shorter skills each
+        # skill contains (e.g. "react native" also implies "react")
+        self.implied = {}
+        for name in names:
+            implied = set()
+            for other in names:
+                if other != name and re.search(_BOUNDARY_BEFORE + re.escape(other) + _BOUNDARY_AFTER, name):
+                    implied.add(other)
+            self.implied[name] = implied
+    
+    def scan(self, text):
+        """Return the set of lowercase skill names found in text"""
+        if not text:
+            return set()
+        
+        found = set()
+        for match in self.pattern.finditer(text.lower()):
+            name = match.group(1)
+            if name not in found:
+                found.add(name)
+                found.update(self.implied[name])
+        return found
+    
+    def extract_ids(self, text):
+        """Return sorted skill IDs of skills found in text"""
+        return sorted(self.ids_by_skill[name] for name in self.scan(text))
+    
+    def ids_for(self, names):
+        """Return sorted skill IDs for known lowercase skill names"""
+        return sorted({self.ids_by_skill[name] for name in names if name in self.ids_by_skill})
+    
+    def extract(self, text):
+        """Return skill entries found in text, in taxonomy order"""
+        found = self.scan(text)
+        return [
+            {'skill': entry['skill'], 'category': entry['category'], 'weight': entry['weight']}
+            for entry in self.entries if entry['skill'].lower() in found
+        ]
+
+_default_scanner = None
+
+def get_skill_scanner():
+    """Get the process-wide scanner for the default taxonomy"""
+    global _default_scanner
+    if _default_scanner is None:
+        _default_scanner = SkillScanner(SKILL_CATEGORIES, SKILL_IDS)
+    return _default_scanner
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+from datetime import datetime
+from config import Config
+from utils.startup import lazy_import
+
+sklearn_text = lazy_import('sklearn.feature_extraction.text')
+
+def build_vectorizer(max_features=1000):
+    """Create the TF-IDF vectorizer used for job/candidate text"""
+    return sklearn_text.TfidfVectorizer(
+        stop_words='english',
+        ngram_range=(1, 2),
+        max_features=max_features
+    )
+
+class TfidfModel:
+    """TF-IDF vocabulary and IDF weights fitted once over the job corpus"""
+    
+    def __init__(self, vectorizer, version, fitted_at, n_documents):
+        self.vectorizer = vectorizer
+        self.version = version
+        self.fitted_at = fitted_at
+        self.n_documents = n_documents
+    
+    @classmethod
+    def fit(cls, documents, max_features=None):
+        """Fit a new model over preprocessed job descriptions"""
+        documents = [doc for doc in documents if doc]
+        if not documents:
+            raise ValueError('Cannot fit TF-IDF model on an empty corpus')
+        
+        vectorizer = build_vectorizer(max_features or Config.TFIDF_MAX_FEATURES)
+        vectorizer.fit(documents)
+        
+        # Version is the fit time plus a digest of the learned vocabulary
+        fitted_at = datetime.utcnow()
+        digest = hashlib.sha1(' '.join(sorted(vectorizer.vocabulary_)).encode('utf-8')).hexdigest()
+        version = f"{fitted_at.strftime('%Y%m%d%H%M%S')}-{digest[:8]}"
+        
+        return cls(vectorizer, version, fitted_at, len(documents))
+    
+    def transform(self, texts):
+        """Transform preprocessed texts into L2-normalised sparse vectors"""
+        return self.vectorizer.transform(texts)
+    
+    def drift(self, documents):
+        """Share of corpus unigrams missing from the fitted vocabulary"""
+        vocabulary = self.vectorizer.vocabulary_
+        total = 0
+        missing = 0
+        for doc in documents:
+            for token in doc.split():
+                total += 1
+                if token not in vocabulary:
+                    missing += 1
+        return missing / total if total else 0.0
+    
+    def save(self, path):
+        """Save model to disk, replacing any previous file atomically"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as file:
+            pickle.dump({
+                'vectorizer': self.vectorizer,
+                'version': self.version,
+                'fitted_at': self.fitted_at,
+                'n_documents': self.n_documents
+            }, file)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path):
+        """Load model from disk, or None if it has not been built yet"""
+        if not os.path.exists(path):
+            return None
+        
+        with open(path, 'rb') as file:
+            data = pickle.load(file)
+        return cls(data['vectorizer'], data['version'], data['fitted_at'], data['n_documents'])
+
+_loaded_model = None
+_loaded_mtime = None
+_checked_at = None
+_load_lock = threading.Lock()
+
+def get_text_model(path=None):
+    """Get the persisted model, reloading it when the file has been rebuilt
+    
+    The file is checked at most every TFIDF_CHECK_INTERVAL seconds, so hot
+    scoring loops do not stat it on every call.
+    """
+    global _loaded_model, _loaded_mtime, _checked_at
+    if _checked_at is not None and time.monotonic() - _checked_at < Config.TFIDF_CHECK_INTERVAL:
+        return _loaded_model
+    
+    path = path or Config.TFIDF_MODEL_PATH
+    with _load_lock:
+        # Another thread may have checked while this one waited
+        if _checked_at is not None and time.monotonic() - _checked_at < Config.TFIDF_CHECK_INTERVAL:
+            return _loaded_model
+        
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        if mtime is not None and (_loaded_model is None or mtime != _loaded_mtime):
+            _loaded_model = TfidfModel.load(path)
+            _loaded_mtime = mtime
+        _checked_at = time.monotonic()
+    return _loaded_model
@@ -0,0 +1,60 @@
+from collections import Counter
+from urllib.parse import quote_plus
+from config import Config
+from models.job import JobModel
+from models.recommendation import RecommendationModel
+from models.skill_demand import SkillDemandModel
+from services.matcher import get_matcher, skill_priority
+
+def learning_resources(skill):
+    """Search links for learning a skill"""
+    return [
+        {'type': 'YouTube', 'title': f'{skill} tutorials',
+         'url': f'https://www.youtube.com/results?search_query={quote_plus(skill + " tutorial")}'},
+        {'type': 'Course', 'title': f'{skill} courses',
+         'url': f'https://www.coursera.org/search?query={quote_plus(skill)}'}
+    ]
+
+def recommend_skills(db, job_seeker, limit=10):
+    """Rank the skills a job seeker lacks by how many of their best matched jobs ask for them
+    
+    Ties, and seekers without a materialized recommendation list, fall
+    back to market demand from the skill demand table. No job description
+    is read: top jobs contribute their stored skill IDs.
+    """
+    matcher = get_matcher()
+    candidate_data = matcher.build_candidate_data(job_seeker)
+    have = set(matcher.get_candidate_features(candidate_data)['skill_ids'])
+    
+    needed = Counter()
+    materialized = RecommendationModel(db).get_for_job_seeker(job_seeker['_id'], job_seeker.get('updated_at'))
+    if materialized:
+        top_job_ids = [item['job_id'] for item in materialized['items'][:Config.RECOMMENDATIONS_K]]
+        for job in JobModel(db).iter_active_jobs_by_ids(top_job_ids, {'match_features.skill_ids': 1}):
+            needed.update(set(job.get('match_features', {}).get('skill_ids', [])) - have)
+    
+    demand = SkillDemandModel(db).get_demand(needed or None)
+    missing = list(needed) if needed else [skill_id for skill_id in demand if skill_id not in have]
+    
+    recommendations = []
+    for skill_id in missing:
+        entry = matcher.skill_scanner.entries_by_id.get(skill_id)
+        if entry is None:
+            # Retired from the taxonomy since the job was stored
+            continue
+        row = demand.get(skill_id, {})
+        recommendations.append({
+            'skill': entry['skill'],
+            'category': entry['category'],
+            'priority': skill_priority(entry['weight']),
+            'top_jobs': needed[skill_id],
+            'market_jobs': row.get('jobs', 0),
+            'demand': round(row.get('demand', 0) * entry['weight'], 2),
+            'resources': learning_resources(entry['skill'])
+        })
+    
+    recommendations.sort(key=lambda skill: (-skill['top_jobs'], -skill['demand'], skill['skill']))
+    return {
+        'recommendations': recommendations[:limit],
+        'based_on': 'top_matches' if needed else 'market'
+    }
@@ -0,0 +1,40 @@
+import mongomock
+import mongomock.gridfs
+import pytest
+from flask_jwt_extended import create_access_token
+import app as app_module
+from config import Config
+from models.user import UserModel
+
+mongomock.gridfs.enable_gridfs_integration()
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    """App wired to an in-memory Mongo, with every background pipeline run inline"""
+    monkeypatch.setattr(app_module, 'MongoClient', mongomock.MongoClient)
+    monkeypatch.setattr(Config, 'SCORING_MODE', 'inline')
+    monkeypatch.setattr(Config, 'RECOMMENDATION_MODE', 'inline')
+    monkeypatch.setattr(Config, 'RESUME_PARSE_MODE', 'inline')
+    monkeypatch.setattr(Config, 'MATCHER_POOL_SIZE', 1)
+    monkeypatch.setattr(Config, 'ANN_ENABLED', False)
+    monkeypatch.setattr(Config, 'UPLOAD_FOLDER', str(tmp_path / 'uploads'))
+    app = app_module.create_app()
+    app.config.update(TESTING=True, JWT_SECRET_KEY='test-secret-key-of-at-least-32-bytes', JWT_VERIFY_SUB=False)
+    return app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def auth_headers(app):
+    """Authorization header for a user of the given type"""
+    def headers(user_id, user_type):
+        with app.app_context():
+            token = create_access_token(identity={'user_id': str(user_id), 'user_type': user_type})
+        return {'Authorization': f'Bearer {token}'}
+    return headers
+
+@pytest.fixture
+def job_seeker_id(app):
+    return UserModel(app.db).create_job_seeker({'email': 'seeker@example.com', 'first_name': 'Jane', 'last_name': 'Doe'})
@@ -0,0 +1,40 @@
+import io
+import zipfile
+from bson import ObjectId
+from commands.ingest import ingest_resumes_command
+
+def resume_archive():
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr('ada.txt', 'Ada Lovelace\nada@example.com\nSkilled in Python and SQL\n')
+        zf.writestr('alan.txt', 'Alan Turing\nalan@example.com\nSkilled in Java\n')
+        zf.writestr('nobody.txt', 'Nobody\nNo contact details\n')
+    archive.seek(0)
+    return archive
+
+def test_uploaded_archive_is_queued_and_ingested_by_the_worker(app, client, auth_headers):
+    headers = auth_headers(ObjectId(), 'admin')
+    response = client.post('/api/admin/ingest-resumes', data={'archive': (resume_archive(), 'resumes.zip')},
+                           headers=headers)
+    assert response.status_code == 202, response.get_json()
+    job = response.get_json()['job']
+    assert job['status'] == 'pending'
+    # The request only stores the archive; nobody has been ingested yet
+    assert app.db.job_seekers.count_documents({}) == 0
+    assert app.db.ingest_archives.files.count_documents({}) == 1
+    
+    result = app.test_cli_runner().invoke(ingest_resumes_command, ['--queued', '--once', '--workers', '1'])
+    assert result.exit_code == 0, result.output
+    
+    response = client.get(f"/api/admin/ingest-jobs/{job['job_id']}", headers=headers)
+    job = response.get_json()['job']
+    assert job['status'] == 'completed'
+    assert job['summary']['created'] == 2
+    assert [failure['file'] for failure in job['failures']] == ['nobody.txt']
+    assert app.db.job_seekers.count_documents({}) == 2
+    assert app.db.ingest_archives.files.count_documents({}) == 0
+
+def test_non_archives_are_rejected(client, auth_headers):
+    response = client.post('/api/admin/ingest-resumes', data={'archive': (io.BytesIO(b'not an archive'), 'resumes.zip')},
+                           headers=auth_headers(ObjectId(), 'admin'))
+    assert response.status_code == 400
@@ -0,0 +1,73 @@
+from bson import ObjectId
+from commands import all_pairs
+from models.job import JobModel
+from models.recommendation import RecommendationModel
+from models.user import UserModel
+from services.matcher import get_matcher
+
+SKILLS = [['python', 'flask'], ['react', 'javascript'], ['python', 'sql'], ['docker', 'aws']]
+
+def test_score_all_pairs_matches_pairwise_scoring(app):
+    job_model = JobModel(app.db)
+    user_model = UserModel(app.db)
+    for skills in SKILLS:
+        job_model.create_job({
+            'title': f"{skills[0]} developer",
+            'description': f"We need {' and '.join(skills)} experience.",
+            'required_skills': skills,
+            'recruiter_id': ObjectId()
+        })
+    for i, skills in enumerate(SKILLS * 2):
+        seeker_id = user_model.create_job_seeker({'email': f'seeker{i}@example.com', 'first_name': 'Seeker'})
+        user_model.update_user(seeker_id, 'job_seeker', {'skills': skills})
+    
+    # Small blocks make every seeker block walk several job blocks
+    result = app.test_cli_runner().invoke(all_pairs.score_all_pairs_command, ['--block-size', '3', '--min-score', '0'])
+    assert result.exit_code == 0, result.output
+    assert f'Scored {len(SKILLS) * len(SKILLS) * 2} pairs' in result.output
+    
+    matcher = get_matcher()
+    jobs = list(job_model.jobs.find())
+    recommendation_model = RecommendationModel(app.db)
+    qualified_seekers = {job['_id']: 0 for job in jobs}
+    for job_seeker in user_model.iter_job_seekers():
+        candidate = matcher.build_candidate_data(job_seeker)
+        expected = {
+            job['_id']: match_result['overall_match']
+            for job, match_result in zip(jobs, matcher.calculate_overall_match_batch(jobs, candidate))
+            if match_result['skill_match'] > 0
+        }
+        for job_id in expected:
+            qualified_seekers[job_id] += 1
+        
+        stored = recommendation_model.recommendations.find_one({'_id': job_seeker['_id']})
+        assert stored['total'] == len(expected)
+        assert {item['job_id']: item['score'] for item in stored['items']} == expected
+    
+    for job in jobs:
+        assert recommendation_model.top_candidates.find_one({'_id': job['_id']})['total'] == qualified_seekers[job['_id']]
+
+def test_jobs_deactivated_during_the_run_drop_out(app, monkeypatch):
+    job_model = JobModel(app.db)
+    user_model = UserModel(app.db)
+    job_ids = [
+        job_model.create_job({'title': 'Python developer', 'description': 'Python and Flask', 'required_skills': ['python'],
+                              'recruiter_id': ObjectId()})
+        for _ in range(2)
+    ]
+    seeker_id = user_model.create_job_seeker({'email': 'seeker@example.com', 'first_name': 'Seeker'})
+    user_model.update_user(seeker_id, 'job_seeker', {'skills': ['python']})
+    
+    # Prepared features are reused, but every pass re-checks which jobs are active
+    prepare = all_pairs._prepare_job_blocks
+    
+    def prepare_then_deactivate(*args):
+        blocks = prepare(*args)
+        job_model.delete_job(job_ids[0])
+        return blocks
+    monkeypatch.setattr(all_pairs, '_prepare_job_blocks', prepare_then_deactivate)
+    
+    result = app.test_cli_runner().invoke(all_pairs.score_all_pairs_command, ['--min-score', '0'])
+    assert result.exit_code == 0, result.output
+    stored = RecommendationModel(app.db).recommendations.find_one({'_id': ObjectId(seeker_id)})
+    assert [item['job_id'] for item in stored['items']] == [ObjectId(job_ids[1])]
@@ -0,0 +1,72 @@
+import threading
+import time
+import mongomock
+import pytest
+from config import Config
+from models.job import JobModel
+from services import ann_index
+from services.matcher import get_matcher
+from services.tfidf_model import TfidfModel
+
+DESCRIPTIONS = [
+    'Python developer building Flask APIs on MongoDB',
+    'Frontend engineer writing React and TypeScript',
+    'Data engineer running Spark pipelines on AWS',
+    'DevOps engineer managing Docker and Kubernetes'
+]
+
+@pytest.fixture
+def job_model(monkeypatch):
+    """Jobs in an in-memory Mongo, with a fresh process-wide index whose builds wait for release()"""
+    text_model = TfidfModel.fit([get_matcher().preprocess_text(text) for text in DESCRIPTIONS])
+    monkeypatch.setattr(ann_index, 'get_text_model', lambda: text_model)
+    monkeypatch.setattr(ann_index, '_shared_index', None)
+    monkeypatch.setattr(ann_index, '_rebuild_changes', None)
+    
+    release = threading.Event()
+    build = ann_index.JobAnnIndex.build.__func__
+    
+    def gated_build(cls, *args, **kwargs):
+        release.wait(10)
+        return build(cls, *args, **kwargs)
+    monkeypatch.setattr(ann_index.JobAnnIndex, 'build', classmethod(gated_build))
+    
+    model = JobModel(mongomock.MongoClient().db)
+    model.release = release
+    return model
+
+def wait_for_rebuild():
+    deadline = time.time() + 10
+    while ann_index._rebuild_changes is not None and time.time() < deadline:
+        time.sleep(0.01)
+    assert ann_index._rebuild_changes is None
+
+def test_first_build_runs_in_background(job_model):
+    job_ids = [job_model.create_job({'title': 'Job', 'description': text}) for text in DESCRIPTIONS[:3]]
+    
+    # The request thread never waits for the build
+    assert ann_index.get_ann_index(job_model) is None
+    
+    # Changes made during the build are replayed into the new index
+    job_ids.append(job_model.create_job({'title': 'Job', 'description': DESCRIPTIONS[3]}))
+    job_model.delete_job(job_ids[0])
+    job_model.release.set()
+    wait_for_rebuild()
+    
+    index = ann_index.get_ann_index(job_model)
+    assert set(index.job_keys) == {str(job_id) for job_id in job_ids[1:]}
+
+def test_stale_index_is_served_during_rebuild(job_model, monkeypatch):
+    job_model.create_job({'title': 'Job', 'description': DESCRIPTIONS[0]})
+    job_model.release.set()
+    ann_index.get_ann_index(job_model)
+    wait_for_rebuild()
+    first = ann_index.get_ann_index(job_model)
+    
+    job_model.release.clear()
+    monkeypatch.setattr(Config, 'ANN_REFRESH_SECONDS', 0)
+    assert ann_index.get_ann_index(job_model) is first
+    
+    job_model.release.set()
+    wait_for_rebuild()
+    assert ann_index._shared_index is not first
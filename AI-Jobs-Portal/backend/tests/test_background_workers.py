@@ -0,0 +1,43 @@
+import click
+import mongomock
+import pytest
+import app as app_module
+from config import Config
+
+@pytest.fixture
+def async_app(monkeypatch, tmp_path):
+    """Build an app whose pipelines run on background threads"""
+    monkeypatch.setattr(app_module, 'MongoClient', mongomock.MongoClient)
+    monkeypatch.setattr(Config, 'SCORING_MODE', 'async')
+    monkeypatch.setattr(Config, 'RECOMMENDATION_MODE', 'async')
+    monkeypatch.setattr(Config, 'RESUME_PARSE_MODE', 'async')
+    monkeypatch.setattr(Config, 'ANN_ENABLED', False)
+    monkeypatch.setattr(Config, 'UPLOAD_FOLDER', str(tmp_path / 'uploads'))
+    apps = []
+    
+    def build(enabled):
+        monkeypatch.setattr(Config, 'BACKGROUND_WORKERS_ENABLED', enabled)
+        apps.append(app_module.create_app())
+        return apps[-1]
+    yield build
+    
+    for app in apps:
+        app.application_scorer.stop()
+        app.recommendation_materializer.stop()
+        app.resume_parse_queue.stop()
+
+def running(app):
+    return bool(app.application_scorer._threads or app.recommendation_materializer._thread or app.resume_parse_queue._threads)
+
+def test_web_processes_do_not_start_workers_by_default(async_app):
+    assert not running(async_app(False))
+
+def test_owning_process_starts_workers(async_app):
+    app = async_app(True)
+    assert len(app.application_scorer._threads) == Config.SCORING_WORKERS
+    assert app.recommendation_materializer._thread is not None
+    assert len(app.resume_parse_queue._threads) == Config.RESUME_PARSE_WORKERS
+
+def test_cli_commands_never_start_workers(async_app):
+    with click.Context(click.Command('routes')):
+        assert not running(async_app(True))
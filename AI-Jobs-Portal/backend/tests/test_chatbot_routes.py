@@ -0,0 +1,19 @@
+from types import SimpleNamespace
+from models.user import UserModel
+from routes import chatbot
+
+def test_interview_questions_follow_the_job_seekers_skills(app, client, auth_headers, job_seeker_id):
+    UserModel(app.db).update_user(job_seeker_id, 'job_seeker', {'skills': ['Python']})
+    response = client.get('/api/chatbot/interview-questions', headers=auth_headers(job_seeker_id, 'job_seeker'))
+    assert response.status_code == 200, response.get_json()
+    assert "What are decorators in Python?" in response.get_json()['questions']
+
+def test_chat_falls_back_when_openai_fails(app, client, auth_headers, job_seeker_id, monkeypatch):
+    def unavailable(**kwargs):
+        raise Exception('OpenAI unavailable')
+    monkeypatch.setattr(chatbot, 'openai', SimpleNamespace(ChatCompletion=SimpleNamespace(create=unavailable)))
+    
+    response = client.post('/api/chatbot/chat', json={'message': 'Help me prepare', 'type': 'interview'},
+                           headers=auth_headers(job_seeker_id, 'job_seeker'))
+    assert response.status_code == 200, response.get_json()
+    assert response.get_json()['type'] == 'interview'
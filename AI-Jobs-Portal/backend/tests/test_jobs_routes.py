@@ -0,0 +1,84 @@
+from bson import ObjectId
+from models.application import ApplicationModel
+from models.user import UserModel
+
+JOB = {
+    'title': 'Backend Engineer',
+    'description': 'Build APIs with Python, Flask and MongoDB. 3+ years of experience.',
+    'company': 'Acme',
+    'location': 'Remote',
+    'job_type': 'full-time',
+    'required_skills': ['python', 'flask', 'mongodb']
+}
+
+def post_job(client, auth_headers, recruiter_id):
+    response = client.post('/api/jobs/post', json=JOB, headers=auth_headers(recruiter_id, 'recruiter'))
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()['job_id']
+
+def test_post_and_get_job(client, auth_headers):
+    job_id = post_job(client, auth_headers, ObjectId())
+    
+    response = client.get(f'/api/jobs/{job_id}')
+    assert response.status_code == 200
+    assert response.get_json()['job']['title'] == JOB['title']
+    
+    response = client.get('/api/jobs/')
+    assert response.status_code == 200
+    assert [job['_id'] for job in response.get_json()['jobs']] == [job_id]
+
+def test_apply_scores_application_and_ranks_applicants(app, client, auth_headers, job_seeker_id):
+    recruiter_id = ObjectId()
+    job_id = post_job(client, auth_headers, recruiter_id)
+    UserModel(app.db).update_user(job_seeker_id, 'job_seeker', {'skills': ['python', 'flask']})
+    
+    response = client.post(f'/api/jobs/{job_id}/apply', json={}, headers=auth_headers(job_seeker_id, 'job_seeker'))
+    assert response.status_code == 201, response.get_json()
+    application = ApplicationModel(app.db).get_application_by_id(response.get_json()['application_id'])
+    assert application['score_status'] == 'scored'
+    assert application['skill_match_percentage'] > 0
+    
+    response = client.get(f'/api/jobs/{job_id}/applications', headers=auth_headers(recruiter_id, 'recruiter'))
+    assert response.status_code == 200, response.get_json()
+    applications = response.get_json()['applications']
+    assert [app['job_seeker_id'] for app in applications] == [job_seeker_id]
+    assert applications[0]['skill_match_percentage'] == application['skill_match_percentage']
+    
+    response = client.get('/api/jobs/my-applications', headers=auth_headers(job_seeker_id, 'job_seeker'))
+    assert response.status_code == 200
+    assert response.get_json()['applications'][0]['job']['title'] == JOB['title']
+
+def test_recommendations(app, client, auth_headers, job_seeker_id):
+    job_id = post_job(client, auth_headers, ObjectId())
+    UserModel(app.db).update_user(job_seeker_id, 'job_seeker', {'skills': ['python', 'flask', 'mongodb']})
+    
+    response = client.get('/api/jobs/recommendations', headers=auth_headers(job_seeker_id, 'job_seeker'))
+    assert response.status_code == 200, response.get_json()
+    assert [job['_id'] for job in response.get_json()['recommendations']] == [job_id]
+
+def test_live_ranking_settles_unscored_applications(app, client, auth_headers):
+    recruiter_id = ObjectId()
+    job_id = post_job(client, auth_headers, recruiter_id)
+    user_model = UserModel(app.db)
+    application_ids = {}
+    for status in ['pending', 'failed', 'scoring']:
+        seeker_id = user_model.create_job_seeker({'email': f'{status}@example.com', 'first_name': status})
+        user_model.update_user(seeker_id, 'job_seeker', {'skills': ['python']})
+        response = client.post(f'/api/jobs/{job_id}/apply', json={}, headers=auth_headers(seeker_id, 'job_seeker'))
+        assert response.status_code == 201, response.get_json()
+        application_ids[status] = ObjectId(response.get_json()['application_id'])
+        # As if the scoring pipeline had not got to it, had failed, or holds a claim on it
+        app.db.applications.update_one({'_id': application_ids[status]},
+                                       {'$set': {'score_status': status}, '$unset': {'scored_at': ''}})
+    
+    response = client.get(f'/api/jobs/{job_id}/applications', headers=auth_headers(recruiter_id, 'recruiter'))
+    assert response.status_code == 200, response.get_json()
+    
+    for status, application_id in application_ids.items():
+        application = app.db.applications.find_one({'_id': application_id})
+        if status == 'scoring':
+            assert application['score_status'] == 'scoring'
+            assert 'scored_at' not in application
+        else:
+            assert application['score_status'] == 'scored'
+            assert application['scored_at'] is not None
@@ -0,0 +1,106 @@
+import pytest
+from services import matcher as matcher_module
+from services.matcher import JobMatcher
+from services.tfidf_model import TfidfModel
+
+JOB_DESCRIPTIONS = [
+    'Senior Python developer with Flask and SQL. 5+ years of experience, bachelor degree required.',
+    'Frontend engineer building React and JavaScript apps with TypeScript.',
+    'Data scientist using Python, pandas and machine learning. Master degree preferred. 3 years experience.',
+    'DevOps engineer running Docker and Kubernetes on AWS.',
+    'Java backend developer with Spring, 2 years experience.',
+    'Office manager handling schedules and communication.',
+    '',
+]
+
+CANDIDATES = [
+    {
+        'skills_text': 'Python, Flask, SQL, Docker',
+        'profile_text': 'Python developer building Flask services',
+        'experience': [{'position': 'Developer', 'duration': '4 years'}],
+        'education': [{'degree': 'Bachelor of Science'}]
+    },
+    {
+        'skills_text': 'React, JavaScript',
+        'profile_text': 'Frontend engineer',
+        'experience': [],
+        'education': []
+    },
+    {
+        'skills_text': '',
+        'profile_text': '',
+        'experience': [],
+        'education': []
+    },
+]
+
+@pytest.fixture(params=['pairwise', 'fitted'])
+def matcher(request, monkeypatch):
+    """Matcher without a corpus model, falling back to per-pair fitting, or with one fitted on the jobs"""
+    if request.param == 'pairwise':
+        monkeypatch.setattr(matcher_module, 'get_text_model', lambda: None)
+        return JobMatcher()
+    
+    plain = JobMatcher()
+    documents = [plain.preprocess_text(description) for description in JOB_DESCRIPTIONS]
+    return JobMatcher(text_model=TfidfModel.fit(documents))
+
+def _jobs():
+    return [{'description': description} for description in JOB_DESCRIPTIONS]
+
+@pytest.mark.parametrize('candidate', CANDIDATES)
+def test_batch_scores_match_single_job_scores(matcher, candidate):
+    jobs = _jobs()
+    batch = matcher.calculate_overall_match_batch(jobs, candidate)
+    
+    assert len(batch) == len(jobs)
+    for job, match_result in zip(jobs, batch):
+        single = matcher.calculate_overall_match(job, candidate)
+        assert match_result['matched_skills'] == single['matched_skills']
+        for key in ('overall_match', 'skill_match', 'text_similarity', 'experience_match', 'education_match'):
+            assert match_result[key] == pytest.approx(single[key], abs=0.01), key
+        
+        # Text similarity agrees with the scalar path too
+        text_similarity = matcher.calculate_text_similarity(job['description'], candidate['profile_text'])
+        assert match_result['text_similarity'] == pytest.approx(text_similarity, abs=0.01)
+
+def _many_jobs():
+    """Jobs covering a spread of skill, experience and education requirements"""
+    skills = ['Python', 'Flask', 'SQL', 'React', 'JavaScript', 'Docker', 'AWS', 'Java']
+    jobs = []
+    for i in range(60):
+        picked = [skills[(i * step) % len(skills)] for step in (1, 3, 5)][:1 + i % 3]
+        description = f"Developer with {' and '.join(picked)}."
+        if i % 4:
+            description += f' {1 + i % 7} years experience.'
+        if i % 5 == 0:
+            description += ' Bachelor degree required.'
+        jobs.append({'_id': i, 'description': description})
+    return jobs + _jobs()
+
+def _brute_force(matcher, jobs, candidate, min_score):
+    """Every job at or above min_score, best first"""
+    scored = zip(jobs, matcher.calculate_overall_match_batch(jobs, candidate))
+    return sorted(
+        [(match_result['overall_match'], job) for job, match_result in scored if match_result['overall_match'] >= min_score],
+        key=lambda pair: -pair[0]
+    )
+
+@pytest.mark.parametrize('k, min_score', [(1, 0), (5, 30), (10, 45), (100, 30), (5, 101)])
+@pytest.mark.parametrize('candidate', CANDIDATES)
+def test_rank_top_k_matches_brute_force(matcher, candidate, k, min_score):
+    jobs = _many_jobs()
+    expected = _brute_force(matcher, jobs, candidate, min_score)
+    
+    # Small chunks so later chunks are pruned against an already full heap
+    ranked = matcher.rank_top_k(jobs, candidate, k=k, min_score=min_score, chunk_size=8)
+    
+    assert ranked['total'] == len(expected)
+    scores = [match_result['overall_match'] for _, match_result in ranked['results']]
+    assert scores == pytest.approx([score for score, _ in expected[:k]], abs=0.01)
+    
+    # Ties at the k-th score may keep either job, anything better must be there
+    kept = [job for job, _ in ranked['results']]
+    assert all(job in kept for score, job in expected[:k] if len(expected) <= k or score > expected[k - 1][0])
+    for job, match_result in ranked['results']:
+        assert match_result == matcher.calculate_overall_match(job, candidate)
@@ -0,0 +1,73 @@
+import io
+from bson import ObjectId
+from models.parse_job import ParseJobModel
+from models.user import UserModel
+
+def test_update_skills_materializes_match_features(app, client, auth_headers, job_seeker_id):
+    response = client.put('/api/resume/update-skills', json={'skills': ['Python', 'Docker']},
+                          headers=auth_headers(job_seeker_id, 'job_seeker'))
+    assert response.status_code == 200, response.get_json()
+    
+    profile = UserModel(app.db).get_job_seeker_profile(job_seeker_id)
+    assert profile['skills'] == ['Python', 'Docker']
+    features = profile['match_features']
+    assert features['updated_at'] == profile['updated_at']
+    assert {skill['skill'] for skill in features['skills']} == {'python', 'docker'}
+
+def test_update_experience_and_education(app, client, auth_headers, job_seeker_id):
+    headers = auth_headers(job_seeker_id, 'job_seeker')
+    response = client.put('/api/resume/update-experience', json={'experience': [{'duration': '4 years'}]}, headers=headers)
+    assert response.status_code == 200, response.get_json()
+    response = client.put('/api/resume/update-education', json={'education': [{'degree': 'Master'}]}, headers=headers)
+    assert response.status_code == 200, response.get_json()
+    
+    response = client.get('/api/resume/profile', headers=headers)
+    assert response.status_code == 200, response.get_json()
+    profile = response.get_json()['profile']
+    assert profile['experience'] == [{'duration': '4 years'}]
+    assert profile['education'] == [{'degree': 'Master'}]
+    assert 'password' not in profile
+
+def test_update_skills_rejects_non_list(client, auth_headers, job_seeker_id):
+    response = client.put('/api/resume/update-skills', json={'skills': 'python'},
+                          headers=auth_headers(job_seeker_id, 'job_seeker'))
+    assert response.status_code == 400
+
+def test_uploaded_resume_is_kept_out_of_the_job_until_parsed(app, client, auth_headers, job_seeker_id):
+    resume = b'Jane Doe\njane@example.com\nSkilled in Python, Docker and AWS\n'
+    response = client.post('/api/resume/upload', data={'file': (io.BytesIO(resume), 'resume.txt')},
+                           headers=auth_headers(job_seeker_id, 'job_seeker'))
+    assert response.status_code == 202, response.get_json()
+    job_id = response.get_json()['job']['job_id']
+    
+    job = app.db.parse_jobs.find_one({'_id': ObjectId(job_id)})
+    assert job['status'] == 'completed'
+    assert job['size'] == len(resume)
+    assert 'content' not in job and 'file_id' not in job
+    # The upload lived in GridFS only until it was parsed
+    assert app.db.resume_uploads.files.count_documents({}) == 0
+    assert app.db.resume_uploads.chunks.count_documents({}) == 0
+    
+    profile = UserModel(app.db).get_job_seeker_profile(job_seeker_id)
+    assert {'python', 'docker', 'aws'} <= {skill.lower() for skill in profile['skills']}
+
+def test_queued_job_references_the_upload_in_gridfs(app, job_seeker_id):
+    parse_job_model = ParseJobModel(app.db)
+    job_id = parse_job_model.create_job(job_seeker_id, 'resume.txt', 'txt', 'sha', io.BytesIO(b'x' * 300000))
+    
+    job = app.db.parse_jobs.find_one({'_id': ObjectId(job_id)})
+    assert 'content' not in job
+    assert job['size'] == 300000
+    assert parse_job_model.read_upload(job) == b'x' * 300000
+
+def test_profile_leaves_out_matcher_internals(app, client, auth_headers, job_seeker_id):
+    headers = auth_headers(job_seeker_id, 'job_seeker')
+    response = client.put('/api/resume/update-skills', json={'skills': ['Python']}, headers=headers)
+    assert response.status_code == 200, response.get_json()
+    
+    response = client.get('/api/resume/profile', headers=headers)
+    assert response.status_code == 200, response.get_json()
+    profile = response.get_json()['profile']
+    assert profile['skills'] == ['Python']
+    assert 'match_features' not in profile
+    assert 'match_revision' not in profile
@@ -0,0 +1,63 @@
+import random
+import pytest
+from services.matcher import JobMatcher
+from services.skills import SkillBitsets, get_skill_scanner
+
+@pytest.mark.parametrize('text, expected', [
+    ('HTML5, CSS3 and ES6', {'html', 'css'}),
+    ('Python3', {'python'}),
+    ('Java8', {'java'}),
+    ('Vue3 / Angular2', {'vue', 'angular'}),
+    ('c++17', {'c++'}),
+    ('python3.11 and Node.js 18', {'python', 'node.js'}),
+])
+def test_versioned_skills_match(text, expected):
+    assert get_skill_scanner().scan(text) == expected
+
+@pytest.mark.parametrize('text, expected', [
+    ('google cloud', {'google cloud'}),
+    ('rust and gopher', {'rust'}),
+    ('r2d2', set()),
+    ('javascript', {'javascript'}),
+    ('react native', {'react native', 'react'}),
+])
+def test_skills_glued_to_letters_do_not_match(text, expected):
+    assert get_skill_scanner().scan(text) == expected
+
+def _set_overlap(weights, a, b):
+    """Weighted overlap of two skill ID sets, the plain way"""
+    return sum(weights[i] for i in set(a) & set(b))
+
+@pytest.mark.parametrize('n_skills', [5, 64, 66, 200])
+def test_bitset_overlap_matches_set_overlap(n_skills):
+    rng = random.Random(n_skills)
+    weights = [round(rng.uniform(0.5, 1.0), 2) for _ in range(n_skills)]
+    bitsets = SkillBitsets(weights)
+    rows = [[]] + [rng.sample(range(n_skills), rng.randint(1, min(n_skills, 12))) for _ in range(20)]
+    
+    packed = bitsets.pack_many(rows)
+    overlaps = bitsets.overlap_matrix(packed, packed)
+    for i, a in enumerate(rows):
+        assert (packed[i] == bitsets.pack(a)).all()
+        assert bitsets.ids(packed[i]) == sorted(a)
+        assert bitsets.weight(packed[i]) == pytest.approx(sum(weights[j] for j in a))
+        for j, b in enumerate(rows):
+            expected = _set_overlap(weights, a, b)
+            assert overlaps[i, j] == pytest.approx(expected)
+            assert bitsets.overlap(packed[i], packed[j]) == pytest.approx(expected)
+
+def test_skill_match_percentage_matches_set_overlap():
+    scanner = get_skill_scanner()
+    matcher = JobMatcher()
+    weights = {entry['skill'].lower(): entry['weight'] for entry in scanner.entries}
+    rng = random.Random(0)
+    for _ in range(50):
+        job_skills = rng.sample(sorted(weights), rng.randint(1, 8))
+        candidate_skills = rng.sample(sorted(weights), rng.randint(1, 8))
+        expected = _set_overlap(weights, job_skills, candidate_skills) / sum(weights[skill] for skill in job_skills) * 100
+        
+        percentage = matcher.calculate_skill_match_percentage(
+            [{'skill': skill} for skill in job_skills],
+            [{'skill': skill} for skill in candidate_skills]
+        )
+        assert percentage == pytest.approx(round(expected, 2), abs=0.01)
@@ -0,0 +1,55 @@
+import os
+from types import SimpleNamespace
+import pytest
+from config import Config
+from services import tfidf_model
+from services.tfidf_model import TfidfModel, get_text_model
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock and a fresh loaded-model cache"""
+    now = [1000.0]
+    monkeypatch.setattr(tfidf_model, 'time', SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(tfidf_model, '_loaded_model', None)
+    monkeypatch.setattr(tfidf_model, '_loaded_mtime', None)
+    monkeypatch.setattr(tfidf_model, '_checked_at', None)
+    monkeypatch.setattr(Config, 'TFIDF_CHECK_INTERVAL', 5)
+    return now
+
+def test_model_file_is_checked_at_most_once_per_interval(tmp_path, monkeypatch, clock):
+    path = str(tmp_path / 'tfidf_model.pkl')
+    TfidfModel.fit(['python developer', 'java engineer']).save(path)
+    
+    stats = []
+    getmtime = os.path.getmtime
+    monkeypatch.setattr(tfidf_model.os.path, 'getmtime', lambda p: stats.append(p) or getmtime(p))
+    
+    first = get_text_model(path)
+    for _ in range(100):
+        assert get_text_model(path) is first
+    assert len(stats) == 1
+    
+    # A rebuilt file is only picked up once the interval has passed
+    TfidfModel.fit(['golang developer', 'rust engineer']).save(path)
+    os.utime(path, (getmtime(path) + 10, getmtime(path) + 10))
+    assert get_text_model(path) is first
+    
+    clock[0] += 5
+    rebuilt = get_text_model(path)
+    assert rebuilt is not first
+    assert 'golang' in rebuilt.vectorizer.vocabulary_
+    assert len(stats) == 2
+
+def test_missing_model_file_is_not_checked_on_every_call(tmp_path, monkeypatch, clock):
+    path = str(tmp_path / 'tfidf_model.pkl')
+    stats = []
+    getmtime = os.path.getmtime
+    monkeypatch.setattr(tfidf_model.os.path, 'getmtime', lambda p: stats.append(p) or getmtime(p))
+    
+    assert get_text_model(path) is None
+    assert get_text_model(path) is None
+    assert len(stats) == 1
+    
+    TfidfModel.fit(['python developer', 'java engineer']).save(path)
+    clock[0] += 5
+    assert get_text_model(path) is not None
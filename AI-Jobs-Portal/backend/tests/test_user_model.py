@@ -0,0 +1,28 @@
+from models.user import UserModel
+
+def test_concurrent_profile_updates_keep_features_in_step(app, job_seeker_id):
+    user_model = UserModel(app.db)
+    other_writer = UserModel(app.db)
+    find_one = user_model.job_seekers.find_one
+    raced = []
+    
+    def find_one_then_race(*args, **kwargs):
+        profile = find_one(*args, **kwargs)
+        if not raced:
+            # A parse job writes experience after the skills update read the profile
+            raced.append(other_writer.update_user(job_seeker_id, 'job_seeker', {'experience': [{'duration': '6 years'}]}))
+        return profile
+    user_model.job_seekers = type('RacingCollection', (), {
+        'find_one': staticmethod(find_one_then_race),
+        'update_one': staticmethod(app.db.job_seekers.update_one)
+    })()
+    
+    assert user_model.update_user(job_seeker_id, 'job_seeker', {'skills': ['Python']})
+    
+    profile = other_writer.get_job_seeker_profile(job_seeker_id)
+    assert profile['experience'] == [{'duration': '6 years'}]
+    features = profile['match_features']
+    assert features['updated_at'] == profile['updated_at']
+    assert [skill['skill'] for skill in features['skills']] == ['python']
+    # Built from the experience the other writer stored, not the snapshot read before it
+    assert features['experience_months'] == 72
@@ -0,0 +1,128 @@
+import importlib
+import os
+import sys
+import threading
+import time
+from config import Config
+
+# NLTK data the app needs, by resource path inside an nltk_data directory
+NLTK_RESOURCES = {
+    'stopwords': 'corpora/stopwords'
+}
+
+# Seconds spent importing each module, in the order they were loaded
+IMPORT_TIMES = {}
+
+_import_lock = threading.RLock()
+_stop_words = None
+
+def timed_import(name):
+    """Import a module, recording how long the first import took"""
+    already_loaded = name in sys.modules
+    started = time.perf_counter()
+    module = importlib.import_module(name)
+    if not already_loaded:
+        IMPORT_TIMES.setdefault(name, time.perf_counter() - started)
+    return module
+
+class LazyModule:
+    """Stand-in for a heavy module that imports it on first attribute access"""
+    
+    def __init__(self, name, setup=None):
+        self._name = name
+        self._setup = setup
+        self._module = None
+    
+    def _load(self):
+        if self._module is None:
+            with _import_lock:
+                if self._module is None:
+                    module = timed_import(self._name)
+                    if self._setup:
+                        self._setup(module)
+                    self._module = module
+        return self._module
+    
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+    
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module '{self._name}' ({state})>"
+
+def lazy_import(name, setup=None):
+    """Import a module now in eager startup mode, or on first use in lazy mode
+    
+    setup is called with the real module once it has been imported.
+    """
+    if Config.STARTUP_MODE == 'eager':
+        module = timed_import(name)
+        if setup:
+            setup(module)
+        return module
+    return LazyModule(name, setup)
+
+def nltk_data_dirs():
+    """Directories searched for NLTK data, the configured local path first"""
+    dirs = [Config.NLTK_DATA_PATH]
+    dirs += [path for path in os.environ.get('NLTK_DATA', '').split(os.pathsep) if path]
+    dirs += [
+        os.path.expanduser('~/nltk_data'),
+        os.path.join(sys.prefix, 'nltk_data'),
+        os.path.join(sys.prefix, 'share', 'nltk_data'),
+        os.path.join(sys.prefix, 'lib', 'nltk_data'),
+        '/usr/share/nltk_data',
+        '/usr/local/share/nltk_data',
+        '/usr/lib/nltk_data',
+        '/usr/local/lib/nltk_data'
+    ]
+    return dirs
+
+def missing_nltk_data(names=None):
+    """Names of required NLTK resources not found on disk (does not import nltk)"""
+    missing = []
+    for name in names or NLTK_RESOURCES:
+        resource = NLTK_RESOURCES[name]
+        found = any(
+            os.path.exists(os.path.join(path, resource)) or os.path.exists(os.path.join(path, resource + '.zip'))
+            for path in nltk_data_dirs()
+        )
+        if not found:
+            missing.append(name)
+    return missing
+
+def check_nltk_data(names=None):
+    """Fail fast when NLTK data is missing, since the app never downloads it"""
+    missing = missing_nltk_data(names)
+    if missing:
+        raise RuntimeError(
+            f"NLTK data not found: {', '.join(missing)}. Install it with "
+            f"`python -m nltk.downloader -d {Config.NLTK_DATA_PATH} {' '.join(missing)}`"
+        )
+
+def _configure_nltk(module):
+    """Point NLTK at the local data directories before anything loads from it"""
+    for path in reversed(nltk_data_dirs()):
+        if path not in module.data.path:
+            module.data.path.insert(0, path)
+
+nltk = lazy_import('nltk', setup=_configure_nltk)
+
+def get_stop_words():
+    """English stopwords from the local NLTK data, loaded once"""
+    global _stop_words
+    if _stop_words is None:
+        check_nltk_data(['stopwords'])
+        _stop_words = set(nltk.corpus.stopwords.words('english'))
+    return _stop_words
+
+def preload():
+    """Load NLTK data up front so the first request does not pay for it"""
+    get_stop_words()
+
+def import_report():
+    """Print how long each heavy module took to import"""
+    total = sum(IMPORT_TIMES.values())
+    print(f"Startup imports ({Config.STARTUP_MODE} mode): {total:.2f}s")
+    for name, seconds in sorted(IMPORT_TIMES.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {name:<40} {seconds:.3f}s")
@@ -0,0 +1,47 @@
+import hashlib
+from tempfile import SpooledTemporaryFile
+from flask import Request
+from config import Config
+
+# Endpoints taking whole archives, allowed past MAX_CONTENT_LENGTH
+ARCHIVE_ENDPOINTS = {'admin.ingest_resumes'}
+
+class HashingSpooledFile(SpooledTemporaryFile):
+    """Upload buffer kept in memory up to a threshold, hashing bytes as they are written"""
+    
+    def __init__(self, max_size=None):
+        super().__init__(max_size=max_size or Config.UPLOAD_SPOOL_THRESHOLD, mode='w+b')
+        self.sha256 = hashlib.sha256()
+    
+    def write(self, data):
+        self.sha256.update(data)
+        return super().write(data)
+    
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+class UploadRequest(Request):
+    """Request whose file uploads stay in memory below UPLOAD_SPOOL_THRESHOLD"""
+    
+    @property
+    def max_content_length(self):
+        """MAX_CONTENT_LENGTH, raised to BULK_INGEST_MAX_UPLOAD for archive endpoints"""
+        if self.endpoint in ARCHIVE_ENDPOINTS:
+            return Config.BULK_INGEST_MAX_UPLOAD
+        return super().max_content_length
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return HashingSpooledFile()
+
+def upload_sha256(stream, chunk_size=65536):
+    """SHA-256 hex digest of an upload stream, leaving it rewound for reading"""
+    digest = getattr(stream, 'sha256', None)
+    if digest is None:
+        # Not buffered by UploadRequest, so hash it in one extra pass
+        digest = hashlib.sha256()
+        stream.seek(0)
+        for block in iter(lambda: stream.read(chunk_size), b''):
+            digest.update(block)
+    stream.seek(0)
+    return digest.hexdigest()
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useAuth } from '../contexts/AuthContext';
 import { resumeAPI } from '../services/api';
+import { toast } from 'react-toastify';
 import styled from 'styled-components';
 import { 
   FaUser, 
@@ -14,6 +15,11 @@ import {
   FaEdit
 } from 'react-icons/fa';
 
+// Parse job polling: back off from 1s to 10s between polls, give up after 2 minutes
+const PARSE_POLL_INITIAL_DELAY = 1000;
+const PARSE_POLL_MAX_DELAY = 10000;
+const PARSE_POLL_TIMEOUT = 120000;
+
 const ProfileContainer = styled.div`
   max-width: 800px;
   margin: 0 auto;
@@ -319,8 +325,23 @@ const Profile = () => {
       setSaving(true);
       const response = await resumeAPI.uploadResume(file);
       
-      if (response.data.parsed_data) {
-        const parsedData = response.data.parsed_data;
+      // Parsing runs in the background, poll until the job finishes or the deadline passes
+      let job = response.data.job;
+      let delay = PARSE_POLL_INITIAL_DELAY;
+      const deadline = Date.now() + PARSE_POLL_TIMEOUT;
+      while ((job.status === 'pending' || job.status === 'parsing') && Date.now() + delay <= deadline) {
+        await new Promise(resolve => setTimeout(resolve, delay));
+        job = (await resumeAPI.getParseJob(job.job_id)).data.job;
+        delay = Math.min(delay * 2, PARSE_POLL_MAX_DELAY);
+      }
+      
+      if (job.status === 'pending' || job.status === 'parsing') {
+        toast.error('Your resume is still being processed. Check your profile again in a few minutes.');
+      } else if (job.status === 'failed') {
+        console.error('Error parsing resume:', job.error);
+        toast.error(job.error || 'Failed to parse resume');
+      } else if (job.parsed_data) {
+        const parsedData = job.parsed_data;
         setProfile({
           ...profile,
           first_name: parsedData.name?.split(' ')[0] || profile.first_name,
@@ -333,6 +354,7 @@ const Profile = () => {
       }
     } catch (error) {
       console.error('Error uploading resume:', error);
+      toast.error(error.response?.data?.error || 'Failed to upload resume');
     } finally {
       setSaving(false);
     }
@@ -94,6 +94,9 @@ export const resumeAPI = {
     });
   },
   
+  getParseJob: (jobId) =>
+    api.get(`/resume/jobs/${jobId}`),
+  
   parseResumeText: (resumeText) =>
     api.post('/resume/parse-text', { resume_text: resumeText }),
   